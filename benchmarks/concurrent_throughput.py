@@ -0,0 +1,136 @@
+"""
+A benchmark of the throughput of a ConcurrentLinkedList shared by several threads, against the
+coarse-grained baseline of a DoubleLinkedList with every call wrapped in one global lock.
+
+Half of the threads work at the head of the linked list and half at the tail (each alternating
+between inserting and removing), and optionally some threads insert at random indices, which
+walks the linked list. The number of operations completed per second is reported for each
+implementation.
+
+Usage (from the root of the repository):
+    PYTHONPATH=src python benchmarks/concurrent_throughput.py --threads 4 --seconds 2
+"""
+
+import argparse
+import random
+import threading
+import time
+from typing import Callable, List
+
+from linked_list import ConcurrentLinkedList, DoubleLinkedList
+
+
+class CoarseLockedLinkedList:  # pylint: disable=too-few-public-methods
+    """
+    The baseline: a DoubleLinkedList whose every call is made while holding one global lock.
+    """
+
+    def __init__(self, *args) -> None:
+        self.linked_list = DoubleLinkedList(*args)
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Callable:
+        method = getattr(self.linked_list, name)
+
+        def locked(*args, **kwargs):
+            with self.lock:
+                return method(*args, **kwargs)
+
+        return locked
+
+
+def worker(
+    linked_list, role: str, deadline: float, counts: List[int], slot: int
+) -> None:
+    """
+    Perform operations of the given role on the linked list until the deadline.
+
+    Args:
+        linked_list: The shared linked list.
+        role: "head", "tail" or "index".
+        deadline: The time (according to time.perf_counter) at which to stop.
+        counts: The number of operations completed by each worker.
+        slot: The index of this worker in counts.
+
+    Returns:
+        None
+    """
+    rng = random.Random(slot)
+    operations: int = 0
+    while time.perf_counter() < deadline:
+        for _ in range(100):  # check the clock only every so often
+            if role == "head":
+                linked_list.insert_at_head(operations)
+                linked_list.remove_at_head()
+            elif role == "tail":
+                linked_list.insert_at_tail(operations)
+                linked_list.remove_at_tail()
+            else:
+                linked_list.insert_at_index(operations, rng.randrange(64))
+                linked_list.remove_at_index(rng.randrange(64))
+            operations += 2
+    counts[slot] = operations
+
+
+def run(
+    make_linked_list: Callable, threads: int, index_threads: int, seconds: float
+) -> float:
+    """
+    Run the workers on a new linked list, and measure their throughput.
+
+    Args:
+        make_linked_list: A function that creates the linked list to share.
+        threads: The number of threads working at the ends of the linked list.
+        index_threads: The number of threads inserting and removing at random indices.
+        seconds: How long to run the workers for.
+
+    Returns:
+        The number of operations completed per second, over all threads.
+    """
+    linked_list = make_linked_list(*range(1000))
+    roles = ["head", "tail"] * (threads // 2) + ["index"] * index_threads
+    counts = [0] * len(roles)
+    deadline = time.perf_counter() + seconds
+    workers = [
+        threading.Thread(
+            target=worker, args=(linked_list, role, deadline, counts, slot)
+        )
+        for slot, role in enumerate(roles)
+    ]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """
+    Parse the command line arguments, and run the benchmark for both implementations.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--threads", type=int, default=4, help="threads at the ends")
+    parser.add_argument(
+        "--index-threads", type=int, default=0, help="threads at random indices"
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=2.0, help="duration of each run"
+    )
+    args = parser.parse_args()
+
+    for name, make_linked_list in (
+        ("coarse lock (DoubleLinkedList)", CoarseLockedLinkedList),
+        ("fine-grained (ConcurrentLinkedList)", ConcurrentLinkedList),
+    ):
+        throughput = run(
+            make_linked_list, args.threads, args.index_threads, args.seconds
+        )
+        print(f"{name:>36}: {throughput:>12,.0f} operations/second")
+
+
+if __name__ == "__main__":
+    main()
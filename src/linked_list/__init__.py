@@ -10,10 +10,60 @@ Classes:
     SingleLinkedList: A singly linked list, where each node has a reference to the next node.
     DoubleLinkedList: A doubly linked list, where each node has a reference to the next and previous
         nodes.
+    ArrayLinkedList: A doubly linked list whose links are stored in integer buffers instead of
+        node objects.
+    UnrolledLinkedList: A linked list where each node stores a small block of elements.
+    SkipLinkedList: A linked list with a skip list index layer for O(log n) positional access.
+    IndexedLinkedList: A doubly linked list with a value index for O(1) membership tests.
+    SortedLinkedList: A linked list kept in ascending order, with O(log n) ordered insertion.
+    ConcurrentLinkedList: A thread-safe doubly linked list with a lock per node.
+    PersistentLinkedList: A singly linked list with immutable, shared nodes and O(1) snapshots.
+    MappedLinkedList: A doubly linked list stored in fixed-size records of a memory-mapped file.
+    SingleLinkedListCursor: A cursor for O(1) edits at a position of a SingleLinkedList.
+    DoubleLinkedListCursor: A cursor for O(1) edits at a position of a DoubleLinkedList.
+    LinkedListView: A lazy, writable view over a slice of a linked list.
+    LinkedCache: A bounded LRU/LFU cache built on a dict and DoubleLinkedList objects.
+    LinkedQueue: A thread-safe, bounded, blocking FIFO queue built on a DoubleLinkedList.
+    LinkedDeque: A thread-safe, bounded, blocking double-ended queue built on a DoubleLinkedList.
+    AsyncLinkedQueue: A bounded FIFO queue for asyncio, built on a DoubleLinkedList.
+    AsyncLinkedDeque: A bounded double-ended queue for asyncio, built on a DoubleLinkedList.
 """
 
 from .abstract import LinkedList
 from .impl.single import SingleLinkedList
 from .impl.double import DoubleLinkedList
+from .impl.array_backed import ArrayLinkedList
+from .impl.unrolled import UnrolledLinkedList
+from .impl.skip import SkipLinkedList
+from .impl.indexed import IndexedLinkedList
+from .impl.sorted import SortedLinkedList
+from .impl.concurrent import ConcurrentLinkedList
+from .impl.persistent import PersistentLinkedList
+from .impl.mapped import MappedLinkedList
+from .cursor import SingleLinkedListCursor, DoubleLinkedListCursor
+from .view import LinkedListView
+from .cache import LinkedCache
+from .blocking import LinkedQueue, LinkedDeque
+from .async_queue import AsyncLinkedQueue, AsyncLinkedDeque
 
-__all__ = ["LinkedList", "SingleLinkedList", "DoubleLinkedList"]
+__all__ = [
+    "LinkedList",
+    "SingleLinkedList",
+    "DoubleLinkedList",
+    "ArrayLinkedList",
+    "UnrolledLinkedList",
+    "SkipLinkedList",
+    "IndexedLinkedList",
+    "SortedLinkedList",
+    "ConcurrentLinkedList",
+    "PersistentLinkedList",
+    "MappedLinkedList",
+    "SingleLinkedListCursor",
+    "DoubleLinkedListCursor",
+    "LinkedListView",
+    "LinkedCache",
+    "LinkedQueue",
+    "LinkedDeque",
+    "AsyncLinkedQueue",
+    "AsyncLinkedDeque",
+]
@@ -9,13 +9,18 @@ lists and doubly linked lists.
 """
 
 import abc
-from typing import Union, List
+import asyncio
+from typing import AsyncIterator, Dict, Union, List, Iterable, Tuple
 
 from node import (
     Node,
     SingleLinkNode,
     DoubleLinkNode,
 )  # this is the Node class from the node.py module we created
+from linked_list.view import LinkedListView
+
+# the number of nodes visited between two yields to the event loop during async iteration
+ASYNC_CHUNK_SIZE: int = 1024
 
 
 class LinkedList(abc.ABC):
@@ -27,15 +32,258 @@ class LinkedList(abc.ABC):
     """
 
     def __init__(self, *args) -> None:
-        self.head: Union[None, SingleLinkNode, DoubleLinkNode] = (
+        self._head: Union[None, SingleLinkNode, DoubleLinkNode] = (
             None  # all linked lists have a head node
         )
-        for data in args:
-            self.insert_at_tail(data)
+        # the number of nodes is tracked by every mutator so that size is O(1); None means the
+        # count is unknown (e.g., the head was reassigned directly) and must be recounted
+        self._size: Union[None, int] = 0
+        # incremented by every structural modification (i.e., one that links or unlinks nodes),
+        # so that anything remembering positions in the linked list can tell when they are stale
+        self._version: int = 0
+        # the (version, index, node) of the last node located by index, if any
+        self._cached_position: Union[None, Tuple[int, int, Node]] = None
+        self.extend(args)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[object]) -> "LinkedList":
+        """
+        Create a new linked list containing the data from the given iterable, in order.
+
+        Args:
+            iterable: The data to store in the nodes of the new linked list.
+
+        Returns:
+            A new linked list of this type.
+        """
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def copy(self) -> "LinkedList":
+        """
+        Get a shallow copy of the linked list, i.e., a new linked list of the same type holding
+        the same data, in O(n). The copy is restored from the state of the linked list, as when
+        unpickling, so any settings kept in the state (e.g., the capacity of an
+        UnrolledLinkedList) are copied too. Subclasses may override this to share the nodes
+        instead.
+
+        Returns:
+            A new linked list of the same type holding the same data.
+        """
+        duplicate: LinkedList = type(self)()
+        duplicate.__setstate__(self.__getstate__())
+        return duplicate
+
+    def __copy__(self) -> "LinkedList":
+        """
+        Get a shallow copy of the linked list, as copy does. This allows for the use of copy.copy.
+
+        Returns:
+            A new linked list of the same type holding the same data.
+        """
+        return self.copy()
+
+    def __reduce__(self) -> Tuple[type, tuple, Dict[str, object]]:
+        """
+        Support pickling (and copy.deepcopy) by rebuilding the linked list from its state, rather
+        than pickling its nodes: a chain of nodes is pickled recursively, one nested call per node,
+        which fails for long linked lists and stores the links along with the data.
+
+        Returns:
+            The type of the linked list, no arguments to create an empty one, and its state.
+        """
+        return type(self), (), self.__getstate__()
+
+    def __getstate__(self) -> Dict[str, object]:
+        """
+        Get the state of the linked list to pickle: the data of its nodes, in order, as a single
+        flat list.
+
+        Returns:
+            The state of the linked list.
+        """
+        return {"data": list(self.values())}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """
+        Restore the state of an unpickled (empty) linked list, by inserting the data in a single
+        pass.
+
+        Args:
+            state: The state of the linked list, as returned by __getstate__.
+
+        Returns:
+            None
+        """
+        self.extend(state["data"])
+
+    @property
+    def head(self) -> Union[None, SingleLinkNode, DoubleLinkNode]:
+        """
+        Get the head node of the linked list.
+
+        Returns:
+            The head node of the linked list, or None if the linked list is empty.
+        """
+        return self._head
+
+    @head.setter
+    def head(self, node: Union[None, SingleLinkNode, DoubleLinkNode]) -> None:
+        """
+        Set the head node of the linked list directly. Since the nodes may have been linked
+        together outside the linked list's methods, the stored size is discarded and will be
+        recounted the next time it is requested.
+
+        Args:
+            node: The node to use as the new head of the linked list.
+
+        Returns:
+            None
+        """
+        self._set_head(node)
+
+    def _set_head(self, node: Union[None, SingleLinkNode, DoubleLinkNode]) -> None:
+        """
+        Make the given node the head of the linked list, and discard the stored size, as the head
+        setter does. Subclasses that keep more bookkeeping override this, rather than the setter,
+        to discard it as well.
+
+        Args:
+            node: The node to use as the new head of the linked list.
+
+        Returns:
+            None
+        """
+        self._head = node
+        self._size = None
+        self._version += 1
 
     def __iter__(self) -> iter:
-        # TODO: ADD YOUR CODE HERE
-        pass
+        curr: Union[None, SingleLinkNode, DoubleLinkNode] = self._head
+        while curr is not None:
+            yield curr
+            curr = curr.next
+
+    def values(self) -> iter:
+        """
+        Iterate over the data stored in each node of the linked list, in order.
+
+        Returns:
+            An iterator over the data stored in the linked list.
+        """
+        return (node.data for node in self)
+
+    def __aiter__(self) -> AsyncIterator[Node]:
+        """
+        Iterate over the nodes of the linked list in a coroutine (with async for), yielding to
+        the event loop every ASYNC_CHUNK_SIZE nodes so that a long traversal does not block it.
+
+        Returns:
+            An asynchronous iterator over the nodes of the linked list.
+        """
+        return self.aiter_nodes()
+
+    async def aiter_nodes(
+        self, chunk_size: int = ASYNC_CHUNK_SIZE
+    ) -> AsyncIterator[Node]:
+        """
+        Iterate over the nodes of the linked list in a coroutine, yielding to the event loop every
+        chunk_size nodes. Other tasks may run while the iteration is suspended, either at one of
+        these yields or while the body of the async for awaits; if one of them structurally
+        modifies the linked list, a RuntimeError is raised as soon as the iteration resumes (the
+        nodes it would follow may have been unlinked).
+
+        Args:
+            chunk_size: The number of nodes to visit between two yields to the event loop.
+
+        Returns:
+            An asynchronous iterator over the nodes of the linked list.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+        # getting the iterator may replace nodes shared with a copy, so it comes first
+        nodes: iter = iter(self)
+        version: int = self._version
+        for count, node in enumerate(nodes, start=1):
+            yield node  # the body of the async for may await, and let other tasks run
+            if count % chunk_size == 0:
+                await asyncio.sleep(0)
+            if self._version != version:
+                raise RuntimeError("Linked list was modified during iteration.")
+
+    def __len__(self) -> int:
+        """
+        Get the number of nodes in the linked list. This allows for the use of the len function.
+
+        Returns:
+            The number of nodes in the linked list.
+        """
+        return self.size
+
+    def _node_at(self, index: int) -> Union[None, Node]:
+        """
+        Get the node at the given non-negative index in the linked list, walking forward. The
+        last node located by index is remembered (until the next structural modification), and
+        the walk starts from it rather than the head whenever it is not past the given index, so
+        sequential access (e.g., linked_list[i] for i in range(n)) is amortized O(1) per node.
+        Subclasses may override this to locate the node more efficiently.
+
+        Args:
+            index: The index of the node to get.
+
+        Returns:
+            The node at the given index, or None if the index is out of bounds.
+        """
+        if index >= self.size:
+            return None
+
+        position, node = 0, self._head
+        cached = self._cached_position
+        if cached is not None and cached[0] == self._version and cached[1] <= index:
+            _, position, node = cached
+        for _ in range(index - position):
+            node = node.next
+        self._cached_position = (self._version, index, node)
+        return node
+
+    def _ascending_indices(self, key: slice) -> range:
+        """
+        Get the indices selected by the given slice of the linked list, in ascending order (i.e.,
+        a slice with a negative step selects the same indices, but in reverse).
+
+        Args:
+            key: The slice of the linked list.
+
+        Returns:
+            The indices selected by the slice, in ascending order.
+        """
+        indices: range = range(*key.indices(self.size))
+        return indices if indices.step > 0 else indices[::-1]
+
+    def _slice_nodes(self, key: slice) -> List[Node]:
+        """
+        Get the nodes selected by the given slice of the linked list, in the order of the slice.
+        The first node is located once, and the rest are reached by following the next links, so
+        the nodes are collected in a single traversal.
+
+        Args:
+            key: The slice of the linked list.
+
+        Returns:
+            The nodes selected by the slice.
+        """
+        indices: range = self._ascending_indices(key)
+        if not indices:
+            return []
+
+        node = self._node_at(indices.start)
+        nodes: List[Node] = [node]
+        for _ in range(len(indices) - 1):
+            for _ in range(indices.step):
+                node = node.next
+            nodes.append(node)
+        return nodes if key.step is None or key.step > 0 else nodes[::-1]
 
     def __getitem__(self, key) -> Union[Node, List[Node]]:
         """
@@ -48,24 +296,20 @@ class LinkedList(abc.ABC):
             The node at the given index in the linked list.
         """
         if isinstance(key, slice):
-            indices = range(*key.indices(self.size))
-            return [self[idx] for idx in indices]
+            return self._slice_nodes(key)
 
         if key < 0:
             raise IndexError("Index must be non-negative.")
 
-        for idx, node in enumerate(self):
-            if idx == key:
-                if isinstance(node, Node):
-                    return node
-                raise TypeError(
-                    "Node is not of type Node; something has gone terribly wrong!"
-                )
-
-        # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
-        raise IndexError(
-            f"Index {key} does not exist for {type(self).__name__} of size {self.size}."
-        )
+        node = self._node_at(key)
+        if node is None:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {key} does not exist for {type(self).__name__} of size {self.size}."
+            )
+        if isinstance(node, Node):
+            return node
+        raise TypeError("Node is not of type Node; something has gone terribly wrong!")
 
     def __setitem__(self, key, value) -> None:
         """
@@ -81,25 +325,34 @@ class LinkedList(abc.ABC):
             None
         """
         if isinstance(key, slice):
-            indices = range(*key.indices(self.size))
-            for value_idx, lst_idx in enumerate(
-                indices
-            ):  # this is a recursive call to __setitem__
-                self[lst_idx] = value[value_idx]
+            for value_idx, node in enumerate(self._slice_nodes(key)):
+                node.data = value[value_idx]
             return
 
         if key < 0:
             raise IndexError("Index must be non-negative.")
 
-        for idx, node in enumerate(self):
-            if idx == key:
-                node.data = value
-                return
+        node = self._node_at(key)
+        if node is None:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {key} does not exist for {type(self).__name__} of size {self.size}."
+            )
+        node.data = value
 
-        # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
-        raise IndexError(
-            f"Index {key} does not exist for {type(self).__name__} of size {self.size}."
-        )
+    def _set_data(self, node: Node, value: object) -> None:
+        """
+        Set the data of the given node of the linked list, e.g., for a cursor. Subclasses that keep
+        track of the data (e.g., in an index) override this to stay up to date.
+
+        Args:
+            node: The node whose data to set.
+            value: The data to set the node to.
+
+        Returns:
+            None
+        """
+        node.data = value
 
     def __delitem__(self, key) -> None:
         """
@@ -109,14 +362,44 @@ class LinkedList(abc.ABC):
         For example, if linked_list is a SingleLinkedList object, then del linked_list[0] will
         delete the node at index 0, rather than having to call linked_list.remove_at_index(0).
 
+        A slice of nodes may also be deleted, e.g., del linked_list[1:5:2]. By default, the nodes
+        are removed one at a time from the back of the slice; subclasses may override this to
+        unlink them in a single pass.
+
         Args:
-            key: The index of the node to delete.
+            key: The index (or slice) of the node(s) to delete.
 
         Returns:
             None
         """
+        if isinstance(key, slice):
+            for index in reversed(self._ascending_indices(key)):
+                self.remove_at_index(index=index)
+            return
         self.remove_at_index(index=key)
 
+    def view(
+        self,
+        start: Union[None, int] = None,
+        stop: Union[None, int] = None,
+        step: Union[None, int] = None,
+    ) -> LinkedListView:
+        """
+        Get a lazy view over the nodes selected by the slice with the given start, stop and step.
+        Unlike slicing, no list of nodes is built; the view follows the links of the linked list
+        each time it is iterated over. The view can be indexed, sliced (giving a nested view) and
+        assigned to, and raises a RuntimeError once the linked list is structurally modified.
+
+        Args:
+            start: The start of the slice.
+            stop: The stop of the slice.
+            step: The step of the slice.
+
+        Returns:
+            A view over the selected nodes.
+        """
+        return LinkedListView(self, range(*slice(start, stop, step).indices(self.size)))
+
     def __str__(self) -> str:
         """
         The string representation of the linked list is the string representation of the data in
@@ -125,7 +408,7 @@ class LinkedList(abc.ABC):
         Returns:
             The string representation of the linked list.
         """
-        return str([node.data for node in self])
+        return str(list(self.values()))
 
     def __repr__(self) -> str:
         """
@@ -149,8 +432,9 @@ class LinkedList(abc.ABC):
 
         """
         if isinstance(other, LinkedList) and self.size == other.size:
-            for node_1, node_2 in zip(self, other):
-                if not constraint(node_1, node_2):  # if constraint is not satisfied
+            # the data are compared directly, as nodes compare by their data
+            for data_1, data_2 in zip(self.values(), other.values()):
+                if not constraint(data_1, data_2):  # if constraint is not satisfied
                     return False  # a pair of nodes satisfy the binary relation
             return True  # the given func was never True for any pair of nodes
         return False  # default to False if other is not a SingleLinkedList
@@ -237,14 +521,68 @@ class LinkedList(abc.ABC):
         """
         return self.__relation(other, lambda node_1, node_2: node_1 >= node_2)
 
+    def __contains__(self, value: object) -> bool:
+        """
+        Check if any node in the linked list stores data equal to the given value. This allows for
+        the use of the in keyword, e.g., 5 in linked_list.
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            True if the value is in the linked list, False otherwise.
+        """
+        return any(data == value for data in self.values())
+
+    def index(self, value: object) -> int:
+        """
+        Get the index of the first node in the linked list that stores data equal to the given
+        value.
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            The index of the first node storing the value.
+        """
+        for idx, data in enumerate(self.values()):
+            if data == value:
+                return idx
+        raise ValueError(f"{value!r} is not in {type(self).__name__}.")
+
+    def count(self, value: object) -> int:
+        """
+        Count the nodes in the linked list that store data equal to the given value.
+
+        Args:
+            value: The value to count.
+
+        Returns:
+            The number of nodes storing the value.
+        """
+        return sum(1 for data in self.values() if data == value)
+
+    def remove(self, value: object) -> None:
+        """
+        Remove the first node in the linked list that stores data equal to the given value.
+
+        Args:
+            value: The value to remove.
+
+        Returns:
+            None
+        """
+        self.remove_at_index(self.index(value))
+
     def __hash__(self) -> int:
         """
-        The hash of the linked list is the hash of the tuple of the nodes.
+        The hash of the linked list is the hash of the tuple of the data of its nodes (which is
+        also the hash of the tuple of the nodes, as nodes hash as their data).
 
         Returns:
             The hash of the linked list.
         """
-        return hash(tuple(self))
+        return hash(tuple(self.values()))
 
     @property
     def size(self) -> int:
@@ -254,9 +592,36 @@ class LinkedList(abc.ABC):
         Returns:
             The number of nodes in the linked list.
         """
+        if self._size is None:  # the count is unknown, so walk the chain once
+            self._recount()
+        return self._size
 
-        # TODO: ADD YOUR CODE HERE
-        pass
+    def _recount(self) -> None:
+        """
+        Walk the chain of nodes to recover the bookkeeping (e.g., the size) that was discarded when
+        the head was assigned directly.
+
+        Returns:
+            None
+        """
+        self._size = sum(1 for _ in self)
+
+    def _adjust_size(self, delta: int) -> None:
+        """
+        Record a structural modification of the linked list, and adjust the stored number of
+        nodes accordingly. If the size is currently unknown, it stays unknown until it is recounted
+        by the size property. Every method that links or unlinks nodes must call this.
+
+        Args:
+            delta: The change in the number of nodes (e.g., 1 for an insertion, -1 for a removal,
+                or 0 if the nodes were only relinked).
+
+        Returns:
+            None
+        """
+        self._version += 1
+        if self._size is not None:
+            self._size += delta
 
     @property
     def is_empty(self) -> bool:
@@ -266,7 +631,21 @@ class LinkedList(abc.ABC):
         Returns:
             True if the linked list is empty, False otherwise.
         """
-        return self.head is None
+        return self._head is None
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new node at the tail of the linked list for each item in the given iterable,
+        preserving their order. Subclasses may override this to link the nodes in a single pass.
+
+        Args:
+            iterable: The data to store in the new nodes to insert.
+
+        Returns:
+            None
+        """
+        for data in iterable:
+            self.insert_at_tail(data)
 
     @abc.abstractmethod
     def insert_at_tail(self, data: object) -> None:
@@ -0,0 +1,280 @@
+"""
+This module contains bounded queues for asyncio, built on a DoubleLinkedList. They follow the
+interface of asyncio.Queue (and raise its QueueEmpty and QueueFull exceptions): put and get are
+coroutines that wait while the queue is full or empty, and the nowait variants raise instead.
+
+The tasks waiting on a queue are kept in line in DoubleLinkedList objects too. Each waiting task
+holds the node of its own future, so a task that is cancelled while waiting leaves the line in
+O(1), however many other tasks are waiting.
+"""
+
+import asyncio
+
+# these are the custom classes that we will use in the queues
+from node.impl import DoubleLinkNode
+from linked_list.impl.double import DoubleLinkedList
+
+
+class AsyncLinkedQueue:
+    """
+    A first-in, first-out queue for the tasks of an event loop. The items are kept in a
+    DoubleLinkedList, so putting an item at the tail and getting one from the head are O(1).
+
+    The queue is not thread-safe; like asyncio.Queue, it must only be used from the thread running
+    its event loop.
+
+    Attributes:
+        maxsize: The maximum number of items in the queue, or 0 (or less) for no limit.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize: int = maxsize
+        self._items: DoubleLinkedList = DoubleLinkedList()
+        # the futures of the tasks waiting to get an item, to put an item, or for all the items
+        # to be processed, in the order they started waiting
+        self._getters: DoubleLinkedList = DoubleLinkedList()
+        self._putters: DoubleLinkedList = DoubleLinkedList()
+        self._joiners: DoubleLinkedList = DoubleLinkedList()
+        self._unfinished_tasks: int = 0
+
+    def qsize(self) -> int:
+        """
+        Get the number of items in the queue.
+
+        Returns:
+            The number of items in the queue.
+        """
+        return self._items.size
+
+    def empty(self) -> bool:
+        """
+        Check if the queue is empty.
+
+        Returns:
+            True if the queue is empty, False otherwise.
+        """
+        return self._items.is_empty
+
+    def full(self) -> bool:
+        """
+        Check if the queue is full.
+
+        Returns:
+            True if the queue is full, False otherwise.
+        """
+        return 0 < self.maxsize <= self._items.size
+
+    @staticmethod
+    def _wakeup_next(waiters: DoubleLinkedList) -> None:
+        """
+        Wake up the first task in the given line that is still waiting, and remove it (and any
+        task before it that stopped waiting) from the line.
+
+        Args:
+            waiters: The futures of the waiting tasks.
+
+        Returns:
+            None
+        """
+        while not waiters.is_empty:
+            waiter: asyncio.Future = waiters.head.data
+            waiters.remove_at_head()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait_in_line(self, waiters: DoubleLinkedList, ready) -> None:
+        """
+        Wait at the end of the given line until the given predicate is true. If the task is
+        cancelled while waiting, it leaves the line (unless a wake-up already skipped past it); if
+        it was cancelled just after being woken up, the wake-up is passed on to the next task in
+        line.
+
+        Args:
+            waiters: The futures of the tasks waiting in the same line.
+            ready: A function of no arguments that tells if the wait is over.
+
+        Returns:
+            None
+        """
+        while not ready():
+            waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+            node: DoubleLinkNode = waiters.insert_at_tail(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()  # in case it is not done yet
+                if waiter.cancelled():
+                    try:
+                        waiters.remove_node(node)
+                    except ValueError:  # already skipped (and removed) by _wakeup_next
+                        pass
+                elif (
+                    ready()
+                ):  # woken up (and removed from the line) but not going to proceed
+                    self._wakeup_next(waiters)
+                raise
+
+    def _after_put(self) -> None:
+        """
+        Account for an item that was just put, and wake up a task waiting to get one.
+
+        Returns:
+            None
+        """
+        self._unfinished_tasks += 1
+        self._wakeup_next(self._getters)
+
+    def _after_get(self) -> None:
+        """
+        Wake up a task waiting to put an item, now that an item was just taken.
+
+        Returns:
+            None
+        """
+        self._wakeup_next(self._putters)
+
+    def put_nowait(self, item: object) -> None:
+        """
+        Put an item at the tail of the queue without waiting; raise asyncio.QueueFull if it is
+        full.
+
+        Args:
+            item: The item to put.
+
+        Returns:
+            None
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.insert_at_tail(item)
+        self._after_put()
+
+    async def put(self, item: object) -> None:
+        """
+        Put an item at the tail of the queue, waiting until a slot is free if it is full.
+
+        Args:
+            item: The item to put.
+
+        Returns:
+            None
+        """
+        await self._wait_in_line(self._putters, lambda: not self.full())
+        self.put_nowait(item)
+
+    def get_nowait(self) -> object:
+        """
+        Remove and return the item at the head of the queue without waiting; raise
+        asyncio.QueueEmpty if it is empty.
+
+        Returns:
+            The item at the head of the queue.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item: object = self._items.head.data
+        self._items.remove_at_head()
+        self._after_get()
+        return item
+
+    async def get(self) -> object:
+        """
+        Remove and return the item at the head of the queue, waiting until an item is available
+        if it is empty.
+
+        Returns:
+            The item at the head of the queue.
+        """
+        await self._wait_in_line(self._getters, lambda: not self.empty())
+        return self.get_nowait()
+
+    def task_done(self) -> None:
+        """
+        Indicate that an item previously taken from the queue has been processed. When every item
+        put into the queue has been marked done, the tasks waiting in join are woken up.
+
+        Returns:
+            None
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            while not self._joiners.is_empty:
+                self._wakeup_next(self._joiners)
+
+    async def join(self) -> None:
+        """
+        Wait until every item put into the queue has been taken and marked done.
+
+        Returns:
+            None
+        """
+        await self._wait_in_line(self._joiners, lambda: self._unfinished_tasks == 0)
+
+
+class AsyncLinkedDeque(AsyncLinkedQueue):
+    """
+    A double-ended queue for the tasks of an event loop. In addition to what an AsyncLinkedQueue
+    can do, items can be put at the head and taken from the tail, all in O(1) (the
+    DoubleLinkedList keeps its tail and prev links), with the same waiting behavior.
+
+    Attributes:
+        maxsize: The maximum number of items in the deque, or 0 (or less) for no limit.
+    """
+
+    def put_left_nowait(self, item: object) -> None:
+        """
+        Put an item at the head of the deque without waiting; raise asyncio.QueueFull if it is
+        full.
+
+        Args:
+            item: The item to put.
+
+        Returns:
+            None
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.insert_at_head(item)
+        self._after_put()
+
+    async def put_left(self, item: object) -> None:
+        """
+        Put an item at the head of the deque, waiting until a slot is free if it is full.
+
+        Args:
+            item: The item to put.
+
+        Returns:
+            None
+        """
+        await self._wait_in_line(self._putters, lambda: not self.full())
+        self.put_left_nowait(item)
+
+    def get_right_nowait(self) -> object:
+        """
+        Remove and return the item at the tail of the deque without waiting; raise
+        asyncio.QueueEmpty if it is empty.
+
+        Returns:
+            The item at the tail of the deque.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item: object = self._items.tail.data
+        self._items.remove_at_tail()
+        self._after_get()
+        return item
+
+    async def get_right(self) -> object:
+        """
+        Remove and return the item at the tail of the deque, waiting until an item is available
+        if it is empty.
+
+        Returns:
+            The item at the tail of the deque.
+        """
+        await self._wait_in_line(self._getters, lambda: not self.empty())
+        return self.get_right_nowait()
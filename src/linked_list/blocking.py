@@ -0,0 +1,462 @@
+"""
+This module contains thread-safe blocking queues built on a DoubleLinkedList, for producer-consumer
+pipelines. They follow the interface of the standard library's queue.Queue (and raise its Empty
+and Full exceptions), and add batch operations that move many items under a single acquisition
+of the queue's lock.
+"""
+
+import queue
+import threading
+import time
+from typing import Iterable, List, Union
+
+# these are the custom classes that we will use in the queues
+from linked_list.impl.double import DoubleLinkedList
+
+
+class LinkedQueue:
+    """
+    A thread-safe first-in, first-out queue. The items are kept in a DoubleLinkedList, so putting
+    an item at the tail and getting one from the head are O(1). Putting a batch is O(1) inside the
+    lock once its items are linked, and getting k of n items walks O(min(k, n - k)) nodes inside
+    the lock to find where to split the chain (no item is copied between Python lists inside the
+    lock).
+
+    Producers block (or time out) while the queue is full, and consumers block (or time out)
+    while it is empty; waiting threads sleep on condition variables rather than polling.
+
+    Attributes:
+        maxsize: The maximum number of items in the queue, or 0 (or less) for no limit.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize: int = maxsize
+        self._items: DoubleLinkedList = DoubleLinkedList()
+        self._mutex: threading.Lock = threading.Lock()
+        self._not_empty: threading.Condition = threading.Condition(self._mutex)
+        self._not_full: threading.Condition = threading.Condition(self._mutex)
+        self._room_for_many: threading.Condition = threading.Condition(self._mutex)
+        self._all_tasks_done: threading.Condition = threading.Condition(self._mutex)
+        self._unfinished_tasks: int = 0
+
+    def qsize(self) -> int:
+        """
+        Get the number of items in the queue. The result is only approximate, as other threads
+        may change the queue as soon as the lock is released.
+
+        Returns:
+            The number of items in the queue.
+        """
+        with self._mutex:
+            return self._items.size
+
+    def empty(self) -> bool:
+        """
+        Check if the queue is empty (approximately, as for qsize).
+
+        Returns:
+            True if the queue is empty, False otherwise.
+        """
+        with self._mutex:
+            return self._items.is_empty
+
+    def full(self) -> bool:
+        """
+        Check if the queue is full (approximately, as for qsize).
+
+        Returns:
+            True if the queue is full, False otherwise.
+        """
+        with self._mutex:
+            return 0 < self.maxsize <= self._items.size
+
+    @staticmethod
+    def _wait(
+        condition: threading.Condition,
+        ready,
+        block: bool,
+        timeout: Union[None, float],
+        error: type,
+    ) -> None:
+        """
+        Wait on the given condition (whose lock must be held) until the given predicate is true.
+
+        Args:
+            condition: The condition to wait on.
+            ready: A function of no arguments that tells if the wait is over.
+            block: Whether to wait at all; if not, the error is raised unless ready() is true.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+            error: The exception to raise if the wait is not over in time.
+
+        Returns:
+            None
+        """
+        if not block:
+            if not ready():
+                raise error
+            return
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline: Union[None, float] = (
+            None if timeout is None else time.monotonic() + timeout
+        )
+        while not ready():
+            remaining: Union[None, float] = (
+                None if deadline is None else deadline - time.monotonic()
+            )
+            if remaining is not None and remaining <= 0:
+                raise error
+            condition.wait(remaining)
+
+    def _wait_for_room(
+        self, count: int, block: bool, timeout: Union[None, float]
+    ) -> None:
+        """
+        Wait until there is room in the queue for the given number of items. The lock must be
+        held. Threads waiting for room for several items wait on their own condition, so that a
+        slot freed for a single item is never handed to a thread that cannot use it yet.
+
+        Args:
+            count: The number of items to make room for.
+            block: Whether to wait for room.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            None
+        """
+        if 0 < self.maxsize < count:
+            raise ValueError(
+                f"Cannot put {count} items at once into a queue of maximum size {self.maxsize}."
+            )
+        self._wait(
+            self._not_full if count == 1 else self._room_for_many,
+            lambda: self.maxsize <= 0 or self._items.size + count <= self.maxsize,
+            block,
+            timeout,
+            queue.Full,
+        )
+
+    def _notify_room(self, count: int) -> None:
+        """
+        Wake up the threads waiting for room after the given number of items were removed. The
+        lock must be held. One single-item putter is woken per freed slot, and every batch putter
+        is woken to check whether its whole batch fits now.
+
+        Args:
+            count: The number of items removed from the queue.
+
+        Returns:
+            None
+        """
+        self._not_full.notify(count)
+        self._room_for_many.notify_all()
+
+    def _wait_for_item(self, block: bool, timeout: Union[None, float]) -> None:
+        """
+        Wait until there is an item in the queue. The lock must be held.
+
+        Args:
+            block: Whether to wait for an item.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            None
+        """
+        self._wait(
+            self._not_empty,
+            lambda: not self._items.is_empty,
+            block,
+            timeout,
+            queue.Empty,
+        )
+
+    def _put_linked(
+        self,
+        items: DoubleLinkedList,
+        block: bool,
+        timeout: Union[None, float],
+        at_head: bool,
+    ) -> None:
+        """
+        Wait until there is room for all the given items, then move their nodes into the queue
+        (without copying them).
+
+        Args:
+            items: The items to put, already linked in a DoubleLinkedList.
+            block: Whether to wait for room.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+            at_head: Whether to put the items at the head (rather than the tail) of the queue.
+
+        Returns:
+            None
+        """
+        count: int = items.size
+        with self._mutex:
+            self._wait_for_room(count, block, timeout)
+            self._items.splice(items, at=0 if at_head else None)
+            self._unfinished_tasks += count
+            self._not_empty.notify(count)
+
+    def _get_linked(
+        self,
+        count: int,
+        block: bool,
+        timeout: Union[None, float],
+        from_tail: bool,
+    ) -> List[object]:
+        """
+        Wait until the queue is not empty, then move up to the given number of items out of it,
+        by splitting the chain of nodes once. Locating the split point walks the nodes from the
+        nearer end of the queue, so for n queued items and k taken ones, the lock is held for
+        O(min(k, n - k)) time; the items taken from the tail are put back in order, and copied
+        out of their nodes, after the lock is released.
+
+        Args:
+            count: The maximum number of items to get.
+            block: Whether to wait for an item.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+            from_tail: Whether to get the items from the tail (rather than the head) of the queue.
+
+        Returns:
+            The items, in the order they were taken.
+        """
+        if count < 1:
+            raise ValueError("The maximum number of items must be at least 1.")
+        with self._mutex:
+            self._wait_for_item(block, timeout)
+            count = min(count, self._items.size)
+            if from_tail:
+                taken: DoubleLinkedList = self._items.split_at(self._items.size - count)
+            else:
+                taken, self._items = self._items, self._items.split_at(count)
+            self._notify_room(count)
+        if from_tail:
+            taken.reverse()  # no other thread holds the taken nodes
+        return list(taken.values())
+
+    def put(
+        self, item: object, block: bool = True, timeout: Union[None, float] = None
+    ) -> None:
+        """
+        Put an item at the tail of the queue. If the queue is full, wait until a slot is free (at
+        most timeout seconds, if given), and raise queue.Full if none is.
+
+        Args:
+            item: The item to put.
+            block: Whether to wait for a free slot.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            None
+        """
+        with self._mutex:
+            self._wait_for_room(1, block, timeout)
+            self._items.insert_at_tail(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def put_nowait(self, item: object) -> None:
+        """
+        Put an item at the tail of the queue without waiting; raise queue.Full if it is full.
+
+        Args:
+            item: The item to put.
+
+        Returns:
+            None
+        """
+        self.put(item, block=False)
+
+    def put_many(
+        self,
+        items: Iterable[object],
+        block: bool = True,
+        timeout: Union[None, float] = None,
+    ) -> None:
+        """
+        Put all the given items at the tail of the queue, in order, under a single acquisition of
+        the lock. The items are linked before the lock is taken; if the queue does not have room
+        for all of them, wait until it does (at most timeout seconds, if given), and raise
+        queue.Full if it does not. Either all the items are put, or none is.
+
+        Args:
+            items: The items to put.
+            block: Whether to wait for enough free slots.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            None
+        """
+        self._put_linked(
+            DoubleLinkedList.from_iterable(items), block, timeout, at_head=False
+        )
+
+    def get(self, block: bool = True, timeout: Union[None, float] = None) -> object:
+        """
+        Remove and return the item at the head of the queue. If the queue is empty, wait until an
+        item is available (at most timeout seconds, if given), and raise queue.Empty if none is.
+
+        Args:
+            block: Whether to wait for an item.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The item at the head of the queue.
+        """
+        with self._mutex:
+            self._wait_for_item(block, timeout)
+            item: object = self._items.head.data
+            self._items.remove_at_head()
+            self._notify_room(1)
+        return item
+
+    def get_nowait(self) -> object:
+        """
+        Remove and return the item at the head of the queue without waiting; raise queue.Empty if
+        it is empty.
+
+        Returns:
+            The item at the head of the queue.
+        """
+        return self.get(block=False)
+
+    def get_many(
+        self,
+        max_items: int,
+        block: bool = True,
+        timeout: Union[None, float] = None,
+    ) -> List[object]:
+        """
+        Remove and return up to the given number of items from the head of the queue, in order,
+        under a single acquisition of the lock. If the queue is empty, wait until an item is
+        available (at most timeout seconds, if given), and raise queue.Empty if none is; the items
+        available at that point are returned without waiting for more.
+
+        Args:
+            max_items: The maximum number of items to get.
+            block: Whether to wait for an item.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The items from the head of the queue (at least one).
+        """
+        return self._get_linked(max_items, block, timeout, from_tail=False)
+
+    def task_done(self) -> None:
+        """
+        Indicate that an item previously taken from the queue has been processed. When every item
+        put into the queue has been marked done, the threads blocked in join are woken up.
+
+        Returns:
+            None
+        """
+        with self._all_tasks_done:
+            if self._unfinished_tasks <= 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks -= 1
+            if self._unfinished_tasks == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self) -> None:
+        """
+        Block until every item put into the queue has been taken and marked done.
+
+        Returns:
+            None
+        """
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+
+class LinkedDeque(LinkedQueue):
+    """
+    A thread-safe double-ended queue. In addition to what a LinkedQueue can do, items can be put
+    at the head and taken from the tail, all in O(1) (the DoubleLinkedList keeps its tail and prev
+    links), with the same blocking, timeout and batch behavior.
+
+    Attributes:
+        maxsize: The maximum number of items in the deque, or 0 (or less) for no limit.
+    """
+
+    def put_left(
+        self, item: object, block: bool = True, timeout: Union[None, float] = None
+    ) -> None:
+        """
+        Put an item at the head of the deque, waiting for a free slot as put does.
+
+        Args:
+            item: The item to put.
+            block: Whether to wait for a free slot.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            None
+        """
+        with self._mutex:
+            self._wait_for_room(1, block, timeout)
+            self._items.insert_at_head(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def put_many_left(
+        self,
+        items: Iterable[object],
+        block: bool = True,
+        timeout: Union[None, float] = None,
+    ) -> None:
+        """
+        Put all the given items at the head of the deque under a single acquisition of the lock,
+        as put_many does; the items keep their order (so the first item becomes the head).
+
+        Args:
+            items: The items to put.
+            block: Whether to wait for enough free slots.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            None
+        """
+        self._put_linked(
+            DoubleLinkedList.from_iterable(items), block, timeout, at_head=True
+        )
+
+    def get_right(
+        self, block: bool = True, timeout: Union[None, float] = None
+    ) -> object:
+        """
+        Remove and return the item at the tail of the deque, waiting for an item as get does.
+
+        Args:
+            block: Whether to wait for an item.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The item at the tail of the deque.
+        """
+        with self._mutex:
+            self._wait_for_item(block, timeout)
+            item: object = self._items.tail.data
+            self._items.remove_at_tail()
+            self._notify_room(1)
+        return item
+
+    def get_many_right(
+        self,
+        max_items: int,
+        block: bool = True,
+        timeout: Union[None, float] = None,
+    ) -> List[object]:
+        """
+        Remove and return up to the given number of items from the tail of the deque under a
+        single acquisition of the lock, as get_many does; the tail item comes first.
+
+        Args:
+            max_items: The maximum number of items to get.
+            block: Whether to wait for an item.
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The items from the tail of the deque (at least one), the last item first.
+        """
+        return self._get_linked(max_items, block, timeout, from_tail=True)
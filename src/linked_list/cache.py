@@ -0,0 +1,290 @@
+"""
+This module contains the LinkedCache class, a bounded key-value cache that combines a dict (to
+find an entry by its key in O(1)) with DoubleLinkedList objects (to order the entries for eviction
+in O(1)). The cache supports least recently used (LRU) and least frequently used (LFU) eviction,
+and optionally expires entries after a time to live (TTL).
+"""
+
+import time
+from typing import Callable, Dict, Hashable, Union
+
+# these are the custom classes that we will use in the cache
+from node.impl import DoubleLinkNode
+from linked_list.impl.double import DoubleLinkedList
+
+POLICIES = ("lru", "lfu")
+
+
+class _CacheEntry:  # pylint: disable=too-few-public-methods
+    """
+    An entry of a LinkedCache, stored as the data of a node in one of the cache's linked lists.
+
+    Attributes:
+        key: The key of the entry.
+        value: The value of the entry.
+        expires_at: The time (according to the cache's clock) at which the entry expires, or None.
+        frequency: The number of times the entry was stored or retrieved.
+    """
+
+    __slots__ = ("key", "value", "expires_at", "frequency")
+
+    def __init__(
+        self, key: Hashable, value: object, expires_at: Union[None, float]
+    ) -> None:
+        self.key: Hashable = key
+        self.value: object = value
+        self.expires_at: Union[None, float] = expires_at
+        self.frequency: int = 1
+
+
+class LinkedCache:  # pylint: disable=too-many-instance-attributes
+    """
+    A bounded key-value cache. Each entry is kept in a node of a DoubleLinkedList, and a dict maps
+    each key to its node, so that finding, refreshing and evicting an entry are all O(1).
+
+    With the "lru" policy, there is a single linked list ordered from most to least recently used;
+    a hit moves the entry's node to the front, and the entry at the tail is evicted. With the "lfu"
+    policy, there is one such linked list per access frequency; a hit moves the entry's node to
+    the front of the next frequency's list, and the least recently used entry of the lowest
+    frequency is evicted.
+
+    If a time to live is given, an entry expires that many seconds after it was last stored.
+    Expired entries are discarded when they are next looked up, or all at once by expire().
+
+    Attributes:
+        maxsize: The maximum number of entries in the cache.
+        policy: The eviction policy, either "lru" or "lfu".
+        ttl: The number of seconds an entry lives after it was stored, or None for no expiry.
+        on_evict: A function called with the key and value of each entry that is evicted or
+            expired, or None.
+        hits: The number of lookups that found a (live) entry.
+        misses: The number of lookups that did not find a (live) entry.
+        evictions: The number of entries evicted to make room for new entries.
+        expirations: The number of entries discarded because they expired.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        maxsize: int,
+        *,
+        policy: str = "lru",
+        ttl: Union[None, float] = None,
+        on_evict: Union[None, Callable[[Hashable, object], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("The maximum size of the cache must be at least 1.")
+        if policy not in POLICIES:
+            raise ValueError(f"The policy must be one of {POLICIES}, not {policy!r}.")
+        self.maxsize: int = maxsize
+        self.policy: str = policy
+        self.ttl: Union[None, float] = ttl
+        self.on_evict: Union[None, Callable[[Hashable, object], None]] = on_evict
+        self._clock: Callable[[], float] = clock
+        self._nodes: Dict[Hashable, DoubleLinkNode] = {}
+        # the entries of each access frequency, most recently used first (with the "lru" policy,
+        # every entry is kept at frequency 1)
+        self._frequencies: Dict[int, DoubleLinkedList] = {}
+        self._min_frequency: int = 1
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache, including any that have expired but have not been
+        discarded yet.
+
+        Returns:
+            The number of entries in the cache.
+        """
+        return len(self._nodes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if there is a live entry for the given key, without counting a hit or a miss or
+        refreshing the entry.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            True if there is a live entry for the key, False otherwise.
+        """
+        node: Union[None, DoubleLinkNode] = self._nodes.get(key)
+        return node is not None and not self._expired(node.data)
+
+    def _expired(self, entry: _CacheEntry) -> bool:
+        """
+        Check if the given entry has expired.
+
+        Args:
+            entry: The entry to check.
+
+        Returns:
+            True if the entry has expired, False otherwise.
+        """
+        return entry.expires_at is not None and entry.expires_at <= self._clock()
+
+    def _link(self, entry: _CacheEntry) -> None:
+        """
+        Link the given entry at the front of the linked list of its frequency.
+
+        Args:
+            entry: The entry to link.
+
+        Returns:
+            None
+        """
+        linked_list: Union[None, DoubleLinkedList] = self._frequencies.get(
+            entry.frequency
+        )
+        if linked_list is None:
+            linked_list = self._frequencies[entry.frequency] = DoubleLinkedList()
+        self._nodes[entry.key] = linked_list.insert_at_head(entry)
+
+    def _unlink(self, node: DoubleLinkNode) -> None:
+        """
+        Unlink the given entry's node from the linked list of its frequency, dropping the linked
+        list if it is now empty.
+
+        Args:
+            node: The node of the entry to unlink.
+
+        Returns:
+            None
+        """
+        frequency: int = node.data.frequency
+        linked_list: DoubleLinkedList = self._frequencies[frequency]
+        linked_list.remove_node(node)
+        if linked_list.is_empty:
+            del self._frequencies[frequency]
+
+    def _discard(self, node: DoubleLinkNode) -> None:
+        """
+        Remove the given entry's node from the cache, and notify the eviction callback.
+
+        Args:
+            node: The node of the entry to discard.
+
+        Returns:
+            None
+        """
+        entry: _CacheEntry = node.data
+        self._unlink(node)
+        del self._nodes[entry.key]
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    def _touch(self, node: DoubleLinkNode) -> None:
+        """
+        Record a use of the given entry's node.
+
+        Args:
+            node: The node of the entry that was used.
+
+        Returns:
+            None
+        """
+        if self.policy == "lru":
+            self._frequencies[1].move_to_front(node)
+            return
+
+        entry: _CacheEntry = node.data
+        self._unlink(node)
+        if (
+            entry.frequency == self._min_frequency
+            and entry.frequency not in self._frequencies
+        ):  # it was the last entry of the lowest frequency
+            self._min_frequency += 1
+        entry.frequency += 1
+        self._link(entry)
+
+    def _evict(self) -> None:
+        """
+        Evict the entry chosen by the policy: the least recently used entry of the lowest
+        frequency (with the "lru" policy, every entry has the same frequency).
+
+        Returns:
+            None
+        """
+        if self._min_frequency not in self._frequencies:  # entries of it have expired
+            self._min_frequency = min(self._frequencies)
+        self._discard(self._frequencies[self._min_frequency].tail)
+        self.evictions += 1
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """
+        Get the value of the entry for the given key, and record the use of the entry.
+
+        Args:
+            key: The key to look up.
+            default: The value to return if there is no live entry for the key.
+
+        Returns:
+            The value of the entry for the key, or the default if there is no live entry.
+        """
+        node: Union[None, DoubleLinkNode] = self._nodes.get(key)
+        if node is not None and self._expired(node.data):
+            self._discard(node)
+            self.expirations += 1
+            node = None
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(node)
+        return node.data.value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """
+        Store the given value for the given key, evicting an entry if the cache is full. Storing a
+        value for a key that is already in the cache replaces the value, and counts as a use.
+
+        Args:
+            key: The key to store the value for.
+            value: The value to store.
+
+        Returns:
+            None
+        """
+        expires_at: Union[None, float] = (
+            None if self.ttl is None else self._clock() + self.ttl
+        )
+        node: Union[None, DoubleLinkNode] = self._nodes.get(key)
+        if node is not None:
+            node.data.value, node.data.expires_at = value, expires_at
+            self._touch(node)
+            return
+
+        if len(self._nodes) >= self.maxsize:
+            self._evict()
+        self._link(_CacheEntry(key, value, expires_at))
+        self._min_frequency = 1
+
+    def expire(self) -> int:
+        """
+        Discard every entry that has expired, in O(n) time.
+
+        Returns:
+            The number of entries discarded.
+        """
+        expired = [node for node in self._nodes.values() if self._expired(node.data)]
+        for node in expired:
+            self._discard(node)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache, without notifying the eviction callback. The counters
+        are kept.
+
+        Returns:
+            None
+        """
+        self._nodes.clear()
+        self._frequencies.clear()
+        self._min_frequency = 1
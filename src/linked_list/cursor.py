@@ -0,0 +1,272 @@
+"""
+This module contains cursors over singly and doubly linked lists. A cursor remembers a position
+in a linked list (and the node before it), so that reading, updating, inserting and removing at
+that position are O(1), rather than O(n) with insert_at_index or remove_at_index.
+
+A cursor is invalidated when its linked list is structurally modified other than through the
+cursor itself (e.g., by a method of the linked list, or by another cursor). Using an invalidated
+cursor raises a RuntimeError, in the same way as modifying a dict while iterating over it.
+"""
+
+from typing import Union
+
+# these are the custom classes that we will use in the cursors
+from node.impl import SingleLinkNode, DoubleLinkNode
+
+
+class SingleLinkedListCursor:
+    """
+    A cursor over a SingleLinkedList. The cursor is positioned at a node, or just past the last
+    node (where it can still insert); it can move forward, read and update the data of its node,
+    and insert or remove at its position in O(1).
+
+    Attributes:
+        linked_list: The linked list the cursor is over.
+        index: The index of the cursor's position in the linked list.
+    """
+
+    def __init__(self, linked_list, index: int = 0) -> None:
+        if index < 0 or index > linked_list.size:
+            raise IndexError(
+                f"Index {index} does not exist for {type(linked_list).__name__} "
+                f"of size {linked_list.size}."
+            )
+        # pylint: disable=protected-access
+        self.linked_list = linked_list
+        self.index: int = index
+        self._predecessor: Union[None, SingleLinkNode] = (
+            None if index == 0 else linked_list._node_at(index - 1)
+        )
+        self._node: Union[None, SingleLinkNode] = (
+            linked_list._head if self._predecessor is None else self._predecessor.next
+        )
+        self._version: int = linked_list._version
+
+    def _check_valid(self) -> None:
+        """
+        Make sure the linked list was not structurally modified other than through this cursor.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        if self._version != self.linked_list._version:
+            raise RuntimeError("Linked list was modified since the cursor was created.")
+
+    def _modified(self, delta: int) -> None:
+        """
+        Record a structural modification made through this cursor, so the cursor stays valid.
+
+        Args:
+            delta: The change in the number of nodes.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        self.linked_list._adjust_size(delta)
+        self._version = self.linked_list._version
+
+    def _unshare(self) -> None:
+        """
+        Make sure the linked list does not share its nodes with a copy, which must not see the
+        modification about to be made through this cursor. The linked list keeps its nodes (a
+        linked list with a cursor is never a copy still sharing them), so the cursor stays valid.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        self.linked_list._unshare()
+
+    def _check_node(self) -> None:
+        """
+        Make sure the cursor is valid and positioned at a node (i.e., not past the last node).
+
+        Returns:
+            None
+        """
+        self._check_valid()
+        if self._node is None:
+            raise IndexError("Cursor is past the end of the linked list.")
+
+    @property
+    def at_end(self) -> bool:
+        """
+        Check if the cursor is positioned just past the last node of the linked list.
+
+        Returns:
+            True if the cursor is past the last node, False otherwise.
+        """
+        self._check_valid()
+        return self._node is None
+
+    @property
+    def node(self) -> SingleLinkNode:
+        """
+        Get the node at the cursor's position.
+
+        Returns:
+            The node at the cursor's position.
+        """
+        self._check_node()
+        return self._node
+
+    @property
+    def data(self) -> object:
+        """
+        Get the data of the node at the cursor's position.
+
+        Returns:
+            The data of the node at the cursor's position.
+        """
+        self._check_node()
+        return self._node.data
+
+    @data.setter
+    def data(self, value: object) -> None:
+        """
+        Set the data of the node at the cursor's position.
+
+        Args:
+            value: The data to store in the node.
+
+        Returns:
+            None
+        """
+        self._check_node()
+        self._unshare()
+        self.linked_list._set_data(  # pylint: disable=protected-access
+            self._node, value
+        )
+
+    def move_next(self) -> None:
+        """
+        Move the cursor to the next position in the linked list.
+
+        Returns:
+            None
+        """
+        self._check_node()
+        self._predecessor, self._node = self._node, self._node.next
+        self.index += 1
+
+    def _link(self, new_node: SingleLinkNode) -> None:
+        """
+        Link the given node (whose next link is already set) between the predecessor and the
+        cursor's node.
+
+        Args:
+            new_node: The node to link.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        if self._predecessor is None:
+            self.linked_list._head = new_node
+        else:
+            self._predecessor.next = new_node
+        if self._node is None:
+            self.linked_list.tail = new_node
+        self._predecessor = new_node
+        self.index += 1
+
+    def insert(self, data: object) -> None:
+        """
+        Insert a new node with the given data before the cursor's position. The cursor stays at
+        the same node, whose index increases by one.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        self._check_valid()
+        self._unshare()
+        new_node = SingleLinkNode(data)
+        new_node.next = self._node
+        self._link(new_node)
+        self._modified(1)
+
+    def remove(self) -> object:
+        """
+        Remove the node at the cursor's position. The cursor moves to the next node (so its index
+        does not change).
+
+        Returns:
+            The data of the removed node.
+        """
+        self._check_node()
+        self._unshare()
+        removed: SingleLinkNode = self._node
+        self._node = removed.next
+        if self._predecessor is None:
+            self.linked_list._head = self._node  # pylint: disable=protected-access
+        else:
+            self._predecessor.next = self._node
+        if self._node is None:
+            self.linked_list.tail = self._predecessor
+        self._modified(-1)
+        return removed.data
+
+
+class DoubleLinkedListCursor(SingleLinkedListCursor):
+    """
+    A cursor over a DoubleLinkedList. In addition to what a SingleLinkedListCursor can do, the
+    cursor can move backward, and it keeps the prev links of the nodes it inserts or removes up to
+    date.
+
+    Attributes:
+        linked_list: The linked list the cursor is over.
+        index: The index of the cursor's position in the linked list.
+    """
+
+    def move_prev(self) -> None:
+        """
+        Move the cursor to the previous position in the linked list.
+
+        Returns:
+            None
+        """
+        self._check_valid()
+        if self._predecessor is None:
+            raise IndexError("Cursor is at the start of the linked list.")
+        self._predecessor, self._node = self._predecessor.prev, self._predecessor
+        self.index -= 1
+
+    def insert(self, data: object) -> None:
+        """
+        Insert a new node with the given data before the cursor's position. The cursor stays at
+        the same node, whose index increases by one.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        self._check_valid()
+        self._unshare()
+        new_node = DoubleLinkNode(data)
+        new_node.prev, new_node.next = self._predecessor, self._node
+        if self._node is not None:
+            self._node.prev = new_node
+        self._link(new_node)
+        self._modified(1)
+
+    def remove(self) -> object:
+        """
+        Remove the node at the cursor's position. The cursor moves to the next node (so its index
+        does not change).
+
+        Returns:
+            The data of the removed node.
+        """
+        removed: DoubleLinkNode = self._node
+        data: object = super().remove()
+        if self._node is not None:
+            self._node.prev = self._predecessor
+        removed.prev, removed.next = None, None
+        return data
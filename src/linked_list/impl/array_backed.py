@@ -0,0 +1,461 @@
+"""
+This module contains the ArrayLinkedList class that represents a doubly linked list whose links
+are stored in flat integer buffers rather than in one object per node.
+"""
+
+from array import array
+from typing import Union, Iterable
+
+# these are the custom classes that we will use in the linked list
+from node.abstract import Node
+from linked_list.abstract import LinkedList
+
+NULL: int = -1  # the index used in place of a missing link (i.e., None)
+
+
+class ArrayLinkNode(Node):  # pylint: disable=too-few-public-methods
+    """
+    A lightweight handle to a slot of an ArrayLinkedList. The handle does not store any data or
+    links itself; reading or writing its data reads or writes the payload stored in the slot, and
+    its next and prev attributes are handles to the neighbouring slots (or None).
+
+    Handles are created on demand (e.g., during iteration), so two handles to the same slot are
+    equal but not identical. A handle to a slot that has since been removed is no longer
+    meaningful, as the slot may be reused by a later insertion.
+
+    Attributes:
+        data: The data stored in the slot.
+        next: A handle to the slot after this one in the linked list.
+        prev: A handle to the slot before this one in the linked list.
+    """
+
+    __slots__ = ("linked_list", "index")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, linked_list: "ArrayLinkedList", index: int
+    ) -> None:
+        self.linked_list: ArrayLinkedList = linked_list
+        self.index: int = index
+
+    @property
+    def data(self) -> object:
+        """
+        Get the data stored in the slot.
+
+        Returns:
+            The data stored in the slot.
+        """
+        return self.linked_list._data[self.index]  # pylint: disable=protected-access
+
+    @data.setter
+    def data(self, value: object) -> None:
+        """
+        Set the data stored in the slot.
+
+        Args:
+            value: The data to store in the slot.
+
+        Returns:
+            None
+        """
+        self.linked_list._data[self.index] = value  # pylint: disable=protected-access
+
+    @property
+    def next(self) -> Union[None, "ArrayLinkNode"]:
+        """
+        Get a handle to the slot after this one in the linked list.
+
+        Returns:
+            A handle to the next slot, or None if this is the last slot.
+        """
+        return self.linked_list._node(  # pylint: disable=protected-access
+            self.linked_list._next[self.index]  # pylint: disable=protected-access
+        )
+
+    @property
+    def prev(self) -> Union[None, "ArrayLinkNode"]:
+        """
+        Get a handle to the slot before this one in the linked list.
+
+        Returns:
+            A handle to the previous slot, or None if this is the first slot.
+        """
+        return self.linked_list._node(  # pylint: disable=protected-access
+            self.linked_list._prev[self.index]  # pylint: disable=protected-access
+        )
+
+
+class ArrayLinkedList(LinkedList):
+    """
+    A doubly linked list backed by parallel buffers. Each element occupies a slot: its payload is
+    stored in a Python list, and the indices of its next and previous slots are stored in two
+    array('l') buffers. No node object is allocated per element, so the garbage collector only
+    tracks the payload list, and an element costs 16 bytes of links plus an 8 byte payload
+    reference on 64-bit platforms.
+
+    Removed slots are pushed onto a free list (threaded through the next buffer) and are reused by
+    later insertions. When the linked list becomes empty, the buffers are released entirely.
+
+    The linked list may be iterated over to access each element in the list; iteration yields
+    ArrayLinkNode handles, so the interface is the same as for the other linked lists.
+
+    An object of ArrayLinkedList can be compared to other linked lists for equality, inequality,
+    less than, less than or equal to, greater than, greater than or equal to, and hashed.
+    """
+
+    def __init__(self, *args) -> None:
+        # order matters here, *args are inserted into these buffers
+        self._data: list = []
+        self._next: array = array("l")
+        self._prev: array = array("l")
+        self._first: int = NULL  # the slot of the head
+        self._last: int = NULL  # the slot of the tail
+        self._free: int = NULL  # the first slot of the free list
+        super().__init__(*args)
+
+    def _node(self, index: int) -> Union[None, ArrayLinkNode]:
+        """
+        Get a handle to the given slot.
+
+        Args:
+            index: The slot to get a handle to.
+
+        Returns:
+            A handle to the slot, or None if the index is NULL.
+        """
+        if index == NULL:
+            return None
+        return ArrayLinkNode(self, index)
+
+    def _allocate(self, data: object) -> int:
+        """
+        Get an unlinked slot storing the given data, reusing a slot from the free list if one
+        is available, or growing the buffers otherwise.
+
+        Args:
+            data: The data to store in the slot.
+
+        Returns:
+            The index of the slot.
+        """
+        index: int = self._free
+        if index == NULL:
+            index = len(self._data)
+            self._data.append(data)
+            self._next.append(NULL)
+            self._prev.append(NULL)
+        else:
+            self._free = self._next[index]
+            self._data[index] = data
+            self._next[index] = NULL
+        return index
+
+    def _release(self, index: int) -> None:
+        """
+        Push the given (already unlinked) slot onto the free list, and drop its data. If the linked
+        list is now empty, the buffers are released instead.
+
+        Args:
+            index: The slot to release.
+
+        Returns:
+            None
+        """
+        if self._size == 0:
+            self._data, self._next, self._prev = [], array("l"), array("l")
+            self._free = NULL
+            return
+
+        self._data[index] = None  # do not keep the data alive
+        self._prev[index] = NULL
+        self._next[index] = self._free
+        self._free = index
+
+    def _index_at(self, index: int) -> int:
+        """
+        Get the slot of the element at the given position in the linked list. The walk starts
+        from whichever is closest to the index: the head, the tail (following the prev links), or
+        the slot last located by index (if there has been no structural modification since), so
+        sequential and nearby accesses are amortized O(1).
+
+        Args:
+            index: The position of the element, which must be in bounds.
+
+        Returns:
+            The slot of the element at the given position.
+        """
+        position, curr = 0, self._first
+        if self._size - 1 - index < index:
+            position, curr = self._size - 1, self._last
+        # the (version, index, slot) of the last slot located by index, if any
+        cached = self._cached_position
+        if (
+            cached is not None
+            and cached[0] == self._version
+            and abs(index - cached[1]) < abs(index - position)
+        ):
+            _, position, curr = cached
+
+        nxt, prev = self._next, self._prev
+        for _ in range(index - position):
+            curr = nxt[curr]
+        for _ in range(position - index):
+            curr = prev[curr]
+        self._cached_position = (self._version, index, curr)
+        return curr
+
+    def _node_at(self, index: int) -> Union[None, ArrayLinkNode]:
+        """
+        Get a handle to the element at the given non-negative index in the linked list.
+
+        Args:
+            index: The index of the element to get.
+
+        Returns:
+            A handle to the element at the given index, or None if the index is out of bounds.
+        """
+        if index >= self._size:
+            return None
+        return ArrayLinkNode(self, self._index_at(index))
+
+    @property
+    def head(self) -> Union[None, ArrayLinkNode]:
+        """
+        Get a handle to the head of the linked list.
+
+        Returns:
+            A handle to the first slot in the linked list, or None if the linked list is empty.
+        """
+        return self._node(self._first)
+
+    @head.setter
+    def head(self, node: Union[None, Node]) -> None:
+        """
+        Replace the contents of the linked list with the data of the chain of nodes starting at
+        the given node. Since the data are copied into the buffers, later changes to the given
+        nodes are not reflected in the linked list.
+
+        Args:
+            node: The first node of the chain to copy, or None to empty the linked list.
+
+        Returns:
+            None
+        """
+        data: list = []
+        while node is not None:
+            data.append(node.data)
+            node = node.next
+        self.clear()
+        self.extend(data)
+
+    @property
+    def tail(self) -> Union[None, ArrayLinkNode]:
+        """
+        Get a handle to the tail of the linked list.
+
+        Returns:
+            A handle to the last slot in the linked list, or None if the linked list is empty.
+        """
+        return self._node(self._last)
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Simple and efficient check to see if the linked list is empty.
+
+        Returns:
+            True if the linked list is empty, False otherwise.
+        """
+        return self._first == NULL
+
+    def __iter__(self) -> iter:
+        curr: int = self._first
+        while curr != NULL:
+            yield ArrayLinkNode(self, curr)
+            curr = self._next[curr]
+
+    def values(self) -> iter:
+        """
+        Iterate over the data stored in each slot of the linked list, in order, without creating
+        node handles.
+
+        Returns:
+            An iterator over the data stored in the linked list.
+        """
+        data, nxt = self._data, self._next
+        curr: int = self._first
+        while curr != NULL:
+            yield data[curr]
+            curr = nxt[curr]
+
+    def clear(self) -> None:
+        """
+        Remove every element from the linked list and release the buffers.
+
+        Returns:
+            None
+        """
+        self._data, self._next, self._prev = [], array("l"), array("l")
+        self._first = self._last = self._free = NULL
+        self._adjust_size(-self._size)
+
+    def insert_at_head(self, data: object) -> None:
+        """
+        Insert a new element with the given data at the head of the linked list.
+
+        Args:
+            data: Any data to store in the new element to insert.
+
+        Returns:
+            None
+        """
+        if isinstance(data, Node):
+            raise ValueError(
+                "Cannot insert a Node object. "
+                "Insert the data instead if this was intended behavior."
+            )
+
+        index: int = self._allocate(data)
+        self._next[index] = self._first
+        if self._first != NULL:
+            self._prev[self._first] = index
+        else:
+            self._last = index  # if the list was empty, the tail is also the head
+        self._first = index
+        self._adjust_size(1)
+
+    def remove_at_head(self) -> None:
+        """
+        Remove the element at the head of the linked list, if it exists.
+
+        Returns:
+            None
+        """
+        index: int = self._first
+        if index == NULL:
+            return
+
+        self._first = self._next[index]
+        if self._first != NULL:
+            self._prev[self._first] = NULL
+        else:
+            self._last = NULL  # the only element was removed, so the list is empty
+        self._adjust_size(-1)
+        self._release(index)
+
+    def insert_at_tail(self, data: object) -> None:
+        """
+        Insert a new element with the given data at the tail of the linked list.
+
+        Args:
+            data: Any data to store in the new element to insert.
+
+        Returns:
+            None
+        """
+        index: int = self._allocate(data)
+        self._prev[index] = self._last
+        if self._last != NULL:
+            self._next[self._last] = index
+        else:
+            self._first = index  # if the list was empty, the head is also the tail
+        self._last = index
+        self._adjust_size(1)
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new element at the tail of the linked list for each item in the given iterable,
+        preserving their order. If there are no free slots to reuse, the new elements are written
+        to contiguous slots at the end of the buffers in one pass.
+
+        Args:
+            iterable: The data to store in the new elements to insert.
+
+        Returns:
+            None
+        """
+        if self._free != NULL:  # slots must be reused one at a time
+            for data in iterable:
+                self.insert_at_tail(data)
+            return
+
+        start: int = len(self._data)
+        self._data.extend(iterable)
+        stop: int = len(self._data)
+        if start == stop:  # nothing to insert
+            return
+
+        self._next.extend(range(start + 1, stop + 1))
+        self._next[stop - 1] = NULL
+        self._prev.extend(range(start - 1, stop - 1))
+        self._prev[start] = self._last
+        if self._last != NULL:
+            self._next[self._last] = start
+        else:
+            self._first = start
+        self._last = stop - 1
+        self._adjust_size(stop - start)
+
+    def remove_at_tail(self) -> None:
+        index: int = self._last
+        if index == NULL:
+            return
+
+        self._last = self._prev[index]
+        if self._last != NULL:
+            self._next[self._last] = NULL
+        else:
+            self._first = NULL  # the only element was removed, so the list is empty
+        self._adjust_size(-1)
+        self._release(index)
+
+    def insert_at_index(self, data: object, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index == 0:
+            self.insert_at_head(data)
+            return
+
+        if index > self._size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        if index == self._size:
+            self.insert_at_tail(data)
+            return
+
+        predecessor: int = self._index_at(index - 1)
+        successor: int = self._next[predecessor]
+        new_index: int = self._allocate(data)
+        self._prev[new_index], self._next[new_index] = predecessor, successor
+        self._next[predecessor] = new_index
+        self._prev[successor] = new_index
+        self._adjust_size(1)
+
+    def remove_at_index(self, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index == 0:
+            self.remove_at_head()
+            return
+
+        if index >= self._size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        if index == self._size - 1:
+            self.remove_at_tail()
+            return
+
+        removed: int = self._index_at(index)
+        predecessor, successor = self._prev[removed], self._next[removed]
+        self._next[predecessor] = successor
+        self._prev[successor] = predecessor
+        self._adjust_size(-1)
+        self._release(removed)
@@ -0,0 +1,510 @@
+"""
+This module contains the ConcurrentLinkedList class that represents a thread-safe doubly linked
+list, where each node has its own lock rather than the whole linked list sharing one.
+"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Iterable, Tuple, Union
+
+# these are the custom classes that we will use in the linked list
+from node.abstract import Node
+from node.impl import DoubleLinkNode
+from linked_list.abstract import ASYNC_CHUNK_SIZE, LinkedList
+
+
+class ConcurrentLinkNode(DoubleLinkNode):
+    """
+    A node of a ConcurrentLinkedList. Besides the data of a DoubleLinkNode, each node has a lock,
+    which must be held (together with the lock of the neighbouring node) to change the link
+    between the two nodes, and a flag recording whether it was removed.
+
+    Inside the linked list, the first and last nodes are linked to sentinel nodes; the next and
+    prev attributes hide the sentinels (i.e., they are None at either end), as for the nodes of
+    the other linked lists.
+
+    Attributes:
+        data: The data stored in the node.
+        next: The node after this one in the linked list.
+        prev: The node before this one in the linked list.
+        lock: The lock guarding the links of the node.
+        removed: Whether the node was removed from the linked list.
+        after: The node (or sentinel) after this one.
+        before: The node (or sentinel) before this one.
+    """
+
+    __slots__ = ("lock", "removed", "sentinel", "after", "before")
+
+    def __init__(self, data: object, sentinel: bool = False) -> None:
+        # order matters here, the next and prev attributes are stored in after and before
+        self.after: Union[None, "ConcurrentLinkNode"] = None
+        self.before: Union[None, "ConcurrentLinkNode"] = None
+        super().__init__(data)
+        self.lock: threading.Lock = threading.Lock()
+        self.removed: bool = False
+        self.sentinel: bool = sentinel
+
+    @property
+    def next(self) -> Union[None, "ConcurrentLinkNode"]:
+        """
+        Get the node after this one in the linked list.
+
+        Returns:
+            The node after this one, or None if this is the last node.
+        """
+        node: Union[None, ConcurrentLinkNode] = self.after
+        return None if node is None or node.sentinel else node
+
+    @next.setter
+    def next(self, node: Union[None, "ConcurrentLinkNode"]) -> None:
+        """
+        Set the node after this one in the linked list.
+
+        Args:
+            node: The node after this one, or None if this is the last node.
+
+        Returns:
+            None
+        """
+        self.after = node
+
+    @property
+    def prev(self) -> Union[None, "ConcurrentLinkNode"]:
+        """
+        Get the node before this one in the linked list.
+
+        Returns:
+            The node before this one, or None if this is the first node.
+        """
+        node: Union[None, ConcurrentLinkNode] = self.before
+        return None if node is None or node.sentinel else node
+
+    @prev.setter
+    def prev(self, node: Union[None, "ConcurrentLinkNode"]) -> None:
+        """
+        Set the node before this one in the linked list.
+
+        Args:
+            node: The node before this one, or None if this is the first node.
+
+        Returns:
+            None
+        """
+        self.before = node
+
+
+class ConcurrentLinkedList(LinkedList):
+    """
+    A thread-safe doubly linked list with fine-grained locking. The nodes sit between two sentinel
+    nodes (one before the head and one after the tail), and each node has its own lock; the link
+    between two neighbouring nodes may only be changed while both of their locks are held, and
+    locks are always acquired from the front of the linked list towards the back, so threads
+    cannot deadlock.
+
+    The sentinels' locks act as separate head and tail locks: operations at the head lock the
+    front sentinel and the first node(s), and operations at the tail lock the last node(s) and the
+    back sentinel, so they run in parallel unless the linked list is nearly empty. Positional
+    operations (insert_at_index, remove_at_index, indexing and remove) walk the linked list with
+    hand-over-hand locking: the lock of the next node is acquired before the lock of the current
+    node is released, so the walk always follows live links, and other threads can work on the
+    rest of the linked list meanwhile.
+
+    Iteration is weakly consistent (like the iterators of Java's concurrent collections): it never
+    fails and never yields a node twice, and it reflects some (but not necessarily all) of the
+    modifications made while it is in progress. The size is exact once all threads are done.
+
+    If the linked list is empty, the head and tail are None.
+
+    An object of ConcurrentLinkedList can be compared to other linked lists for equality,
+    inequality, less than, less than or equal to, greater than, greater than or equal to, and
+    hashed.
+    """
+
+    def __init__(self, *args) -> None:
+        # order matters here, *args are inserted between the sentinels
+        self._front: ConcurrentLinkNode = ConcurrentLinkNode(None, sentinel=True)
+        self._back: ConcurrentLinkNode = ConcurrentLinkNode(None, sentinel=True)
+        self._front.after, self._back.before = self._back, self._front
+        # guards the size and version, which are updated by threads working on different nodes
+        self._count_lock: threading.Lock = threading.Lock()
+        super().__init__(*args)
+
+    def _adjust_size(self, delta: int) -> None:
+        with self._count_lock:
+            super()._adjust_size(delta)
+
+    @staticmethod
+    def _new_node(data: object) -> ConcurrentLinkNode:
+        """
+        Create a new node with the given data.
+
+        Args:
+            data: Any data to store in the new node.
+
+        Returns:
+            The new node.
+        """
+        if isinstance(data, Node):
+            raise ValueError(
+                "Cannot insert a Node object. "
+                "Insert the data instead if this was intended behavior."
+            )
+        return ConcurrentLinkNode(data)
+
+    @staticmethod
+    def _link_between(
+        new_node: ConcurrentLinkNode,
+        predecessor: ConcurrentLinkNode,
+        successor: ConcurrentLinkNode,
+    ) -> None:
+        """
+        Link the given node between two neighbouring nodes, whose locks must be held.
+
+        Args:
+            new_node: The node to link.
+            predecessor: The node to link the new node after.
+            successor: The node to link the new node before.
+
+        Returns:
+            None
+        """
+        new_node.before, new_node.after = predecessor, successor
+        predecessor.after = new_node
+        successor.before = new_node
+
+    @staticmethod
+    def _unlink_between(
+        predecessor: ConcurrentLinkNode,
+        node: ConcurrentLinkNode,
+        successor: ConcurrentLinkNode,
+    ) -> None:
+        """
+        Unlink the given node from its neighbours; the locks of all three nodes must be held. The
+        links of the removed node are kept, so that iterators positioned at it can move on.
+
+        Args:
+            predecessor: The node before the node to unlink.
+            node: The node to unlink.
+            successor: The node after the node to unlink.
+
+        Returns:
+            None
+        """
+        predecessor.after = successor
+        successor.before = predecessor
+        node.removed = True
+
+    def _walk_to(self, index: int) -> ConcurrentLinkNode:
+        """
+        Walk the linked list with hand-over-hand locking, to the node before the given position
+        (the front sentinel for position 0). The lock of the returned node is held, and must be
+        released by the caller.
+
+        Args:
+            index: The position to walk to.
+
+        Returns:
+            The (locked) node before the position.
+        """
+        node: ConcurrentLinkNode = self._front
+        node.lock.acquire()  # pylint: disable=consider-using-with
+        for _ in range(index):
+            successor: ConcurrentLinkNode = node.after
+            if successor is self._back:
+                node.lock.release()
+                raise IndexError(
+                    f"Index {index} does not exist for {type(self).__name__} of size "
+                    f"{self.size}."
+                )
+            successor.lock.acquire()  # pylint: disable=consider-using-with
+            node.lock.release()
+            node = successor
+        return node
+
+    @property
+    def head(self) -> Union[None, ConcurrentLinkNode]:
+        """
+        Get the head node of the linked list.
+
+        Returns:
+            The head node of the linked list, or None if the linked list is empty.
+        """
+        with self._front.lock:
+            node: ConcurrentLinkNode = self._front.after
+        return None if node is self._back else node
+
+    @head.setter
+    def head(self, node: Union[None, Node]) -> None:
+        """
+        Replace the contents of the linked list with the data of the chain of nodes starting at
+        the given node. Since the data are copied into new nodes, later changes to the given nodes
+        are not reflected in the linked list. The replacement is not atomic: other threads may
+        see the linked list while it is being emptied and refilled.
+
+        Args:
+            node: The first node of the chain to copy, or None to empty the linked list.
+
+        Returns:
+            None
+        """
+        data: list = []
+        while node is not None:
+            data.append(node.data)
+            node = node.next
+        while self.size:
+            self.remove_at_head()
+        self.extend(data)
+
+    @property
+    def tail(self) -> Union[None, ConcurrentLinkNode]:
+        """
+        Get the tail node of the linked list.
+
+        Returns:
+            The last node in the linked list, or None if the linked list is empty.
+        """
+        with self._back.lock:
+            node: ConcurrentLinkNode = self._back.before
+        return None if node is self._front else node
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Check if the linked list is empty.
+
+        Returns:
+            True if the linked list is empty, False otherwise.
+        """
+        with self._front.lock:
+            return self._front.after is self._back
+
+    def __iter__(self) -> iter:
+        node: ConcurrentLinkNode = self._front
+        while True:
+            with node.lock:  # the next link cannot change while the lock is held
+                node = node.after
+            if node is self._back:
+                return
+            if not node.removed:
+                yield node
+
+    async def aiter_nodes(
+        self, chunk_size: int = ASYNC_CHUNK_SIZE
+    ) -> AsyncIterator[ConcurrentLinkNode]:
+        """
+        Iterate over the nodes of the linked list in a coroutine, yielding to the event loop every
+        chunk_size nodes. Like the synchronous iteration, it is weakly consistent: modifying the
+        linked list meanwhile (from a task or a thread) does not make it fail.
+
+        Args:
+            chunk_size: The number of nodes to visit between two yields to the event loop.
+
+        Returns:
+            An asynchronous iterator over the nodes of the linked list.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+        for count, node in enumerate(self, start=1):
+            yield node
+            if count % chunk_size == 0:
+                await asyncio.sleep(0)
+
+    def _node_at(self, index: int) -> Union[None, ConcurrentLinkNode]:
+        """
+        Get the node at the given non-negative index in the linked list, walking from the head
+        with hand-over-hand locking.
+
+        Args:
+            index: The index of the node to get.
+
+        Returns:
+            The node at the given index, or None if the index is out of bounds.
+        """
+        try:
+            predecessor: ConcurrentLinkNode = self._walk_to(index)
+        except IndexError:
+            return None
+        node: ConcurrentLinkNode = predecessor.after
+        predecessor.lock.release()
+        return None if node is self._back else node
+
+    def _lock_tail(self) -> Tuple[ConcurrentLinkNode, ConcurrentLinkNode]:
+        """
+        Lock the last node (or the front sentinel, if the linked list is empty) and the back
+        sentinel, in that order. The last node is read before it is locked, so it is checked
+        afterwards, and the attempt is repeated if another thread changed the tail meanwhile.
+
+        Returns:
+            The (locked) last node and the (locked) back sentinel.
+        """
+        while True:
+            last_node: ConcurrentLinkNode = self._back.before
+            last_node.lock.acquire()  # pylint: disable=consider-using-with
+            if last_node.after is self._back and not last_node.removed:
+                self._back.lock.acquire()  # pylint: disable=consider-using-with
+                return last_node, self._back
+            last_node.lock.release()
+
+    def insert_at_head(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the head of the linked list.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        self.insert_at_index(data, 0)
+
+    def remove_at_head(self) -> None:
+        """
+        Remove the node at the head of the linked list, if it exists.
+
+        Returns:
+            None
+        """
+        self.remove_at_index(0)
+
+    def insert_at_tail(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the tail of the linked list. Only the last node
+        and the back sentinel are locked.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        new_node: ConcurrentLinkNode = self._new_node(data)
+        last_node, back = self._lock_tail()
+        try:
+            self._link_between(new_node, last_node, back)
+        finally:
+            back.lock.release()
+            last_node.lock.release()
+        self._adjust_size(1)
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new node at the tail of the linked list for each item in the given iterable,
+        preserving their order. The new nodes are linked to one another before any lock is taken,
+        and then attached to the tail at once.
+
+        Args:
+            iterable: The data to store in the new nodes to insert.
+
+        Returns:
+            None
+        """
+        first_node: Union[None, ConcurrentLinkNode] = None
+        last_node: Union[None, ConcurrentLinkNode] = None
+        count: int = 0
+        for data in iterable:
+            new_node = self._new_node(data)
+            if last_node is None:
+                first_node = new_node
+            else:
+                last_node.after, new_node.before = new_node, last_node
+            last_node = new_node
+            count += 1
+
+        if first_node is None:  # nothing to insert
+            return
+
+        predecessor, back = self._lock_tail()
+        try:
+            first_node.before, last_node.after = predecessor, back
+            predecessor.after, back.before = first_node, last_node
+        finally:
+            back.lock.release()
+            predecessor.lock.release()
+        self._adjust_size(count)
+
+    def remove_at_tail(self) -> None:
+        """
+        Remove the node at the tail of the linked list, if it exists. Only the last two nodes and
+        the back sentinel are locked.
+
+        Returns:
+            None
+        """
+        while True:
+            removed: ConcurrentLinkNode = self._back.before
+            if removed is self._front:  # removing from an empty list is a no-op
+                return
+            predecessor: ConcurrentLinkNode = removed.before
+            with predecessor.lock:
+                if predecessor.after is not removed or predecessor.removed:
+                    continue  # another thread changed the tail meanwhile
+                with removed.lock:
+                    if removed.after is not self._back:
+                        continue
+                    with self._back.lock:
+                        self._unlink_between(predecessor, removed, self._back)
+            self._adjust_size(-1)
+            return
+
+    def insert_at_index(self, data: object, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        new_node: ConcurrentLinkNode = self._new_node(data)
+        predecessor: ConcurrentLinkNode = self._walk_to(index)
+        try:
+            with predecessor.after.lock:
+                self._link_between(new_node, predecessor, predecessor.after)
+        finally:
+            predecessor.lock.release()
+        self._adjust_size(1)
+
+    def remove_at_index(self, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        predecessor: ConcurrentLinkNode = self._walk_to(index)
+        try:
+            removed: ConcurrentLinkNode = predecessor.after
+            if removed is self._back:
+                if index == 0:  # removing from an empty list is a no-op
+                    return
+                # the index is out of bounds (i.e., equal to the list's size)
+                raise IndexError(
+                    f"Index {index} does not exist for {type(self).__name__} of size "
+                    f"{self.size}."
+                )
+            with removed.lock, removed.after.lock:
+                self._unlink_between(predecessor, removed, removed.after)
+        finally:
+            predecessor.lock.release()
+        self._adjust_size(-1)
+
+    def remove(self, value: object) -> None:
+        """
+        Remove the first node in the linked list that stores data equal to the given value. The
+        search and the removal are a single hand-over-hand walk, so no other thread can change the
+        linked list in between.
+
+        Args:
+            value: The value to remove.
+
+        Returns:
+            None
+        """
+        predecessor: ConcurrentLinkNode = self._walk_to(0)
+        try:
+            while predecessor.after is not self._back:
+                node: ConcurrentLinkNode = predecessor.after
+                if node.data == value:
+                    with node.lock, node.after.lock:
+                        self._unlink_between(predecessor, node, node.after)
+                    break
+                node.lock.acquire()  # pylint: disable=consider-using-with
+                predecessor.lock.release()
+                predecessor = node
+            else:
+                raise ValueError(f"{value!r} is not in {type(self).__name__}.")
+        finally:
+            predecessor.lock.release()
+        self._adjust_size(-1)
@@ -1,13 +1,14 @@
 """
-This module contains the SingleLinkedList class that represents a singly linked list.
+This module contains the DoubleLinkedList class that represents a doubly linked list.
 """
 
-from typing import Union
+from typing import Callable, Iterable, Tuple, Union
 
 # these are the custom classes that we will use in the linked list
 from node.abstract import Node
 from node.impl import DoubleLinkNode
 from linked_list.impl.single import SingleLinkedList
+from linked_list.cursor import DoubleLinkedListCursor
 
 
 class DoubleLinkedList(SingleLinkedList):
@@ -24,13 +25,140 @@ class DoubleLinkedList(SingleLinkedList):
     less than, less than or equal to, greater than, greater than or equal to, and hashed.
     """
 
-    def __init__(self, *args):
-        self.tail: Union[None, DoubleLinkNode] = (
-            None  # order matters here, *args may define tail
+    def cursor(self, index: int = 0) -> DoubleLinkedListCursor:
+        """
+        Get a cursor positioned at the given index of the linked list (or just past the last node,
+        if the index is the size of the linked list). The cursor can move forward and backward,
+        and read, update, insert and remove at its position in O(1).
+
+        Args:
+            index: The index to position the cursor at.
+
+        Returns:
+            A cursor over the linked list.
+        """
+        self._unshare()
+        return DoubleLinkedListCursor(self, index)
+
+    def sort(
+        self, key: Union[None, Callable[[object], object]] = None, reverse: bool = False
+    ) -> None:
+        """
+        Sort the linked list in place by relinking its nodes, with a bottom-up merge sort (see
+        SingleLinkedList.sort). The merge passes only relink the next links, so the prev links are
+        restored in a single final pass.
+
+        Args:
+            key: A function of one argument used to extract a comparison key from each node's
+                data, or None to compare the data directly.
+            reverse: Whether to sort in descending order (equal items keep their order).
+
+        Returns:
+            None
+        """
+        super().sort(key=key, reverse=reverse)
+        predecessor: Union[None, DoubleLinkNode] = None
+        for node in self:
+            node.prev = predecessor
+            predecessor = node
+
+    def _copy_chain(
+        self,
+    ) -> Tuple[Union[None, DoubleLinkNode], Union[None, DoubleLinkNode], int]:
+        """
+        Copy the chain of nodes of the linked list (with both links), in a single pass.
+
+        Returns:
+            The first and last nodes of the new chain, and the number of nodes in it.
+        """
+        first_node: Union[None, DoubleLinkNode] = None
+        last_node: Union[None, DoubleLinkNode] = None
+        size: int = 0
+        for node in self._chain():
+            new_node = DoubleLinkNode(node.data)
+            if last_node is None:
+                first_node = new_node
+            else:
+                last_node.next = new_node
+                new_node.prev = last_node
+            last_node = new_node
+            size += 1
+        return first_node, last_node, size
+
+    def __reversed__(self) -> iter:
+        """
+        Iterate over the nodes of the linked list from the tail to the head, following the prev
+        links. This allows for the use of reversed(linked_list) in O(n) time overall.
+
+        Returns:
+            An iterator over the nodes of the linked list, in reverse order.
+        """
+        curr: Union[None, DoubleLinkNode] = self.tail
+        while curr is not None:
+            yield curr
+            curr = curr.prev
+
+    def reverse(self) -> None:
+        """
+        Reverse the linked list in place, by swapping the next and prev links of each node in a
+        single pass. No nodes are allocated.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        first_node: Union[None, DoubleLinkNode] = self._head
+        last_node: Union[None, DoubleLinkNode] = self.tail
+        node: Union[None, DoubleLinkNode] = first_node
+        while node is not None:
+            node.next, node.prev = node.prev, node.next
+            node = node.prev  # the old next link
+        self._head, self.tail = last_node, first_node
+        self._adjust_size(0)  # only relinked
+
+    def __delitem__(self, key) -> None:
+        """
+        Delete the node at the given index (or the nodes in the given slice) of the linked list.
+        A slice is unlinked in a single traversal, starting from the node before its first index.
+
+        Args:
+            key: The index (or slice) of the node(s) to delete.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        if not isinstance(key, slice):
+            super().__delitem__(key)
+            return
+
+        indices: range = self._ascending_indices(key)
+        if not indices:
+            return
+
+        predecessor: Union[None, DoubleLinkNode] = (
+            None if indices.start == 0 else self._node_at(indices.start - 1)
         )
-        super().__init__(*args)
+        node: DoubleLinkNode = self._head if predecessor is None else predecessor.next
+        for position in range(indices.start, indices[-1] + 1):
+            successor: Union[None, DoubleLinkNode] = node.next
+            if (position - indices.start) % indices.step == 0:  # unlink this node
+                if predecessor is None:
+                    self._head = successor
+                else:
+                    predecessor.next = successor
+                if successor is not None:
+                    successor.prev = predecessor
+                node.prev, node.next = None, None
+            else:
+                predecessor = node
+            node = successor
+
+        if node is None:  # the last node was removed
+            self.tail = predecessor
+        self._adjust_size(-len(indices))
 
-    def insert_at_head(self, data: object) -> None:
+    def insert_at_head(self, data: object) -> DoubleLinkNode:
         """
         Insert a new node with the given data at the head of the linked list.
 
@@ -38,8 +166,10 @@ class DoubleLinkedList(SingleLinkedList):
             data: Any data to store in the new node to insert.
 
         Returns:
-            None
+            The new node, which may be kept as a handle for remove_node, move_to_front and
+            move_to_back.
         """
+        self._unshare()
         if isinstance(data, Node):
             raise ValueError(
                 "Cannot insert a Node object. "
@@ -47,12 +177,9 @@ class DoubleLinkedList(SingleLinkedList):
             )
 
         new_node = DoubleLinkNode(data)
-        new_node.next = self.head
-        if self.head is not None:
-            self.head.prev = new_node
-        else:
-            self.tail = new_node  # if the list was empty, the tail is also the head
-        self.head = new_node
+        self._link_at_head(new_node)
+        self._adjust_size(1)
+        return new_node
 
     def remove_at_head(self) -> None:
         """
@@ -61,12 +188,18 @@ class DoubleLinkedList(SingleLinkedList):
         Returns:
             None
         """
-        if self.head is not None:
-            self.head = self.head.next
-            if self.head is not None:
-                self.head.prev = None
+        self._unshare()
+        if self._head is not None:
+            removed: DoubleLinkNode = self._head
+            self._head = removed.next
+            removed.next = None
+            if self._head is not None:
+                self._head.prev = None
+            else:
+                self.tail = None  # the only node was removed, so the list is empty
+            self._adjust_size(-1)
 
-    def insert_at_tail(self, data: object) -> None:
+    def insert_at_tail(self, data: object) -> DoubleLinkNode:
         """
         Insert a new node with the given data at the tail of the linked list.
 
@@ -74,53 +207,380 @@ class DoubleLinkedList(SingleLinkedList):
             data: Any data to store in the new node to insert.
 
         Returns:
-            None
+            The new node, which may be kept as a handle for remove_node, move_to_front and
+            move_to_back.
         """
+        self._unshare()
         new_node: DoubleLinkNode = DoubleLinkNode(data)
-        if self.is_empty:
-            self.head, self.tail = new_node, new_node
+        self._link_at_tail(new_node)
+        self._adjust_size(1)
+        return new_node
+
+    def _link_at_head(self, node: DoubleLinkNode) -> None:
+        """
+        Link the given (unlinked) node at the head of the linked list.
+
+        Args:
+            node: The node to link.
+
+        Returns:
+            None
+        """
+        node.prev, node.next = None, self._head
+        if self._head is not None:
+            self._head.prev = node
+        else:
+            self.tail = node  # if the list was empty, the tail is also the head
+        self._head = node
+
+    def _link_at_tail(self, node: DoubleLinkNode) -> None:
+        """
+        Link the given (unlinked) node at the tail of the linked list.
+
+        Args:
+            node: The node to link.
+
+        Returns:
+            None
+        """
+        node.prev, node.next = self.tail, None
+        if node.prev is not None:
+            node.prev.next = node
+        else:
+            self._head = node  # if the list was empty, the head is also the tail
+        self.tail = node
+
+    def _unlink(self, node: DoubleLinkNode) -> None:
+        """
+        Unlink the given node from the linked list, and clear its links. The node must be in the
+        linked list; since checking that would take O(n) time, only the links around the node are
+        checked, in O(1), which detects a node that was already removed (every removal clears the
+        links of the removed nodes, and the neighbours of a removed node no longer link to it).
+
+        Args:
+            node: The node to unlink.
+
+        Returns:
+            None
+        """
+        if (node.prev is None and node is not self._head) or (
+            node.prev is not None and node.prev.next is not node
+        ):
+            raise ValueError("Node is not in this linked list.")
+        if (node.next is None and node is not self.tail) or (
+            node.next is not None and node.next.prev is not node
+        ):
+            raise ValueError("Node is not in this linked list.")
+
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev, node.next = None, None
+
+    def remove_node(self, node: DoubleLinkNode) -> None:
+        """
+        Remove the given node (e.g., a handle returned by insert_at_head or insert_at_tail) from
+        the linked list in O(1).
+
+        Args:
+            node: The node to remove.
+
+        Returns:
+            None
+        """
+        self._check_own_nodes()
+        self._unshare()
+        self._unlink(node)
+        self._adjust_size(-1)
+
+    def move_to_front(self, node: DoubleLinkNode) -> None:
+        """
+        Move the given node (e.g., a handle returned by insert_at_head or insert_at_tail) to the
+        head of the linked list in O(1).
+
+        Args:
+            node: The node to move.
+
+        Returns:
+            None
+        """
+        self._check_own_nodes()
+        self._unshare()
+        if node is not self._head:
+            self._unlink(node)
+            self._link_at_head(node)
+            self._adjust_size(0)  # only relinked
+
+    def move_to_back(self, node: DoubleLinkNode) -> None:
+        """
+        Move the given node (e.g., a handle returned by insert_at_head or insert_at_tail) to the
+        tail of the linked list in O(1).
+
+        Args:
+            node: The node to move.
+
+        Returns:
+            None
+        """
+        self._check_own_nodes()
+        self._unshare()
+        if node is not self.tail:
+            self._unlink(node)
+            self._link_at_tail(node)
+            self._adjust_size(0)  # only relinked
+
+    def splice(self, other: "DoubleLinkedList", at: Union[None, int] = None) -> None:
+        """
+        Move all the nodes of the other linked list into this one, before the given index (or at
+        the tail), leaving the other linked list empty. The nodes are not copied; the two chains
+        are relinked, so this is O(1) at either end of the linked list, and otherwise only the
+        node at the index must be located.
+
+        Args:
+            other: The linked list whose nodes to move.
+            at: The index to move the nodes to, or None for the tail.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        if other is self:
+            raise ValueError("Cannot splice a linked list into itself.")
+        if not isinstance(other, DoubleLinkedList):
+            raise TypeError(
+                f"Cannot splice a {type(other).__name__} into a {type(self).__name__}."
+            )
+        self._unshare()
+        other._unshare()
+
+        size: int = self.size
+        if at is None:
+            at = size
+        if at < 0:
+            raise IndexError("Index must be non-negative.")
+        if at > size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {at} does not exist for {type(self).__name__} of size {size}."
+            )
+        if other.is_empty:
             return
 
-        self.tail.next = new_node
-        new_node.prev = self.tail
-        self.tail = new_node
+        first_node: DoubleLinkNode = other._head
+        last_node: DoubleLinkNode = other.tail
+        count: int = other.size
+        successor: Union[None, DoubleLinkNode] = (
+            None if at == size else self._node_at(at)
+        )
+        predecessor: Union[None, DoubleLinkNode] = (
+            self.tail if successor is None else successor.prev
+        )
+        first_node.prev, last_node.next = predecessor, successor
+        if predecessor is None:
+            self._head = first_node
+        else:
+            predecessor.next = first_node
+        if successor is None:
+            self.tail = last_node
+        else:
+            successor.prev = last_node
+        self._adjust_size(count)
+
+        other._head, other.tail = None, None
+        other._adjust_size(-count)
+
+    def concat(self, other: "DoubleLinkedList") -> None:
+        """
+        Move all the nodes of the other linked list to the tail of this one in O(1), leaving the
+        other linked list empty.
+
+        Args:
+            other: The linked list whose nodes to move.
+
+        Returns:
+            None
+        """
+        self.splice(other)
+
+    def __iadd__(self, other: Iterable[object]) -> "DoubleLinkedList":
+        """
+        Add the contents of the given iterable at the tail of the linked list, e.g.,
+        linked_list += other. If the iterable is a DoubleLinkedList, its nodes are moved (leaving
+        it empty) in O(1), as with concat; otherwise, new nodes are created, as with extend.
+
+        Args:
+            other: The linked list or iterable to add.
+
+        Returns:
+            This linked list.
+        """
+        if isinstance(other, DoubleLinkedList):
+            self.concat(other)
+        else:
+            self.extend(other)
+        return self
+
+    def split_at(self, index: int) -> "DoubleLinkedList":
+        """
+        Split the linked list in two at the given index: the nodes from the index onwards are
+        moved (not copied) to a new linked list of the same type, and this linked list keeps the
+        nodes before the index. Once the node at the index is located, this is O(1).
+
+        Args:
+            index: The index of the first node to move to the new linked list.
+
+        Returns:
+            The new linked list, holding the nodes from the index onwards.
+        """
+        # pylint: disable=protected-access
+        self._unshare()
+        size: int = self.size
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+        if index > size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {size}."
+            )
+
+        rest = type(self)()
+        if index == size:
+            return rest
+
+        first_node: DoubleLinkNode = self._node_at(index)
+        rest._head, rest.tail = first_node, self.tail
+        rest._adjust_size(size - index)
+
+        self.tail = first_node.prev
+        if self.tail is None:
+            self._head = None
+        else:
+            self.tail.next = None
+        first_node.prev = None
+        self._adjust_size(index - size)
+        return rest
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new node at the tail of the linked list for each item in the given iterable,
+        preserving their order. The new nodes are linked to one another in a single pass and then
+        attached to the tail, so this is O(k) for k items.
+
+        Args:
+            iterable: The data to store in the new nodes to insert.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        first_node: Union[None, DoubleLinkNode] = None
+        last_node: Union[None, DoubleLinkNode] = None
+        count: int = 0
+        for data in iterable:
+            new_node = DoubleLinkNode(data)
+            if last_node is None:
+                first_node = new_node
+            else:
+                last_node.next = new_node
+                new_node.prev = last_node
+            last_node = new_node
+            count += 1
+
+        if first_node is None:  # nothing to insert
+            return
+
+        if self.tail is None:
+            self._head = first_node
+        else:
+            self.tail.next = first_node
+            first_node.prev = self.tail
+        self.tail = last_node
+        self._adjust_size(count)
 
     def remove_at_tail(self) -> None:
+        self._unshare()
         # base case of empty list
-        if self.head is None:
+        if self._head is None:
             return
 
-        self.tail = self.tail.prev
+        self._adjust_size(-1)
+        removed: DoubleLinkNode = self.tail
+        self.tail = removed.prev
+        removed.prev = None
         if self.tail is not None:
             self.tail.next = None
         else:
             # if the tail is None, the list is empty
-            self.head = None
+            self._head = None
+
+    def _node_at(self, index: int) -> Union[None, DoubleLinkNode]:
+        """
+        Get the node at the given non-negative index in the linked list. The walk starts from
+        whichever is closest to the index: the head, the tail (following the prev links), or the
+        last node located by index (if there has been no structural modification since), so
+        sequential and nearby accesses are amortized O(1).
+
+        Args:
+            index: The index of the node to get.
+
+        Returns:
+            The node at the given index, or None if the index is out of bounds.
+        """
+        self._unshare()  # the caller may modify the node (see SingleLinkedList._node_at)
+        size: int = self.size
+        if index >= size:
+            return None
+
+        position, node = 0, self._head
+        if size - 1 - index < index:
+            position, node = size - 1, self.tail
+        cached = self._cached_position
+        if (
+            cached is not None
+            and cached[0] == self._version
+            and abs(index - cached[1]) < abs(index - position)
+        ):
+            _, position, node = cached
 
-    def insert_at_index(self, data: object, index: int) -> None:
+        for _ in range(index - position):
+            node = node.next
+        for _ in range(position - index):
+            node = node.prev
+        self._cached_position = (self._version, index, node)
+        return node
+
+    def insert_at_index(self, data: object, index: int) -> DoubleLinkNode:
+        self._unshare()
         if index < 0:
             raise IndexError("Index must be non-negative.")
 
         if index == 0:
-            self.insert_at_head(data)
-            return
+            return self.insert_at_head(data)
 
-        for idx, node in enumerate(self):
-            if idx == index - 1:
-                new_node = DoubleLinkNode(data)
-                new_node.next = node.next
-                new_node.prev = node
-                if node.next is not None:
-                    node.next.prev = new_node
-                node.next = new_node
-                return
-
-        # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
-        raise IndexError(
-            f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
-        )
+        if index == self.size:
+            return self.insert_at_tail(data)
+
+        successor: Union[None, DoubleLinkNode] = self._node_at(index)
+        if successor is None:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        new_node = DoubleLinkNode(data)
+        new_node.prev, new_node.next = successor.prev, successor
+        successor.prev.next = new_node
+        successor.prev = new_node
+        self._adjust_size(1)
+        return new_node
 
     def remove_at_index(self, index: int) -> None:
+        self._unshare()
         if index < 0:
             raise IndexError("Index must be non-negative.")
 
@@ -128,15 +588,17 @@ class DoubleLinkedList(SingleLinkedList):
             self.remove_at_head()
             return
 
-        for idx, node in enumerate(self):
-            if idx == index - 1:
-                if node.next is not None:
-                    node.next = node.next.next
-                    if node.next is not None:
-                        node.next.prev = node
-                    return
-
-        # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
-        raise IndexError(
-            f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
-        )
+        removed: Union[None, DoubleLinkNode] = self._node_at(index)
+        if removed is None:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        removed.prev.next = removed.next
+        if removed.next is not None:
+            removed.next.prev = removed.prev
+        else:
+            self.tail = removed.prev  # removed the last node
+        removed.prev, removed.next = None, None
+        self._adjust_size(-1)
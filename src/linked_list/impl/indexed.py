@@ -0,0 +1,413 @@
+"""
+This module contains the IndexedLinkedList class that represents a doubly linked list with a hash
+index from each stored value to the nodes storing it.
+"""
+
+from typing import Callable, Dict, Iterable, Union
+
+# these are the custom classes that we will use in the linked list
+from node.impl import DoubleLinkNode
+from linked_list.impl.double import DoubleLinkedList
+
+
+class IndexedLinkedList(DoubleLinkedList):
+    """
+    A doubly linked list that also keeps a dict from each stored value to the nodes storing it
+    (keyed by the data itself, so values are matched the same way as Node.__hash__ and Node.__eq__
+    match them). Every insertion, removal and assignment through the linked list keeps the index
+    up to date, so membership tests and counts are O(1), and finding or removing a value is O(1)
+    when the value is stored only once. The stored data must therefore be hashable.
+
+    If the linked list is structurally modified in a way the index cannot follow (e.g., through a
+    cursor, or by assigning the head directly), the index is rebuilt in O(n) the next time it is
+    used. Assigning to the data attribute of a node directly is not detected; use item assignment
+    (e.g., linked_list[0] = 5) or a cursor instead. If a node is found indexed under other data
+    than it stores, the index is discarded and rebuilt the next time it is used.
+
+    An object of IndexedLinkedList can be compared to other linked lists for equality, inequality,
+    less than, less than or equal to, greater than, greater than or equal to, and hashed.
+    """
+
+    def __init__(self, *args) -> None:
+        # order matters here, *args are indexed as they are inserted
+        self._nodes_by_value: Dict[object, Dict[int, DoubleLinkNode]] = {}
+        # the version of the linked list the index describes
+        self._index_version: int = 0
+        # whether the index was found not to describe the linked list during a modification
+        self._index_stale: bool = False
+        super().__init__(*args)
+
+    def _index_add(self, node: DoubleLinkNode) -> None:
+        """
+        Add the given node to the index.
+
+        Args:
+            node: The node to add.
+
+        Returns:
+            None
+        """
+        nodes = self._nodes_by_value.get(node.data)
+        if nodes is None:
+            nodes = self._nodes_by_value[node.data] = {}
+        nodes[id(node)] = node
+
+    def _index_discard(self, node: DoubleLinkNode) -> None:
+        """
+        Remove the given node from the index. If the node is not indexed under its data (e.g.,
+        its data was assigned directly), the index is marked stale instead, so that it is rebuilt
+        the next time it is used.
+
+        Args:
+            node: The node to remove.
+
+        Returns:
+            None
+        """
+        nodes = self._nodes_by_value.get(node.data)
+        if nodes is None or nodes.pop(id(node), None) is None:
+            self._index_stale = True
+            return
+        if not nodes:
+            del self._nodes_by_value[node.data]
+
+    def _synced(self) -> None:
+        """
+        Record that the index describes the current version of the linked list, unless it was
+        found stale while it was updated. This must be called after each structural modification
+        that updated the index.
+
+        Returns:
+            None
+        """
+        self._index_version = -1 if self._index_stale else self._version
+        self._index_stale = False
+
+    def _nodes_of(self, value: object) -> Dict[int, DoubleLinkNode]:
+        """
+        Get the nodes storing the given value, rebuilding the index first if it is stale.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The nodes storing the value, keyed by their id (empty if there are none).
+        """
+        if self._index_version != self._version:
+            self._nodes_by_value = {}
+            for node in self._chain():
+                self._index_add(node)
+            self._synced()
+        return self._nodes_by_value.get(value, {})
+
+    def _first_of(self, value: object) -> Union[None, DoubleLinkNode]:
+        """
+        Get the first node storing the given value. If the value is stored only once, this is
+        O(1); otherwise, the linked list is walked up to the first such node.
+
+        Args:
+            value: The value to look up.
+
+        Returns:
+            The first node storing the value, or None if there is none.
+        """
+        nodes = self._nodes_of(value)
+        if len(nodes) == 1:
+            return next(iter(nodes.values()))
+        for node in self._chain():
+            if id(node) in nodes:
+                return node
+        return None
+
+    def _set_head(self, node: Union[None, DoubleLinkNode]) -> None:
+        """
+        Make the given node the head of the linked list. The stored size and the index are
+        discarded, and will be rebuilt the next time they are requested.
+
+        Args:
+            node: The node to use as the new head of the linked list.
+
+        Returns:
+            None
+        """
+        super()._set_head(node)
+        self._nodes_by_value = {}
+
+    def _replace_chain(
+        self,
+        first_node: Union[None, DoubleLinkNode],
+        last_node: Union[None, DoubleLinkNode],
+        size: int,
+    ) -> None:
+        """
+        Replace the chain of nodes of the linked list with the given chain, holding the same data
+        (see SingleLinkedList._replace_chain). The index refers to the old nodes, so it is
+        discarded, and will be rebuilt the next time it is used.
+
+        Args:
+            first_node: The first node of the new chain.
+            last_node: The last node of the new chain.
+            size: The number of nodes in the new chain.
+
+        Returns:
+            None
+        """
+        super()._replace_chain(first_node, last_node, size)
+        self._nodes_by_value = {}
+        self._index_version = -1  # never a version of the linked list
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Check if any node in the linked list stores data equal to the given value, in O(1).
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            True if the value is in the linked list, False otherwise.
+        """
+        return bool(self._nodes_of(value))
+
+    def count(self, value: object) -> int:
+        """
+        Count the nodes in the linked list that store data equal to the given value, in O(1).
+
+        Args:
+            value: The value to count.
+
+        Returns:
+            The number of nodes storing the value.
+        """
+        return len(self._nodes_of(value))
+
+    def index(self, value: object) -> int:
+        """
+        Get the index of the first node in the linked list that stores data equal to the given
+        value. A value that is not in the linked list is rejected in O(1).
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            The index of the first node storing the value.
+        """
+        nodes = self._nodes_of(value)
+        if nodes:
+            for idx, node in enumerate(self):
+                if id(node) in nodes:
+                    return idx
+        raise ValueError(f"{value!r} is not in {type(self).__name__}.")
+
+    def remove(self, value: object) -> None:
+        """
+        Remove the first node in the linked list that stores data equal to the given value. This
+        is O(1) if the value is stored only once.
+
+        Args:
+            value: The value to remove.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        node: Union[None, DoubleLinkNode] = self._first_of(value)
+        if node is None:
+            raise ValueError(f"{value!r} is not in {type(self).__name__}.")
+        self.remove_node(node)
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Set the data of the node at the given index (or the nodes in the given slice) of the
+        linked list, and update the index accordingly.
+
+        Args:
+            key: The index (or slice) of the node(s) to set.
+            value: The data to set the node(s) to.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        if isinstance(key, slice):
+            nodes, values = self._slice_nodes(key), value
+        else:
+            nodes, values = [self[key]], [value]
+        for value_idx, node in enumerate(nodes):
+            self._set_data(node, values[value_idx])
+
+    def _set_data(self, node: DoubleLinkNode, value: object) -> None:
+        """
+        Set the data of the given node of the linked list (e.g., for a cursor), and update the
+        index accordingly.
+
+        Args:
+            node: The node whose data to set.
+            value: The data to set the node to.
+
+        Returns:
+            None
+        """
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        self._index_discard(node)
+        node.data = value
+        self._index_add(node)
+        self._synced()
+
+    def __delitem__(self, key) -> None:
+        """
+        Delete the node at the given index (or the nodes in the given slice) of the linked list,
+        and update the index accordingly.
+
+        Args:
+            key: The index (or slice) of the node(s) to delete.
+
+        Returns:
+            None
+        """
+        if not isinstance(key, slice):
+            super().__delitem__(key)  # this is handled by remove_at_index
+            return
+
+        self._unshare()
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        for node in self._slice_nodes(key):
+            self._index_discard(node)
+        super().__delitem__(key)
+        self._synced()
+
+    def insert_at_head(self, data: object) -> DoubleLinkNode:
+        """
+        Insert a new node with the given data at the head of the linked list.
+
+        Args:
+            data: Any (hashable) data to store in the new node to insert.
+
+        Returns:
+            The new node, which may be kept as a handle for remove_node, move_to_front and
+            move_to_back.
+        """
+        self._unshare()
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        new_node: DoubleLinkNode = super().insert_at_head(data)
+        self._index_add(new_node)
+        self._synced()
+        return new_node
+
+    def insert_at_tail(self, data: object) -> DoubleLinkNode:
+        """
+        Insert a new node with the given data at the tail of the linked list.
+
+        Args:
+            data: Any (hashable) data to store in the new node to insert.
+
+        Returns:
+            The new node, which may be kept as a handle for remove_node, move_to_front and
+            move_to_back.
+        """
+        self._unshare()
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        new_node: DoubleLinkNode = super().insert_at_tail(data)
+        self._index_add(new_node)
+        self._synced()
+        return new_node
+
+    def insert_at_index(self, data: object, index: int) -> DoubleLinkNode:
+        self._unshare()
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        new_node: DoubleLinkNode = super().insert_at_index(data, index)
+        self._index_add(new_node)
+        self._synced()
+        return new_node
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new node at the tail of the linked list for each item in the given iterable,
+        preserving their order, and add the new nodes to the index.
+
+        Args:
+            iterable: The (hashable) data to store in the new nodes to insert.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        last_node: Union[None, DoubleLinkNode] = self.tail
+        super().extend(iterable)
+        node = self._head if last_node is None else last_node.next
+        while node is not None:
+            self._index_add(node)
+            node = node.next
+        self._synced()
+
+    def remove_node(self, node: DoubleLinkNode) -> None:
+        """
+        Remove the given node (e.g., a handle returned by insert_at_head or insert_at_tail) from
+        the linked list and the index in O(1).
+
+        Args:
+            node: The node to remove.
+
+        Returns:
+            None
+        """
+        self._check_own_nodes()
+        self._unshare()
+        self._nodes_of(None)  # make sure the index is up to date before changing it
+        super().remove_node(node)
+        self._index_discard(node)
+        self._synced()
+
+    def move_to_front(self, node: DoubleLinkNode) -> None:
+        synced: bool = self._index_version == self._version
+        super().move_to_front(node)
+        if synced:  # moving a node does not change the index
+            self._synced()
+
+    def move_to_back(self, node: DoubleLinkNode) -> None:
+        synced: bool = self._index_version == self._version
+        super().move_to_back(node)
+        if synced:  # moving a node does not change the index
+            self._synced()
+
+    def sort(
+        self, key: Union[None, Callable[[object], object]] = None, reverse: bool = False
+    ) -> None:
+        self._unshare()
+        synced: bool = self._index_version == self._version
+        super().sort(key=key, reverse=reverse)
+        if synced:  # sorting only relinks the nodes, so the index does not change
+            self._synced()
+
+    def reverse(self) -> None:
+        self._unshare()
+        synced: bool = self._index_version == self._version
+        super().reverse()
+        if synced:  # reversing only relinks the nodes, so the index does not change
+            self._synced()
+
+    def remove_at_head(self) -> None:
+        self._unshare()
+        if self._head is not None:
+            self.remove_node(self._head)
+
+    def remove_at_tail(self) -> None:
+        self._unshare()
+        if self._head is not None:
+            self.remove_node(self.tail)
+
+    def remove_at_index(self, index: int) -> None:
+        self._unshare()
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        node: Union[None, DoubleLinkNode] = self._node_at(index)
+        if node is None:
+            if index == 0:  # removing from an empty list is a no-op
+                return
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+        self.remove_node(node)
@@ -0,0 +1,799 @@
+"""
+This module contains the MappedLinkedList class that represents a doubly linked list whose nodes
+are fixed-size records in a memory-mapped file, so that the linked list can be larger than memory
+and can be reopened later.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import BinaryIO, Dict, Union
+
+# these are the custom classes that we will use in the linked list
+from node.abstract import Node
+from linked_list.abstract import LinkedList
+
+NULL: int = 0  # the offset used in place of a missing link (the header is at offset 0)
+MAGIC: bytes = b"LLMMAP\x00\x01"  # identifies (and versions) the file format
+DEFAULT_RECORD_SIZE: int = 64
+INITIAL_RECORDS: int = 64  # the number of records a new (or emptied) file has room for
+
+# magic, record size, end of the used records, first, last, first free record, size
+_HEADER: struct.Struct = struct.Struct("<8s6q")
+HEADER_SIZE: int = 64  # the header is padded, so the records are aligned
+# the next and prev offsets, the length of the pickled payload, and its first overflow record
+_RECORD: struct.Struct = struct.Struct("<4q")
+_LINK: struct.Struct = struct.Struct("<q")
+_PAYLOAD: struct.Struct = struct.Struct("<2q")
+
+
+class MappedLinkNode(Node):  # pylint: disable=too-few-public-methods
+    """
+    A lightweight handle to a record of a MappedLinkedList. The handle does not store any data or
+    links itself; reading its data unpickles the payload stored in the record, and writing its data
+    pickles the new data into the record. Its next and prev attributes are handles to the
+    neighbouring records (or None).
+
+    Since the data is unpickled on every read, modifying a mutable object read from a handle does
+    not modify the linked list; the modified object must be written back (e.g., node.data = obj).
+
+    Handles are created on demand (e.g., during iteration), so two handles to the same record are
+    equal but not identical. A handle to a record that has since been removed is no longer
+    meaningful, as the record may be reused by a later insertion.
+
+    Attributes:
+        data: The data stored in the record.
+        next: A handle to the record after this one in the linked list.
+        prev: A handle to the record before this one in the linked list.
+    """
+
+    __slots__ = ("linked_list", "offset")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, linked_list: "MappedLinkedList", offset: int
+    ) -> None:
+        self.linked_list: MappedLinkedList = linked_list
+        self.offset: int = offset
+
+    @property
+    def data(self) -> object:
+        """
+        Get the data stored in the record.
+
+        Returns:
+            The data stored in the record.
+        """
+        return self.linked_list._load(self.offset)  # pylint: disable=protected-access
+
+    @data.setter
+    def data(self, value: object) -> None:
+        """
+        Set the data stored in the record.
+
+        Args:
+            value: The data to store in the record.
+
+        Returns:
+            None
+        """
+        self.linked_list._replace(  # pylint: disable=protected-access
+            self.offset, value
+        )
+
+    @property
+    def next(self) -> Union[None, "MappedLinkNode"]:
+        """
+        Get a handle to the record after this one in the linked list.
+
+        Returns:
+            A handle to the next record, or None if this is the last record.
+        """
+        return self.linked_list._node(  # pylint: disable=protected-access
+            self.linked_list._next(self.offset)  # pylint: disable=protected-access
+        )
+
+    @property
+    def prev(self) -> Union[None, "MappedLinkNode"]:
+        """
+        Get a handle to the record before this one in the linked list.
+
+        Returns:
+            A handle to the previous record, or None if this is the first record.
+        """
+        return self.linked_list._node(  # pylint: disable=protected-access
+            self.linked_list._prev(self.offset)  # pylint: disable=protected-access
+        )
+
+
+class MappedLinkedList(LinkedList):  # pylint: disable=too-many-instance-attributes
+    """
+    A doubly linked list stored in a memory-mapped file. The file starts with a header (the head,
+    tail, size and free list of the linked list), followed by fixed-size records. Each element
+    occupies a record holding the offsets of its next and previous records and its data, pickled.
+    A payload that does not fit in its record continues in a chain of overflow records, so any
+    picklable data can be stored, and small payloads need no extra record.
+
+    Only the records being accessed are paged into memory, so the linked list can be larger than
+    the available memory. Removed records (and their overflow records) are pushed onto a free list,
+    threaded through the records, and are reused by later insertions; the file grows by doubling
+    when no free record is left, and shrinks back when the linked list becomes empty.
+
+    Every modification updates the header, so the file always describes the linked list: calling
+    flush writes it to disk, and opening the same path later reuses the records as they are, in
+    O(1), rather than rebuilding the linked list. A file must not be opened by two linked lists at
+    once. If no path is given, an anonymous temporary file is used.
+
+    The linked list may be iterated over to access each element in the list; iteration yields
+    MappedLinkNode handles, so the interface is the same as for the other linked lists.
+
+    An object of MappedLinkedList can be compared to other linked lists for equality, inequality,
+    less than, less than or equal to, greater than, greater than or equal to, and hashed.
+    """
+
+    def __init__(
+        self,
+        *args,
+        path: Union[None, str, os.PathLike] = None,
+        record_size: Union[None, int] = None,
+    ) -> None:
+        if path is None:
+            self._file: BinaryIO = tempfile.TemporaryFile()
+        else:
+            self._file = os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT), "r+b")
+        self.path: Union[None, str, os.PathLike] = path
+        # order matters here, these are set by formatting the file or reading its header; the
+        # header fields are mirrored in attributes (hence the many instance attributes), so
+        # that the header is only written, never read, by the modifications
+        self._map: Union[None, mmap.mmap] = None
+        self.record_size: int = DEFAULT_RECORD_SIZE
+        # the offsets of the head, the tail, and the first record of the free list
+        self._first: int = NULL
+        self._last: int = NULL
+        self._free: int = NULL
+        self._end: int = HEADER_SIZE  # the offset after the last record ever used
+
+        length: int = os.fstat(self._file.fileno()).st_size
+        try:
+            if length == 0:
+                self._format(record_size)
+            else:
+                self._map = mmap.mmap(self._file.fileno(), length)
+                self._open(record_size)
+        except BaseException:
+            self.close()
+            raise
+
+        size: int = self._size
+        super().__init__()  # *args are inserted after the records already in the file
+        self._size = size
+        self.extend(args)
+
+    def _format(self, record_size: Union[None, int]) -> None:
+        """
+        Write an empty linked list to the (empty) file.
+
+        Args:
+            record_size: The size of each record in bytes, or None for the default size.
+
+        Returns:
+            None
+        """
+        if record_size is None:
+            record_size = DEFAULT_RECORD_SIZE
+        if record_size < _RECORD.size + _LINK.size:
+            raise ValueError(
+                f"The size of a record must be at least {_RECORD.size + _LINK.size} bytes."
+            )
+        self.record_size = record_size
+        length: int = HEADER_SIZE + INITIAL_RECORDS * record_size
+        self._file.truncate(length)
+        self._map = mmap.mmap(self._file.fileno(), length)
+        self._first = self._last = self._free = NULL
+        self._end = HEADER_SIZE
+        self._size = 0
+        self._write_header()
+
+    def _open(self, record_size: Union[None, int]) -> None:
+        """
+        Read the header of an existing file, so the linked list it holds can be used as it is.
+
+        Args:
+            record_size: The expected size of each record in bytes, or None to accept any size.
+
+        Returns:
+            None
+        """
+        if len(self._map) < HEADER_SIZE:
+            raise ValueError(f"{self.path} is not a {type(self).__name__} file.")
+        (
+            magic,
+            self.record_size,
+            self._end,
+            self._first,
+            self._last,
+            self._free,
+            self._size,
+        ) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a {type(self).__name__} file.")
+        if record_size is not None and record_size != self.record_size:
+            raise ValueError(
+                f"{self.path} has records of {self.record_size} bytes, not {record_size}."
+            )
+
+    def _write_header(self) -> None:
+        """
+        Write the bookkeeping of the linked list to the header of the file.
+
+        Returns:
+            None
+        """
+        _HEADER.pack_into(
+            self._map,
+            0,
+            MAGIC,
+            self.record_size,
+            self._end,
+            self._first,
+            self._last,
+            self._free,
+            self._size,
+        )
+
+    def _adjust_size(self, delta: int) -> None:
+        super()._adjust_size(delta)
+        self._write_header()
+
+    def _resize(self, length: int) -> None:
+        """
+        Resize the file to the given length in bytes, and map it again.
+
+        Args:
+            length: The new length of the file.
+
+        Returns:
+            None
+        """
+        self._map.close()
+        self._file.truncate(length)
+        self._map = mmap.mmap(self._file.fileno(), length)
+
+    def flush(self) -> None:
+        """
+        Write the changes made to the linked list to the file on disk.
+
+        Returns:
+            None
+        """
+        self._map.flush()
+
+    def close(self) -> None:
+        """
+        Flush the linked list and close its file. The linked list must not be used afterwards. An
+        anonymous temporary file is deleted.
+
+        Returns:
+            None
+        """
+        if self._map is not None and not self._map.closed:
+            self._map.flush()
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedLinkedList":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, object]:
+        """
+        Get the state of the linked list to pickle: the data of its records as a single flat list,
+        and the size of its records. The linked list is unpickled into an anonymous temporary file.
+
+        Returns:
+            The state of the linked list.
+        """
+        state: Dict[str, object] = super().__getstate__()
+        state["record_size"] = self.record_size
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """
+        Restore the state of an unpickled (empty) linked list, formatting its file for records of
+        the pickled size before inserting the data.
+
+        Args:
+            state: The state of the linked list, as returned by __getstate__.
+
+        Returns:
+            None
+        """
+        self._map.close()
+        self._file.truncate(0)
+        self._format(state["record_size"])
+        super().__setstate__(state)
+
+    def copy(self) -> "MappedLinkedList":
+        """
+        Get a shallow copy of the linked list, with records of the same size, in an anonymous
+        temporary file. The data is copied one record at a time, rather than through a list
+        holding all of it, so the linked list does not need to fit in memory.
+
+        Returns:
+            A new linked list holding the same data.
+        """
+        duplicate: MappedLinkedList = type(self)(record_size=self.record_size)
+        duplicate.extend(self.values())
+        return duplicate
+
+    def _next(self, offset: int) -> int:
+        """
+        Get the offset of the record after the given one.
+
+        Args:
+            offset: The offset of the record.
+
+        Returns:
+            The offset of the next record, or NULL.
+        """
+        return _LINK.unpack_from(self._map, offset)[0]
+
+    def _prev(self, offset: int) -> int:
+        """
+        Get the offset of the record before the given one.
+
+        Args:
+            offset: The offset of the record.
+
+        Returns:
+            The offset of the previous record, or NULL.
+        """
+        return _LINK.unpack_from(self._map, offset + 8)[0]
+
+    def _set_next(self, offset: int, next_offset: int) -> None:
+        """
+        Link the given record to the next one.
+
+        Args:
+            offset: The offset of the record.
+            next_offset: The offset of the next record, or NULL.
+
+        Returns:
+            None
+        """
+        _LINK.pack_into(self._map, offset, next_offset)
+
+    def _set_prev(self, offset: int, prev_offset: int) -> None:
+        """
+        Link the given record to the previous one.
+
+        Args:
+            offset: The offset of the record.
+            prev_offset: The offset of the previous record, or NULL.
+
+        Returns:
+            None
+        """
+        _LINK.pack_into(self._map, offset + 8, prev_offset)
+
+    def _node(self, offset: int) -> Union[None, MappedLinkNode]:
+        """
+        Get a handle to the given record.
+
+        Args:
+            offset: The offset of the record to get a handle to.
+
+        Returns:
+            A handle to the record, or None if the offset is NULL.
+        """
+        if offset == NULL:
+            return None
+        return MappedLinkNode(self, offset)
+
+    def _take_record(self) -> int:
+        """
+        Get an unused record, reusing one from the free list if one is available, or taking the
+        next record of the file otherwise (growing the file if it is full).
+
+        Returns:
+            The offset of the record.
+        """
+        offset: int = self._free
+        if offset != NULL:
+            self._free = self._next(offset)
+            return offset
+
+        offset = self._end
+        self._end += self.record_size
+        if self._end > len(self._map):
+            self._resize(max(2 * len(self._map), self._end))
+        return offset
+
+    def _free_records(self, offset: int) -> None:
+        """
+        Push the given chain of records (linked by their next offsets) onto the free list.
+
+        Args:
+            offset: The offset of the first record of the chain, or NULL.
+
+        Returns:
+            None
+        """
+        while offset != NULL:
+            next_offset: int = self._next(offset)
+            self._set_next(offset, self._free)
+            self._free = offset
+            offset = next_offset
+
+    @staticmethod
+    def _dumps(data: object) -> bytes:
+        """
+        Pickle the given data, to store it in a record. This is done before any record is taken,
+        so data that cannot be pickled leaves the file unchanged.
+
+        Args:
+            data: The data to pickle.
+
+        Returns:
+            The pickled data.
+        """
+        if isinstance(data, Node):
+            raise ValueError(
+                "Cannot insert a Node object. "
+                "Insert the data instead if this was intended behavior."
+            )
+        return pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+    def _store(self, offset: int, payload: bytes) -> None:
+        """
+        Write the given pickled data into the given record, continuing in new overflow records if
+        it does not fit.
+
+        Args:
+            offset: The offset of the record.
+            payload: The pickled data to store in the record.
+
+        Returns:
+            None
+        """
+        inline: int = self.record_size - _RECORD.size
+        # the payload held by an overflow record
+        chunk: int = self.record_size - _LINK.size
+        first_overflow: int = NULL
+        last_overflow: int = NULL
+        for start in range(inline, len(payload), chunk):
+            overflow: int = self._take_record()  # this may map the file again
+            self._set_next(overflow, NULL)
+            part: bytes = payload[start : start + chunk]
+            self._map[overflow + _LINK.size : overflow + _LINK.size + len(part)] = part
+            if last_overflow == NULL:
+                first_overflow = overflow
+            else:
+                self._set_next(last_overflow, overflow)
+            last_overflow = overflow
+
+        part = payload[:inline]
+        self._map[offset + _RECORD.size : offset + _RECORD.size + len(part)] = part
+        _PAYLOAD.pack_into(self._map, offset + 16, len(payload), first_overflow)
+
+    def _load(self, offset: int) -> object:
+        """
+        Unpickle the data stored in the given record (and its overflow records).
+
+        Args:
+            offset: The offset of the record.
+
+        Returns:
+            The data stored in the record.
+        """
+        linked_map: mmap.mmap = self._map
+        length, overflow = _PAYLOAD.unpack_from(linked_map, offset + 16)
+        start: int = offset + _RECORD.size
+        if overflow == NULL:
+            return pickle.loads(linked_map[start : start + length])
+
+        parts = [linked_map[start : offset + self.record_size]]
+        remaining: int = length - len(parts[0])
+        chunk: int = self.record_size - _LINK.size
+        while overflow != NULL:
+            part_size: int = min(remaining, chunk)
+            parts.append(
+                linked_map[overflow + _LINK.size : overflow + _LINK.size + part_size]
+            )
+            remaining -= part_size
+            overflow = self._next(overflow)
+        return pickle.loads(b"".join(parts))
+
+    def _replace(self, offset: int, data: object) -> None:
+        """
+        Replace the data stored in the given record, releasing its old overflow records.
+
+        Args:
+            offset: The offset of the record.
+            data: The new data to store in the record.
+
+        Returns:
+            None
+        """
+        payload: bytes = self._dumps(data)
+        self._free_records(_PAYLOAD.unpack_from(self._map, offset + 16)[1])
+        self._store(offset, payload)
+        self._write_header()
+
+    def _allocate(self, data: object) -> int:
+        """
+        Get an unlinked record storing the given data.
+
+        Args:
+            data: The data to store in the record.
+
+        Returns:
+            The offset of the record.
+        """
+        payload: bytes = self._dumps(data)
+        offset: int = self._take_record()
+        _RECORD.pack_into(self._map, offset, NULL, NULL, 0, NULL)
+        self._store(offset, payload)
+        return offset
+
+    def _release(self, offset: int) -> None:
+        """
+        Push the given (already unlinked) record and its overflow records onto the free list. If
+        the linked list is now empty, the file is shrunk back to its initial size instead.
+
+        Args:
+            offset: The offset of the record to release.
+
+        Returns:
+            None
+        """
+        if self._first == NULL:
+            self._end, self._free = HEADER_SIZE, NULL
+            self._resize(HEADER_SIZE + INITIAL_RECORDS * self.record_size)
+            return
+
+        self._free_records(_PAYLOAD.unpack_from(self._map, offset + 16)[1])
+        self._set_next(offset, self._free)
+        self._free = offset
+
+    def _offset_at(self, index: int) -> int:
+        """
+        Get the offset of the record of the element at the given position in the linked list,
+        walking from whichever end is closer.
+
+        Args:
+            index: The position of the element, which must be in bounds.
+
+        Returns:
+            The offset of the record at the given position.
+        """
+        if index < self._size // 2:
+            curr: int = self._first
+            for _ in range(index):
+                curr = self._next(curr)
+            return curr
+
+        curr = self._last
+        for _ in range(self._size - 1 - index):
+            curr = self._prev(curr)
+        return curr
+
+    def _node_at(self, index: int) -> Union[None, MappedLinkNode]:
+        """
+        Get a handle to the element at the given non-negative index in the linked list.
+
+        Args:
+            index: The index of the element to get.
+
+        Returns:
+            A handle to the element at the given index, or None if the index is out of bounds.
+        """
+        if index >= self._size:
+            return None
+        return MappedLinkNode(self, self._offset_at(index))
+
+    @property
+    def head(self) -> Union[None, MappedLinkNode]:
+        """
+        Get a handle to the head of the linked list.
+
+        Returns:
+            A handle to the first record in the linked list, or None if the linked list is empty.
+        """
+        return self._node(self._first)
+
+    @head.setter
+    def head(self, node: Union[None, Node]) -> None:
+        """
+        Replace the contents of the linked list with the data of the chain of nodes starting at
+        the given node. Since the data are copied into the file, later changes to the given nodes
+        are not reflected in the linked list.
+
+        Args:
+            node: The first node of the chain to copy, or None to empty the linked list.
+
+        Returns:
+            None
+        """
+        data: list = []
+        while node is not None:
+            data.append(node.data)
+            node = node.next
+        self.clear()
+        self.extend(data)
+
+    @property
+    def tail(self) -> Union[None, MappedLinkNode]:
+        """
+        Get a handle to the tail of the linked list.
+
+        Returns:
+            A handle to the last record in the linked list, or None if the linked list is empty.
+        """
+        return self._node(self._last)
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Simple and efficient check to see if the linked list is empty.
+
+        Returns:
+            True if the linked list is empty, False otherwise.
+        """
+        return self._first == NULL
+
+    def __iter__(self) -> iter:
+        curr: int = self._first
+        while curr != NULL:
+            yield MappedLinkNode(self, curr)
+            curr = self._next(curr)
+
+    def values(self) -> iter:
+        """
+        Iterate over the data stored in each record of the linked list, in order, without creating
+        node handles.
+
+        Returns:
+            An iterator over the data stored in the linked list.
+        """
+        curr: int = self._first
+        while curr != NULL:
+            yield self._load(curr)
+            curr = self._next(curr)
+
+    def clear(self) -> None:
+        """
+        Remove every element from the linked list and shrink the file back to its initial size.
+
+        Returns:
+            None
+        """
+        self._first = self._last = self._free = NULL
+        self._end = HEADER_SIZE
+        self._resize(HEADER_SIZE + INITIAL_RECORDS * self.record_size)
+        self._adjust_size(-self._size)
+
+    def insert_at_head(self, data: object) -> None:
+        """
+        Insert a new element with the given data at the head of the linked list.
+
+        Args:
+            data: Any data to store in the new element to insert.
+
+        Returns:
+            None
+        """
+        offset: int = self._allocate(data)
+        self._set_next(offset, self._first)
+        if self._first != NULL:
+            self._set_prev(self._first, offset)
+        else:
+            self._last = offset  # if the list was empty, the tail is also the head
+        self._first = offset
+        self._adjust_size(1)
+
+    def remove_at_head(self) -> None:
+        """
+        Remove the element at the head of the linked list, if it exists.
+
+        Returns:
+            None
+        """
+        offset: int = self._first
+        if offset == NULL:
+            return
+
+        self._first = self._next(offset)
+        if self._first != NULL:
+            self._set_prev(self._first, NULL)
+        else:
+            self._last = NULL  # the only element was removed, so the list is empty
+        self._release(offset)
+        self._adjust_size(-1)
+
+    def insert_at_tail(self, data: object) -> None:
+        """
+        Insert a new element with the given data at the tail of the linked list.
+
+        Args:
+            data: Any data to store in the new element to insert.
+
+        Returns:
+            None
+        """
+        offset: int = self._allocate(data)
+        self._set_prev(offset, self._last)
+        if self._last != NULL:
+            self._set_next(self._last, offset)
+        else:
+            self._first = offset  # if the list was empty, the head is also the tail
+        self._last = offset
+        self._adjust_size(1)
+
+    def remove_at_tail(self) -> None:
+        offset: int = self._last
+        if offset == NULL:
+            return
+
+        self._last = self._prev(offset)
+        if self._last != NULL:
+            self._set_next(self._last, NULL)
+        else:
+            self._first = NULL  # the only element was removed, so the list is empty
+        self._release(offset)
+        self._adjust_size(-1)
+
+    def insert_at_index(self, data: object, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index == 0:
+            self.insert_at_head(data)
+            return
+
+        if index > self._size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        if index == self._size:
+            self.insert_at_tail(data)
+            return
+
+        successor: int = self._offset_at(index)
+        predecessor: int = self._prev(successor)
+        offset: int = self._allocate(data)
+        self._set_prev(offset, predecessor)
+        self._set_next(offset, successor)
+        self._set_next(predecessor, offset)
+        self._set_prev(successor, offset)
+        self._adjust_size(1)
+
+    def remove_at_index(self, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index == 0:
+            self.remove_at_head()
+            return
+
+        if index >= self._size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        if index == self._size - 1:
+            self.remove_at_tail()
+            return
+
+        removed: int = self._offset_at(index)
+        predecessor, successor = self._prev(removed), self._next(removed)
+        self._set_next(predecessor, successor)
+        self._set_prev(successor, predecessor)
+        self._release(removed)
+        self._adjust_size(-1)
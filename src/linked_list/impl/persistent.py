@@ -0,0 +1,417 @@
+"""
+This module contains the PersistentLinkedList class that represents a singly linked list whose
+nodes are never modified once linked, so that any number of versions of the list can share them.
+"""
+
+from typing import Dict, Iterable, Tuple, Union
+
+# these are the custom classes that we will use in the linked list
+from node.abstract import Node
+from node.impl import SingleLinkNode
+from linked_list.abstract import LinkedList
+
+
+class PersistentLinkedList(LinkedList):
+    """
+    A persistent singly linked list. Its nodes are immutable once linked: instead of relinking or
+    updating a node, every modification copies the nodes before the modified position (path
+    copying) and shares the unchanged rest of the chain. A PersistentLinkedList object is
+    therefore a reference to one version of the list, and older versions (e.g., snapshots handed
+    to readers) are never affected by later modifications.
+
+    Taking a snapshot, prepending (cons) and taking the rest (cdr) are O(1). Inserting, removing
+    or setting the data at index i is O(i) time and memory, and modifying the tail is O(n); the
+    nodes after the modified position are shared, not copied.
+
+    The nodes returned by indexing or iteration are shared between versions, so their data must
+    not be assigned directly (assign through the linked list, e.g., linked_list[i] = value).
+    """
+
+    def __init__(self, *args) -> None:
+        self._tail: Union[None, SingleLinkNode] = (
+            None  # order matters here, *args may define tail
+        )
+        super().__init__(*args)
+
+    @property
+    def tail(self) -> Union[None, SingleLinkNode]:
+        """
+        Get the tail node of the linked list.
+
+        Returns:
+            The last node in the linked list, or None if the linked list is empty.
+        """
+        if (
+            self._size is None
+        ):  # the head was assigned directly, so the tail must be found again
+            self._recount()
+        return self._tail
+
+    def _recount(self) -> None:
+        """
+        Walk the chain of nodes to recover both the size and the tail of the linked list.
+
+        Returns:
+            None
+        """
+        size: int = 0
+        last_node: Union[None, SingleLinkNode] = None
+        for last_node in self:
+            size += 1
+        self._size, self._tail = size, last_node
+
+    def snapshot(self) -> "PersistentLinkedList":
+        """
+        Get a snapshot of the current version of the linked list, in O(1). The snapshot shares
+        every node with the linked list, and neither is affected by modifications of the other.
+
+        Returns:
+            A new linked list holding the current version.
+        """
+        return self._version_of(self._head, self._size, self._tail)
+
+    def copy(self) -> "PersistentLinkedList":
+        """
+        Get a shallow copy of the linked list, which is a snapshot (see snapshot).
+
+        Returns:
+            A new linked list holding the current version.
+        """
+        return self.snapshot()
+
+    def prepend(self, data: object) -> "PersistentLinkedList":
+        """
+        Get a new linked list holding the given data followed by the data of this linked list
+        (i.e., cons), in O(1). This linked list is left unchanged, and its nodes are shared.
+
+        Args:
+            data: Any data to store in the new head node.
+
+        Returns:
+            A new linked list with the data prepended.
+        """
+        new_node: SingleLinkNode = self._new_node(data)
+        new_node.next = self._head
+        return self._version_of(
+            new_node,
+            None if self._size is None else self._size + 1,
+            new_node if self._head is None else self._tail,
+        )
+
+    def rest(self) -> "PersistentLinkedList":
+        """
+        Get a new linked list holding the data of this linked list after the head (i.e., cdr),
+        in O(1). This linked list is left unchanged, and its nodes are shared.
+
+        Returns:
+            A new linked list without the head of this one.
+        """
+        if self._head is None:
+            raise IndexError(f"Cannot take the rest of an empty {type(self).__name__}.")
+        return self._version_of(
+            self._head.next,
+            None if self._size is None else self._size - 1,
+            None if self._head.next is None else self._tail,
+        )
+
+    def _version_of(
+        self,
+        head: Union[None, SingleLinkNode],
+        size: Union[None, int],
+        tail: Union[None, SingleLinkNode],
+    ) -> "PersistentLinkedList":
+        """
+        Create a new linked list of this type holding the chain of nodes starting at the given
+        head, without copying it.
+
+        Args:
+            head: The first node of the chain.
+            size: The number of nodes in the chain, or None if it is unknown.
+            tail: The last node of the chain (ignored if the size is unknown).
+
+        Returns:
+            A new linked list holding the chain.
+        """
+        linked_list: PersistentLinkedList = type(self)()
+        linked_list._head, linked_list._size, linked_list._tail = head, size, tail
+        return linked_list
+
+    @staticmethod
+    def _new_node(data: object) -> SingleLinkNode:
+        """
+        Create a new, unlinked node storing the given data.
+
+        Args:
+            data: Any data to store in the new node.
+
+        Returns:
+            The new node.
+        """
+        if isinstance(data, Node):
+            raise ValueError(
+                "Cannot insert a Node object. "
+                "Insert the data instead if this was intended behavior."
+            )
+        return SingleLinkNode(data)
+
+    def _copy_prefix(
+        self,
+        count: int,
+        replacements: Union[None, Dict[int, object]] = None,
+        removals: Union[range, Tuple[int, ...]] = (),
+    ) -> Tuple[
+        Union[None, SingleLinkNode],
+        Union[None, SingleLinkNode],
+        Union[None, SingleLinkNode],
+    ]:
+        """
+        Copy the first count nodes of the linked list into a new chain, in a single traversal.
+        The shared nodes are left unchanged.
+
+        Args:
+            count: The number of nodes to copy; it must not exceed the size of the linked list.
+            replacements: The data to store instead, for some of the indices being copied.
+            removals: The indices of the nodes to leave out of the new chain.
+
+        Returns:
+            The first and last nodes of the new chain (both None if it is empty), and the node
+            after the copied ones (to share as the rest of the new chain).
+        """
+        first_node: Union[None, SingleLinkNode] = None
+        last_node: Union[None, SingleLinkNode] = None
+        node: Union[None, SingleLinkNode] = self._head
+        for index in range(count):
+            if index not in removals:
+                data: object = node.data
+                if replacements is not None and index in replacements:
+                    data = replacements[index]
+                new_node = SingleLinkNode(data)
+                if last_node is None:
+                    first_node = new_node
+                else:
+                    last_node.next = new_node
+                last_node = new_node
+            node = node.next
+        return first_node, last_node, node
+
+    def _relink(
+        self,
+        first_node: Union[None, SingleLinkNode],
+        last_node: Union[None, SingleLinkNode],
+        rest: Union[None, SingleLinkNode],
+    ) -> None:
+        """
+        Make the given new chain of nodes (e.g., from _copy_prefix), followed by the given rest,
+        the current version of the linked list. The tail only changes if there is no rest.
+
+        Args:
+            first_node: The first node of the new chain, or None if it is empty.
+            last_node: The last node of the new chain, or None if it is empty.
+            rest: The node to link after the new chain.
+
+        Returns:
+            None
+        """
+        if last_node is None:
+            self._head = rest
+        else:
+            last_node.next = rest
+            self._head = first_node
+        if rest is None:
+            self._tail = last_node
+
+    def _check_index(self, index: int, size: int) -> None:
+        """
+        Make sure the given index is in bounds.
+
+        Args:
+            index: The index to check.
+            size: The number of valid indices.
+
+        Returns:
+            None
+        """
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+        if index >= size:
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Set the data at the given index (or the indices in the given slice) of the linked list,
+        by copying the nodes up to the last index set, in a single traversal.
+
+        Args:
+            key: The index (or slice) of the node(s) to set.
+            value: The data to set the node(s) to.
+
+        Returns:
+            None
+        """
+        if isinstance(key, slice):
+            indices: range = range(*key.indices(self.size))
+            if len(value) != len(indices):
+                raise ValueError(
+                    f"Cannot assign {len(value)} values to a slice of {len(indices)} nodes."
+                )
+            replacements: Dict[int, object] = dict(zip(indices, value))
+        else:
+            self._check_index(key, self.size)
+            replacements = {key: value}
+        if not replacements:
+            return
+
+        first_node, last_node, rest = self._copy_prefix(
+            max(replacements) + 1, replacements=replacements
+        )
+        self._relink(first_node, last_node, rest)
+        # the positions are unchanged (so views stay valid), but the located nodes were replaced
+        self._cached_position = None
+
+    def __delitem__(self, key) -> None:
+        """
+        Delete the node at the given index (or the nodes in the given slice) of the linked list,
+        by copying the nodes up to the last index deleted, in a single traversal.
+
+        Args:
+            key: The index (or slice) of the node(s) to delete.
+
+        Returns:
+            None
+        """
+        if not isinstance(key, slice):
+            self.remove_at_index(key)
+            return
+
+        indices: range = self._ascending_indices(key)
+        if not indices:
+            return
+        first_node, last_node, rest = self._copy_prefix(
+            indices[-1] + 1, removals=indices
+        )
+        self._relink(first_node, last_node, rest)
+        self._adjust_size(-len(indices))
+
+    def insert_at_head(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the head of the linked list, in O(1).
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        new_node: SingleLinkNode = self._new_node(data)
+        new_node.next = self._head
+        if self._head is None:
+            self._tail = new_node  # if the list was empty, the tail is also the head
+        self._head = new_node
+        self._adjust_size(1)
+
+    def remove_at_head(self) -> None:
+        """
+        Remove the node at the head of the linked list, if it exists, in O(1).
+
+        Returns:
+            None
+        """
+        if self._head is not None:
+            self._head = self._head.next
+            if self._head is None:
+                self._tail = None  # the only node was removed, so the list is empty
+            self._adjust_size(-1)
+
+    def insert_at_index(self, data: object, index: int) -> None:
+        """
+        Insert a new node with the given data at the specified index in the linked list, by
+        copying the nodes before the index and sharing the ones after it.
+
+        Args:
+            data: Any data to store in the new node to insert.
+            index: The index at which to insert the new node.
+
+        Returns:
+            None
+        """
+        self._check_index(index, self.size + 1)
+        new_node: SingleLinkNode = self._new_node(data)
+        first_node, last_node, new_node.next = self._copy_prefix(index)
+        self._relink(first_node, last_node, new_node)
+        if new_node.next is None:
+            self._tail = new_node  # inserted after the last node
+        self._adjust_size(1)
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Remove the node at the specified index in the linked list, by copying the nodes before the
+        index and sharing the ones after it.
+
+        Args:
+            index: The index of the node to remove.
+
+        Returns:
+            None
+        """
+        self._check_index(index, self.size)
+        first_node, last_node, removed = self._copy_prefix(index)
+        self._relink(first_node, last_node, removed.next)
+        self._adjust_size(-1)
+
+    def insert_at_tail(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the tail of the linked list. Since the last node
+        cannot be relinked, every node is copied.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        self.insert_at_index(data, self.size)
+
+    def remove_at_tail(self) -> None:
+        """
+        Remove the node at the tail of the linked list, if it exists. Since the node before it
+        cannot be relinked, every other node is copied.
+
+        Returns:
+            None
+        """
+        if self._head is not None:
+            self.remove_at_index(self.size - 1)
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new node at the tail of the linked list for each item in the given iterable,
+        preserving their order. The existing nodes are copied once, and the new nodes are linked
+        after the copies, so this is O(n + k) for k items.
+
+        Args:
+            iterable: The data to store in the new nodes to insert.
+
+        Returns:
+            None
+        """
+        first_new: Union[None, SingleLinkNode] = None
+        last_new: Union[None, SingleLinkNode] = None
+        count: int = 0
+        for data in iterable:
+            new_node: SingleLinkNode = self._new_node(data)
+            if last_new is None:
+                first_new = new_node
+            else:
+                last_new.next = new_node
+            last_new = new_node
+            count += 1
+
+        if first_new is None:  # nothing to insert
+            return
+
+        first_node, last_node, _ = self._copy_prefix(self.size)
+        self._relink(first_node, last_node, first_new)
+        self._tail = last_new
+        self._adjust_size(count)
@@ -2,20 +2,44 @@
 This module contains the SingleLinkedList class that represents a singly linked list.
 """
 
-from typing import Union, Tuple
+import weakref
+from typing import Callable, Dict, Union, Tuple, Iterable
 
 # these are the custom classes that we will use in the linked list
 from node.abstract import Node
 from node.impl import SingleLinkNode
 from linked_list.abstract import LinkedList
+from linked_list.cursor import SingleLinkedListCursor
+from linked_list.view import LinkedListView
+
+
+class _SharedChain:  # pylint: disable=too-few-public-methods
+    """
+    The linked lists sharing one chain of nodes after copy. The owner is the linked list whose
+    nodes they are (i.e., the one that was copied), and keeps them when it is modified; the copies
+    get new nodes when they are modified (or when the owner is). All of them are only referenced
+    weakly, so a copy discarded without being modified costs nothing more.
+
+    Attributes:
+        owner: A weak reference to the linked list whose nodes are shared.
+        copies: The other linked lists sharing the nodes, keyed by their id.
+    """
+
+    __slots__ = ("owner", "copies")
+
+    def __init__(self, owner: "SingleLinkedList") -> None:
+        self.owner: weakref.ref = weakref.ref(owner)
+        # keyed by id, since linked lists compare (and hash) by their data
+        self.copies: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
 
 class SingleLinkedList(LinkedList):
     """
     A singly linked list. Each node in the linked list has a reference to the next node in the
-    list. The linked list itself has a reference to the head node.
+    list. The linked list itself has a reference to the head node, and for efficiency, the tail
+    node (so that appending is O(1)).
 
-    If the linked list is empty, the head is None.
+    If the linked list is empty, the head and tail are None.
 
     The linked list may be iterated over to access each node in the list.
 
@@ -23,6 +47,306 @@ class SingleLinkedList(LinkedList):
     less than, less than or equal to, greater than, greater than or equal to, and hashed.
     """
 
+    def __init__(self, *args) -> None:
+        self._tail: Union[None, SingleLinkNode] = (
+            None  # order matters here, *args may define tail
+        )
+        # the linked lists this one shares its nodes with since a copy, if any
+        self._sharing: Union[None, _SharedChain] = None
+        super().__init__(*args)
+
+    def _set_head(self, node: Union[None, SingleLinkNode]) -> None:
+        """
+        Make the given node the head of the linked list, and discard the stored size. The nodes
+        shared with copies are copied first, so the copies are unaffected.
+
+        Args:
+            node: The node to use as the new head of the linked list.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        super()._set_head(node)
+
+    @property
+    def head(self) -> Union[None, SingleLinkNode]:
+        """
+        Get the head node of the linked list. The nodes shared with copies are copied first, since
+        the caller may modify the node it is given.
+
+        Returns:
+            The head node of the linked list, or None if the linked list is empty.
+        """
+        self._unshare()
+        return self._head
+
+    @head.setter
+    def head(self, node: Union[None, SingleLinkNode]) -> None:
+        """
+        Set the head node of the linked list directly (see LinkedList.head).
+
+        Args:
+            node: The node to use as the new head of the linked list.
+
+        Returns:
+            None
+        """
+        self._set_head(node)
+
+    @property
+    def tail(self) -> Union[None, SingleLinkNode]:
+        """
+        Get the tail node of the linked list. The nodes shared with copies are copied first, since
+        the caller may modify the node it is given.
+
+        Returns:
+            The last node in the linked list, or None if the linked list is empty.
+        """
+        self._unshare()
+        if (
+            self._size is None
+        ):  # the head was assigned directly, so the tail must be found again
+            self._recount()
+        return self._tail
+
+    @tail.setter
+    def tail(self, node: Union[None, SingleLinkNode]) -> None:
+        """
+        Set the tail node of the linked list.
+
+        Args:
+            node: The node to use as the new tail of the linked list.
+
+        Returns:
+            None
+        """
+        self._tail = node
+
+    def _recount(self) -> None:
+        """
+        Walk the chain of nodes to recover both the size and the tail of the linked list.
+
+        Returns:
+            None
+        """
+        size: int = 0
+        last_node: Union[None, SingleLinkNode] = None
+        for last_node in self._chain():
+            size += 1
+        self._size, self._tail = size, last_node
+
+    def _chain(self) -> iter:
+        """
+        Iterate over the nodes of the linked list without copying the nodes shared with copies,
+        for the walks that only read the nodes and never hand them out.
+
+        Returns:
+            An iterator over the nodes of the linked list.
+        """
+        curr: Union[None, SingleLinkNode] = self._head
+        while curr is not None:
+            yield curr
+            curr = curr.next
+
+    def __iter__(self) -> iter:
+        """
+        Iterate over the nodes of the linked list. The nodes shared with copies are copied first,
+        since the caller may modify the nodes it is given.
+
+        Returns:
+            An iterator over the nodes of the linked list.
+        """
+        self._unshare()
+        return self._chain()
+
+    def values(self) -> iter:
+        """
+        Iterate over the data stored in each node of the linked list, in order. Reading the data
+        does not copy the nodes shared with copies.
+
+        Returns:
+            An iterator over the data stored in the linked list.
+        """
+        return (node.data for node in self._chain())
+
+    def _node_at(self, index: int) -> Union[None, SingleLinkNode]:
+        """
+        Get the node at the given non-negative index in the linked list (see LinkedList._node_at),
+        after copying the nodes shared with copies, since the caller may modify the node.
+
+        Args:
+            index: The index of the node to get.
+
+        Returns:
+            The node at the given index, or None if the index is out of bounds.
+        """
+        self._unshare()
+        return super()._node_at(index)
+
+    def view(
+        self,
+        start: Union[None, int] = None,
+        stop: Union[None, int] = None,
+        step: Union[None, int] = None,
+    ) -> LinkedListView:
+        """
+        Get a lazy view over the nodes selected by the given slice (see LinkedList.view). The
+        nodes shared with copies are copied first, so the view does not become stale as soon as
+        it is used.
+
+        Args:
+            start: The start of the slice.
+            stop: The stop of the slice.
+            step: The step of the slice.
+
+        Returns:
+            A view over the selected nodes.
+        """
+        self._unshare()
+        return super().view(start, stop, step)
+
+    def copy(self) -> "SingleLinkedList":
+        """
+        Get a shallow copy of the linked list in O(1). The copy shares the nodes of this linked
+        list until either of them is modified or hands out a node (by iteration, indexing, a view,
+        a cursor, or its head or tail); the chain of nodes is then copied once, in a single linear
+        pass. Reading only the data (e.g., values, len, in, or comparisons) copies nothing, so
+        copies that are only read cost O(1).
+
+        This linked list keeps its nodes, so the handles it gave out stay valid, and a copy never
+        hands out a node of this linked list.
+
+        Returns:
+            A new linked list of the same type holding the same data.
+        """
+        # pylint: disable=protected-access
+        duplicate: SingleLinkedList = type(self)()
+        if self._head is None:
+            return duplicate
+        if self._sharing is None:
+            self._sharing = _SharedChain(self)
+        self._sharing.copies[id(duplicate)] = duplicate
+        duplicate._sharing = self._sharing
+        size: int = self.size  # recounting also finds the tail
+        duplicate._replace_chain(self._head, self._tail, size)
+        return duplicate
+
+    def _copy_chain(
+        self,
+    ) -> Tuple[Union[None, SingleLinkNode], Union[None, SingleLinkNode], int]:
+        """
+        Copy the chain of nodes of the linked list, in a single pass.
+
+        Returns:
+            The first and last nodes of the new chain, and the number of nodes in it.
+        """
+        first_node: Union[None, SingleLinkNode] = None
+        last_node: Union[None, SingleLinkNode] = None
+        size: int = 0
+        for node in self._chain():
+            new_node = SingleLinkNode(node.data)
+            if last_node is None:
+                first_node = new_node
+            else:
+                last_node.next = new_node
+            last_node = new_node
+            size += 1
+        return first_node, last_node, size
+
+    def _replace_chain(
+        self,
+        first_node: Union[None, SingleLinkNode],
+        last_node: Union[None, SingleLinkNode],
+        size: int,
+    ) -> None:
+        """
+        Replace the chain of nodes of the linked list with the given chain, holding the same data.
+        Anything still holding the old nodes (e.g., a view, cursor or async iteration) would no
+        longer see the nodes of this linked list, so this counts as a structural modification.
+
+        Args:
+            first_node: The first node of the new chain.
+            last_node: The last node of the new chain.
+            size: The number of nodes in the new chain.
+
+        Returns:
+            None
+        """
+        self._head, self._tail, self._size = first_node, last_node, size
+        self._cached_position = None
+        self._version += 1
+
+    def _unshare(self) -> None:
+        """
+        Stop sharing the nodes of the linked list with its copies (or the linked list it is a copy
+        of), so that it can be modified. This must be called before every modification.
+
+        If this linked list owns the nodes, it keeps them, and the copies (if any is still alive)
+        are moved to a single new copy of the chain; otherwise, this linked list gets its own new
+        copy of the chain. Either way, this is O(n) once, and O(1) when nothing is shared.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        sharing: Union[None, _SharedChain] = self._sharing
+        if sharing is None:
+            return
+        self._sharing = None
+        if (
+            sharing.owner() is None
+        ):  # the owner is gone, so this linked list takes its place
+            sharing.owner = weakref.ref(self)
+        sharing.copies.pop(id(self), None)
+
+        if sharing.owner() is not self:
+            self._replace_chain(*self._copy_chain())
+            return
+
+        copies = list(sharing.copies.values())
+        if not copies:
+            return
+        first_node, last_node, size = self._copy_chain()
+        moved: Union[None, _SharedChain] = None
+        if len(copies) > 1:
+            moved = _SharedChain(copies[0])
+            for duplicate in copies[1:]:
+                moved.copies[id(duplicate)] = duplicate
+        for duplicate in copies:
+            duplicate._sharing = moved
+            duplicate._replace_chain(first_node, last_node, size)
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Set the data of the node at the given index (or the nodes in the given slice) of the
+        linked list, after making sure it does not share its nodes with a copy.
+
+        Args:
+            key: The index (or slice) of the node(s) to set.
+            value: The data to set the node(s) to.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        super().__setitem__(key, value)
+
+    def _check_own_nodes(self) -> None:
+        """
+        Make sure the linked list owns its nodes (i.e., it is not a copy still sharing the nodes
+        of the linked list it was copied from), so that a node handle given to it can be trusted.
+
+        Returns:
+            None
+        """
+        sharing: Union[None, _SharedChain] = self._sharing
+        if sharing is not None and sharing.owner() not in (None, self):
+            raise ValueError(
+                "Cannot use a node of a copy that still shares its nodes with the linked list it "
+                "was copied from; modify the copy first."
+            )
+
     def __last_nodes(
         self,
     ) -> Tuple[Union[None, SingleLinkNode], Union[None, SingleLinkNode]]:
@@ -34,7 +358,7 @@ class SingleLinkedList(LinkedList):
             empty, both values are None. If the list has only one node, the second value is None.
             If the list has two or more nodes, both values are not None.
         """
-        curr: Union[None, SingleLinkNode] = self.head
+        curr: Union[None, SingleLinkNode] = self._head
         predecessor: Union[None, SingleLinkNode] = None
 
         if curr is None:
@@ -45,6 +369,175 @@ class SingleLinkedList(LinkedList):
             curr = curr.next
         return curr, predecessor
 
+    def cursor(self, index: int = 0) -> SingleLinkedListCursor:
+        """
+        Get a cursor positioned at the given index of the linked list (or just past the last node,
+        if the index is the size of the linked list). The cursor can move forward, and read,
+        update, insert and remove at its position in O(1).
+
+        Args:
+            index: The index to position the cursor at.
+
+        Returns:
+            A cursor over the linked list.
+        """
+        self._unshare()
+        return SingleLinkedListCursor(self, index)
+
+    def sort(
+        self, key: Union[None, Callable[[object], object]] = None, reverse: bool = False
+    ) -> None:
+        """
+        Sort the linked list in place by relinking its nodes, with a bottom-up merge sort: runs of
+        1, 2, 4, ... nodes are merged pairwise in repeated passes over the chain, so the sort is
+        O(n log n), allocates no nodes and does not recurse. Like list.sort, the sort is stable,
+        and the key of each node's data is computed only once.
+
+        Args:
+            key: A function of one argument used to extract a comparison key from each node's
+                data, or None to compare the data directly.
+            reverse: Whether to sort in descending order (equal items keep their order).
+
+        Returns:
+            None
+        """
+        self._unshare()
+        if self._head is None:
+            return
+
+        precedes: Callable[[SingleLinkNode, SingleLinkNode], bool]
+        if key is None:  # compare the data directly, without a lookup per comparison
+            precedes = (
+                (lambda right, left: left.data < right.data)
+                if reverse
+                else (lambda right, left: right.data < left.data)
+            )
+        else:
+            keys: Dict[int, object] = {id(node): key(node.data) for node in self}
+            precedes = (
+                (lambda right, left: keys[id(left)] < keys[id(right)])
+                if reverse
+                else (lambda right, left: keys[id(right)] < keys[id(left)])
+            )
+
+        head: SingleLinkNode = self._head
+        width: int = 1
+        while True:
+            head, last_node, merges = self._merge_pass(head, width, precedes)
+            if merges <= 1:  # the whole chain was a single run
+                break
+            width *= 2
+        self._head, self._tail = head, last_node
+        self._adjust_size(0)  # only relinked
+
+    def reverse(self) -> None:
+        """
+        Reverse the linked list in place, by reversing the next link of each node in a single
+        pass. No nodes are allocated.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        first_node: Union[None, SingleLinkNode] = self._head
+        predecessor: Union[None, SingleLinkNode] = None
+        node: Union[None, SingleLinkNode] = first_node
+        while node is not None:
+            node.next, predecessor, node = predecessor, node, node.next
+        self._head, self._tail = predecessor, first_node
+        self._adjust_size(0)  # only relinked
+
+    @staticmethod
+    def _merge_pass(
+        head: SingleLinkNode,
+        width: int,
+        precedes: Callable[[SingleLinkNode, SingleLinkNode], bool],
+    ) -> Tuple[SingleLinkNode, SingleLinkNode, int]:
+        """
+        Merge each pair of consecutive sorted runs of the given width in the chain starting at the
+        given node, relinking the next links of the nodes.
+
+        Args:
+            head: The first node of the chain.
+            width: The length of each sorted run (the last run may be shorter).
+            precedes: A function that tells if a node of a right run must come before a node of
+                the left run it is merged with.
+
+        Returns:
+            The first and last node of the merged chain, and the number of merges performed.
+        """
+        merged_head: Union[None, SingleLinkNode] = None
+        last_node: Union[None, SingleLinkNode] = None
+        remaining: Union[None, SingleLinkNode] = head
+        merges: int = 0
+        while remaining is not None:
+            merges += 1
+            left: Union[None, SingleLinkNode] = remaining
+            right: Union[None, SingleLinkNode] = remaining
+            left_size: int = 0
+            while left_size < width and right is not None:
+                left_size += 1
+                right = right.next
+            right_size: int = width
+
+            while left_size > 0 or (right_size > 0 and right is not None):
+                if left_size == 0 or (
+                    right_size > 0 and right is not None and precedes(right, left)
+                ):
+                    node, right = right, right.next
+                    right_size -= 1
+                else:
+                    node, left = left, left.next
+                    left_size -= 1
+                if last_node is None:
+                    merged_head = node
+                else:
+                    last_node.next = node
+                last_node = node
+            remaining = right
+
+        last_node.next = None
+        return merged_head, last_node, merges
+
+    def __delitem__(self, key) -> None:
+        """
+        Delete the node at the given index (or the nodes in the given slice) of the linked list.
+        A slice is unlinked in a single traversal, starting from the node before its first index.
+
+        Args:
+            key: The index (or slice) of the node(s) to delete.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        if not isinstance(key, slice):
+            super().__delitem__(key)
+            return
+
+        indices: range = self._ascending_indices(key)
+        if not indices:
+            return
+
+        predecessor: Union[None, SingleLinkNode] = (
+            None if indices.start == 0 else self._node_at(indices.start - 1)
+        )
+        node: SingleLinkNode = self._head if predecessor is None else predecessor.next
+        for position in range(indices.start, indices[-1] + 1):
+            successor: Union[None, SingleLinkNode] = node.next
+            if (position - indices.start) % indices.step == 0:  # unlink this node
+                if predecessor is None:
+                    self._head = successor
+                else:
+                    predecessor.next = successor
+            else:
+                predecessor = node
+            node = successor
+
+        if node is None:  # the last node was removed
+            self._tail = predecessor
+        self._adjust_size(-len(indices))
+
     def insert_at_head(self, data: object) -> None:
         """
         Insert a new node with the given data at the head of the linked list.
@@ -55,13 +548,19 @@ class SingleLinkedList(LinkedList):
         Returns:
             None
         """
+        self._unshare()
         if isinstance(data, Node):
             raise ValueError(
                 "Cannot insert a Node object. "
                 "Insert the data instead if this was intended behavior."
             )
 
-        # TODO: ADD YOUR CODE HERE
+        new_node = SingleLinkNode(data)
+        new_node.next = self._head
+        if self._head is None:
+            self._tail = new_node  # if the list was empty, the tail is also the head
+        self._head = new_node
+        self._adjust_size(1)
 
     def remove_at_head(self) -> None:
         """
@@ -70,9 +569,12 @@ class SingleLinkedList(LinkedList):
         Returns:
             None
         """
-
-        # TODO: ADD YOUR CODE HERE
-        pass
+        self._unshare()
+        if self._head is not None:
+            self._head = self._head.next
+            if self._head is None:
+                self._tail = None  # the only node was removed, so the list is empty
+            self._adjust_size(-1)
 
     def insert_at_tail(self, data: object) -> None:
         """
@@ -84,19 +586,87 @@ class SingleLinkedList(LinkedList):
         Returns:
             None
         """
+        self._unshare()
+        new_node: SingleLinkNode = SingleLinkNode(data)
+        last_node: Union[None, SingleLinkNode] = self.tail
+        self._adjust_size(1)
+        if last_node is None:
+            self._head = new_node
+        else:
+            last_node.next = new_node
+        self._tail = new_node
 
-        # TODO: ADD YOUR CODE HERE
-        pass
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new node at the tail of the linked list for each item in the given iterable,
+        preserving their order. The new nodes are linked to one another in a single pass and then
+        attached to the tail, so this is O(k) for k items.
+
+        Args:
+            iterable: The data to store in the new nodes to insert.
+
+        Returns:
+            None
+        """
+        self._unshare()
+        first_node: Union[None, SingleLinkNode] = None
+        last_node: Union[None, SingleLinkNode] = None
+        count: int = 0
+        for data in iterable:
+            new_node = SingleLinkNode(data)
+            if last_node is None:
+                first_node = new_node
+            else:
+                last_node.next = new_node
+            last_node = new_node
+            count += 1
+
+        if first_node is None:  # nothing to insert
+            return
+
+        if self.tail is None:
+            self._head = first_node
+        else:
+            self._tail.next = first_node
+        self._tail = last_node
+        self._adjust_size(count)
 
     def remove_at_tail(self) -> None:
-        # TODO: ADD YOUR CODE HERE
-        pass
+        self._unshare()
+        # base case of empty list
+        if self._head is None:
+            return
+
+        self._adjust_size(-1)
+
+        # base case of single node list
+        if self._head.next is None:
+            self._head, self._tail = None, None
+            return
+
+        # general case; the predecessor of the tail can only be found by walking the list
+        _, next_to_last = self.__last_nodes()
+        next_to_last.next = None
+        self._tail = next_to_last
 
     def insert_at_index(self, data: object, index: int) -> None:
+        self._unshare()
         if index < 0:
             raise IndexError("Index must be non-negative.")
 
-        # TODO: ADD YOUR CODE HERE
+        if index == 0:
+            self.insert_at_head(data)
+            return
+
+        for idx, node in enumerate(self):
+            if idx == index - 1:
+                new_node = SingleLinkNode(data)
+                new_node.next = node.next
+                if node.next is None:
+                    self._tail = new_node  # inserted after the last node
+                node.next = new_node
+                self._adjust_size(1)
+                return
 
         # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
         raise IndexError(
@@ -104,10 +674,22 @@ class SingleLinkedList(LinkedList):
         )
 
     def remove_at_index(self, index: int) -> None:
+        self._unshare()
         if index < 0:
             raise IndexError("Index must be non-negative.")
 
-        # TODO: ADD YOUR CODE HERE
+        if index == 0:
+            self.remove_at_head()
+            return
+
+        for idx, node in enumerate(self):
+            if idx == index - 1:
+                if node.next is not None:
+                    node.next = node.next.next
+                    if node.next is None:
+                        self._tail = node  # removed the last node
+                    self._adjust_size(-1)
+                    return
 
         # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
         raise IndexError(
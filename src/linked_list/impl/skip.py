@@ -0,0 +1,314 @@
+"""
+This module contains the SkipLinkedList class that represents a linked list with a skip list index
+layer, so that positional operations run in expected O(log n) time.
+"""
+
+import random
+from typing import Union, Iterable, List, Tuple
+
+# these are the custom classes that we will use in the linked list
+from node.abstract import Node
+from node.impl import SkipLinkNode
+from linked_list.abstract import LinkedList
+
+# enough levels to index about 4^32 nodes with the default promotion probability
+MAX_HEIGHT: int = 32
+PROMOTION_PROBABILITY: float = 0.25  # on average, a node has 1 / (1 - p) = 1.33 links
+
+
+class SkipLinkedList(LinkedList):
+    """
+    A singly linked list with a skip list index layer. Each node is a SkipLinkNode of random
+    height; at each level, a node links to the next node of at least that height, and records how
+    many positions the link skips. Locating a position descends from the highest level, so
+    getting, setting, inserting and removing by index take expected O(log n) time rather than
+    O(n). Every mutation keeps the links and widths consistent.
+
+    Widths of missing links (i.e., links to None) count the positions up to one past the last
+    node, so that insertions and removals at the end need no special cases.
+
+    If the linked list is empty, the head and tail are None.
+
+    The linked list may be iterated over to access each node in the list.
+
+    An object of SkipLinkedList can be compared to other linked lists for equality, inequality,
+    less than, less than or equal to, greater than, greater than or equal to, and hashed.
+    """
+
+    def __init__(self, *args) -> None:
+        # order matters here, *args are inserted after the header
+        self._header: SkipLinkNode = SkipLinkNode(None, height=MAX_HEIGHT)
+        self._height: int = 1  # the number of levels in use
+        self._tail: Union[None, SkipLinkNode] = None
+        super().__init__(*args)
+
+    @staticmethod
+    def _random_height() -> int:
+        """
+        Draw the height of a new node; each additional level is kept with probability
+        PROMOTION_PROBABILITY.
+
+        Returns:
+            The height of a new node.
+        """
+        height: int = 1
+        while height < MAX_HEIGHT and random.random() < PROMOTION_PROBABILITY:
+            height += 1
+        return height
+
+    def _predecessors(self, index: int) -> Tuple[List[SkipLinkNode], List[int]]:
+        """
+        Find, at each level in use, the last node before the given position, and that node's
+        position (the header is at position -1).
+
+        Args:
+            index: The position to find the predecessors of.
+
+        Returns:
+            The predecessor at each level, and the position of each predecessor.
+        """
+        update: List[SkipLinkNode] = [self._header] * self._height
+        positions: List[int] = [-1] * self._height
+        node: SkipLinkNode = self._header
+        position: int = -1
+        for level in reversed(range(self._height)):
+            links, widths = node.links, node.widths
+            while links[level] is not None and position + widths[level] < index:
+                position += widths[level]
+                node = links[level]
+                links, widths = node.links, node.widths
+            update[level], positions[level] = node, position
+        return update, positions
+
+    def _node_at(self, index: int) -> Union[None, SkipLinkNode]:
+        """
+        Get the node at the given non-negative position in the linked list, in expected O(log n)
+        time.
+
+        Args:
+            index: The position of the node.
+
+        Returns:
+            The node at the given position, or None if the position is out of bounds.
+        """
+        if index >= self._size:
+            return None
+
+        node: SkipLinkNode = self._header
+        position: int = -1
+        for level in reversed(range(self._height)):
+            while (
+                node.links[level] is not None and position + node.widths[level] <= index
+            ):
+                position += node.widths[level]
+                node = node.links[level]
+            if position == index:
+                break
+        return node
+
+    def _insert(self, data: object, index: int) -> None:
+        """
+        Insert a new node with the given data at the given position, which must be in bounds
+        (i.e., between 0 and the size of the linked list, inclusive).
+
+        Args:
+            data: Any data to store in the new node to insert.
+            index: The position at which to insert the new node.
+
+        Returns:
+            None
+        """
+        height: int = self._random_height()
+        if height > self._height:  # the header's new levels skip to one past the end
+            for level in range(self._height, height):
+                self._header.links[level] = None
+                self._header.widths[level] = self._size + 1
+            self._height = height
+        update, positions = self._predecessors(index)
+
+        new_node = SkipLinkNode(data, height=height)
+        for level in range(height):
+            predecessor = update[level]
+            skipped: int = index - positions[level]
+            new_node.links[level] = predecessor.links[level]
+            new_node.widths[level] = predecessor.widths[level] - skipped + 1
+            predecessor.links[level] = new_node
+            predecessor.widths[level] = skipped
+        for level in range(height, self._height):
+            update[level].widths[level] += 1
+
+        if new_node.links[0] is None:
+            self._tail = new_node
+        self._head = self._header.links[0]
+        self._adjust_size(1)
+
+    def _remove(self, index: int) -> None:
+        """
+        Remove the node at the given position, which must be in bounds.
+
+        Args:
+            index: The position of the node to remove.
+
+        Returns:
+            None
+        """
+        update, _ = self._predecessors(index)
+        removed: SkipLinkNode = update[0].links[0]
+        for level in range(self._height):
+            predecessor = update[level]
+            if predecessor.links[level] is removed:
+                predecessor.links[level] = removed.links[level]
+                predecessor.widths[level] += removed.widths[level] - 1
+            else:
+                predecessor.widths[level] -= 1
+
+        if removed is self._tail:
+            self._tail = None if update[0] is self._header else update[0]
+        self._head = self._header.links[0]
+        self._adjust_size(-1)
+
+    @property
+    def head(self) -> Union[None, SkipLinkNode]:
+        """
+        Get the head node of the linked list.
+
+        Returns:
+            The head node of the linked list, or None if the linked list is empty.
+        """
+        return self._head
+
+    @head.setter
+    def head(self, node: Union[None, Node]) -> None:
+        """
+        Replace the contents of the linked list with the data of the chain of nodes starting at
+        the given node. Since the index layer is rebuilt over new nodes, later changes to the given
+        nodes are not reflected in the linked list.
+
+        Args:
+            node: The first node of the chain to copy, or None to empty the linked list.
+
+        Returns:
+            None
+        """
+        data: list = []
+        while node is not None:
+            data.append(node.data)
+            node = node.next
+        self._header = SkipLinkNode(None, height=MAX_HEIGHT)
+        self._height, self._head, self._tail = 1, None, None
+        self._adjust_size(-self._size)
+        self.extend(data)
+
+    @property
+    def tail(self) -> Union[None, SkipLinkNode]:
+        """
+        Get the tail node of the linked list.
+
+        Returns:
+            The last node in the linked list, or None if the linked list is empty.
+        """
+        return self._tail
+
+    def insert_at_head(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the head of the linked list.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        if isinstance(data, Node):
+            raise ValueError(
+                "Cannot insert a Node object. "
+                "Insert the data instead if this was intended behavior."
+            )
+
+        self._insert(data, 0)
+
+    def remove_at_head(self) -> None:
+        """
+        Remove the node at the head of the linked list, if it exists.
+
+        Returns:
+            None
+        """
+        if self._head is not None:
+            self._remove(0)
+
+    def insert_at_tail(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the tail of the linked list.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        self._insert(data, self._size)
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new node at the tail of the linked list for each item in the given iterable,
+        preserving their order. The last node at each level is tracked while the new nodes are
+        linked, so this is O(k) for k items (after an O(log n) search for the current end).
+
+        Args:
+            iterable: The data to store in the new nodes to insert.
+
+        Returns:
+            None
+        """
+        update, positions = self._predecessors(self._size)
+        update.extend([self._header] * (MAX_HEIGHT - self._height))
+        positions.extend([-1] * (MAX_HEIGHT - self._height))
+        position: int = self._size
+        for data in iterable:
+            height: int = self._random_height()
+            new_node = SkipLinkNode(data, height=height)
+            for level in range(height):
+                update[level].links[level] = new_node
+                update[level].widths[level] = position - positions[level]
+                update[level], positions[level] = new_node, position
+            self._height = max(self._height, height)
+            self._tail = new_node
+            position += 1
+
+        for level in range(
+            self._height
+        ):  # the last links at each level skip to past the end
+            update[level].widths[level] = position - positions[level]
+        self._head = self._header.links[0]
+        self._adjust_size(position - self._size)
+
+    def remove_at_tail(self) -> None:
+        if self._tail is not None:
+            self._remove(self._size - 1)
+
+    def insert_at_index(self, data: object, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index > self._size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        self._insert(data, index)
+
+    def remove_at_index(self, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index >= self._size:
+            if index == 0:  # removing from an empty list is a no-op
+                return
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        self._remove(index)
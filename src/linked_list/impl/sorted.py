@@ -0,0 +1,317 @@
+"""
+This module contains the SortedLinkedList class that represents a linked list whose elements are
+kept in ascending order, with a skip list index layer for O(log n) ordered insertion and search.
+"""
+
+from typing import Iterable, Iterator, Tuple, Union
+
+# these are the custom classes that we will use in the linked list
+from node.impl import SkipLinkNode
+from linked_list.impl.skip import SkipLinkedList
+
+
+class SortedLinkedList(SkipLinkedList):
+    """
+    A linked list whose elements are kept in ascending order. Elements are ordered the same way
+    Node objects are (i.e., by comparing their data with <), and equal elements keep the order
+    they were added in. The skip list index layer of SkipLinkedList is searched by value as well
+    as by position, so adding an element, finding where a value belongs, and removing or counting
+    a value all take expected O(log n) time, rather than a linear search followed by a linear
+    insert_at_index.
+
+    Elements should be added with add (or extend). The positional insertion methods, and item
+    assignment, are only allowed where they keep the linked list sorted; otherwise they raise a
+    ValueError.
+
+    If the linked list is empty, the head and tail are None.
+
+    The linked list may be iterated over to access each node in the list, in ascending order.
+
+    An object of SortedLinkedList can be compared to other linked lists for equality, inequality,
+    less than, less than or equal to, greater than, greater than or equal to, and hashed.
+    """
+
+    def _search(self, value: object, right: bool) -> Tuple[SkipLinkNode, int]:
+        """
+        Find the last node whose data is less than the given value (or, searching to the right,
+        not greater than the value), descending from the highest level of the index layer.
+
+        Args:
+            value: The value to search for.
+            right: Whether to search past the nodes whose data is equal to the value.
+
+        Returns:
+            The last node before the value's insertion point (the header if there is none), and
+            that node's position (-1 for the header).
+        """
+        node: SkipLinkNode = self._header
+        position: int = -1
+        for level in reversed(range(self._height)):
+            successor: Union[None, SkipLinkNode] = node.links[level]
+            while successor is not None and (
+                not value < successor.data if right else successor.data < value
+            ):
+                position += node.widths[level]
+                node, successor = successor, successor.links[level]
+        return node, position
+
+    def bisect_left(self, value: object) -> int:
+        """
+        Get the index at which the given value would be added before any equal elements, in
+        expected O(log n) time.
+
+        Args:
+            value: The value to locate.
+
+        Returns:
+            The index of the first element that is not less than the value.
+        """
+        return self._search(value, right=False)[1] + 1
+
+    def bisect_right(self, value: object) -> int:
+        """
+        Get the index at which the given value would be added after any equal elements, in
+        expected O(log n) time.
+
+        Args:
+            value: The value to locate.
+
+        Returns:
+            The index of the first element that is greater than the value.
+        """
+        return self._search(value, right=True)[1] + 1
+
+    def add(self, value: object) -> None:
+        """
+        Add a new node with the given value, after any equal elements, in expected O(log n) time.
+
+        Args:
+            value: The value to add.
+
+        Returns:
+            None
+        """
+        self._insert(value, self.bisect_right(value))
+
+    def irange(
+        self,
+        lo: object = None,
+        hi: object = None,
+        inclusive: Tuple[bool, bool] = (True, True),
+    ) -> Iterator[object]:
+        """
+        Iterate over the elements between the given bounds, in ascending order. The first element
+        is found in expected O(log n) time, and the rest by following the next links.
+
+        Args:
+            lo: The lower bound, or None for no lower bound.
+            hi: The upper bound, or None for no upper bound.
+            inclusive: Whether the lower and upper bounds are themselves included.
+
+        Returns:
+            An iterator over the elements between the bounds.
+        """
+        node: Union[None, SkipLinkNode] = (
+            self._head
+            if lo is None
+            else self._search(lo, right=not inclusive[0])[0].links[0]
+        )
+        while node is not None:
+            if hi is not None and (
+                hi < node.data if inclusive[1] else not node.data < hi
+            ):
+                return
+            yield node.data
+            node = node.next
+
+    def pop_min(self) -> object:
+        """
+        Remove the smallest element of the linked list, in expected O(1) time.
+
+        Returns:
+            The removed element.
+        """
+        if self._head is None:
+            raise IndexError(f"pop from empty {type(self).__name__}.")
+        data: object = self._head.data
+        self._remove(0)
+        return data
+
+    def pop_max(self) -> object:
+        """
+        Remove the largest element of the linked list, in expected O(log n) time.
+
+        Returns:
+            The removed element.
+        """
+        if self._tail is None:
+            raise IndexError(f"pop from empty {type(self).__name__}.")
+        data: object = self._tail.data
+        self._remove(self._size - 1)
+        return data
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Check if any element of the linked list is equal to the given value, in expected O(log n)
+        time.
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            True if the value is in the linked list, False otherwise.
+        """
+        successor: Union[None, SkipLinkNode] = self._search(value, right=False)[0].next
+        return successor is not None and successor.data == value
+
+    def index(self, value: object) -> int:
+        """
+        Get the index of the first element of the linked list equal to the given value, in
+        expected O(log n) time.
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            The index of the first element equal to the value.
+        """
+        node, position = self._search(value, right=False)
+        if node.next is None or node.next.data != value:
+            raise ValueError(f"{value!r} is not in {type(self).__name__}.")
+        return position + 1
+
+    def count(self, value: object) -> int:
+        """
+        Count the elements of the linked list equal to the given value, in expected O(log n) time.
+
+        Args:
+            value: The value to count.
+
+        Returns:
+            The number of elements equal to the value.
+        """
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def remove(self, value: object) -> None:
+        """
+        Remove the first element of the linked list equal to the given value, in expected
+        O(log n) time.
+
+        Args:
+            value: The value to remove.
+
+        Returns:
+            None
+        """
+        self._remove(self.index(value))
+
+    def _check_order(self, value: object, index: int, replace: bool) -> None:
+        """
+        Make sure that putting the given value at the given position keeps the linked list sorted.
+
+        Args:
+            value: The value to put.
+            index: The position to put the value at.
+            replace: Whether the value replaces the element at the position (rather than being
+                inserted before it).
+
+        Returns:
+            None
+        """
+        predecessor: Union[None, SkipLinkNode] = (
+            None if index == 0 else self._node_at(index - 1)
+        )
+        successor: Union[None, SkipLinkNode] = self._node_at(
+            index + 1 if replace else index
+        )
+        if (predecessor is not None and value < predecessor.data) or (
+            successor is not None and successor.data < value
+        ):
+            raise ValueError(
+                f"Cannot put {value!r} at index {index} of {type(self).__name__}; "
+                "use add instead to keep the linked list sorted."
+            )
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Set the data of the node at the given index (or the nodes in the given slice) of the
+        linked list, as long as the linked list stays sorted.
+
+        Args:
+            key: The index (or slice) of the node(s) to set.
+            value: The data to set the node(s) to.
+
+        Returns:
+            None
+        """
+        if not isinstance(key, slice):
+            if 0 <= key < self._size:
+                self._check_order(value, key, replace=True)
+            super().__setitem__(key, value)
+            return
+
+        nodes = self._slice_nodes(key)
+        old_values = [node.data for node in nodes]
+        super().__setitem__(key, value)
+        data = list(self.values())
+        if any(data[idx + 1] < data[idx] for idx in range(len(data) - 1)):
+            for node, old_value in zip(nodes, old_values):
+                node.data = old_value
+            raise ValueError(
+                f"Cannot assign {value!r} to {key} of {type(self).__name__}; "
+                "it would no longer be sorted."
+            )
+
+    def insert_at_head(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the head of the linked list, which is only
+        allowed if the data is not greater than the smallest element.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        self._check_order(data, 0, replace=False)
+        super().insert_at_head(data)
+
+    def insert_at_tail(self, data: object) -> None:
+        """
+        Insert a new node with the given data at the tail of the linked list, which is only
+        allowed if the data is not less than the largest element.
+
+        Args:
+            data: Any data to store in the new node to insert.
+
+        Returns:
+            None
+        """
+        self._check_order(data, self._size, replace=False)
+        super().insert_at_tail(data)
+
+    def insert_at_index(self, data: object, index: int) -> None:
+        if 0 <= index <= self._size:
+            self._check_order(data, index, replace=False)
+        super().insert_at_index(data, index)
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Add a new node for each item in the given iterable. The items are sorted first; if they
+        all belong after the current elements (e.g., when the linked list is created), they are
+        linked at the tail in O(k) for k items, and otherwise they are added one by one.
+
+        Args:
+            iterable: The data to store in the new nodes to add.
+
+        Returns:
+            None
+        """
+        items: list = sorted(iterable)
+        if not items:
+            return
+        if self._tail is None or not items[0] < self._tail.data:
+            super().extend(items)
+            return
+        for data in items:
+            self.add(data)
@@ -0,0 +1,437 @@
+"""
+This module contains the UnrolledLinkedList class that represents an unrolled linked list, where
+each node stores a small block of elements rather than a single element.
+"""
+
+from typing import Dict, Union, Iterable, List, Tuple
+
+# these are the custom classes that we will use in the linked list
+from node.abstract import Node
+from node.impl import DoubleLinkNode
+from linked_list.abstract import LinkedList
+
+
+class UnrolledLinkNode(Node):
+    """
+    A lightweight handle to an element of an UnrolledLinkedList. The handle does not store any
+    data itself; reading or writing its data reads or writes the element at the given offset of
+    the given block, and its next and prev attributes are handles to the neighbouring elements
+    (or None).
+
+    Handles are created on demand (e.g., during iteration), so two handles to the same element are
+    equal but not identical. A handle is no longer meaningful once the linked list is modified, as
+    elements may move between blocks.
+
+    Attributes:
+        data: The element stored at the offset of the block.
+        next: A handle to the element after this one in the linked list.
+        prev: A handle to the element before this one in the linked list.
+    """
+
+    __slots__ = ("block", "offset")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, block: DoubleLinkNode, offset: int
+    ) -> None:
+        self.block: DoubleLinkNode = block
+        self.offset: int = offset
+
+    @property
+    def data(self) -> object:
+        """
+        Get the element stored at the offset of the block.
+
+        Returns:
+            The element stored at the offset of the block.
+        """
+        return self.block.data[self.offset]
+
+    @data.setter
+    def data(self, value: object) -> None:
+        """
+        Set the element stored at the offset of the block.
+
+        Args:
+            value: The element to store at the offset of the block.
+
+        Returns:
+            None
+        """
+        self.block.data[self.offset] = value
+
+    @property
+    def next(self) -> Union[None, "UnrolledLinkNode"]:
+        """
+        Get a handle to the element after this one in the linked list.
+
+        Returns:
+            A handle to the next element, or None if this is the last element.
+        """
+        if self.offset + 1 < len(self.block.data):
+            return UnrolledLinkNode(self.block, self.offset + 1)
+        if self.block.next is None:
+            return None
+        return UnrolledLinkNode(self.block.next, 0)
+
+    @property
+    def prev(self) -> Union[None, "UnrolledLinkNode"]:
+        """
+        Get a handle to the element before this one in the linked list.
+
+        Returns:
+            A handle to the previous element, or None if this is the first element.
+        """
+        if self.offset > 0:
+            return UnrolledLinkNode(self.block, self.offset - 1)
+        if self.block.prev is None:
+            return None
+        return UnrolledLinkNode(self.block.prev, len(self.block.prev.data) - 1)
+
+
+class UnrolledLinkedList(LinkedList):
+    """
+    An unrolled linked list. Each node in the linked list is a DoubleLinkNode whose data is a
+    Python list (a block) of at most capacity elements. A block is split in half when an insertion
+    overfills it, and is merged with its successor when a removal leaves it less than half full
+    (if the two fit in one block). Traversals and index lookups therefore touch about 1/capacity
+    as many Python objects as a singly or doubly linked list would.
+
+    If the linked list is empty, the head and tail are None, and there are no blocks.
+
+    The linked list may be iterated over to access each element in the list; iteration yields
+    UnrolledLinkNode handles, so the interface is the same as for the other linked lists.
+
+    An object of UnrolledLinkedList can be compared to other linked lists for equality, inequality,
+    less than, less than or equal to, greater than, greater than or equal to, and hashed.
+    """
+
+    def __init__(self, *args, capacity: int = 64) -> None:
+        if capacity < 2:
+            raise ValueError("The capacity of a block must be at least 2.")
+        self.capacity: int = capacity
+        self._last_block: Union[None, DoubleLinkNode] = (
+            None  # order matters here, *args may define the last block
+        )
+        super().__init__(*args)
+
+    def __getstate__(self) -> Dict[str, object]:
+        """
+        Get the state of the linked list to pickle: the data of its nodes as a single flat list,
+        and the capacity of its blocks.
+
+        Returns:
+            The state of the linked list.
+        """
+        state: Dict[str, object] = super().__getstate__()
+        state["capacity"] = self.capacity
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """
+        Restore the state of an unpickled (empty) linked list, setting the capacity of its blocks
+        before inserting the data.
+
+        Args:
+            state: The state of the linked list, as returned by __getstate__.
+
+        Returns:
+            None
+        """
+        self.capacity = state["capacity"]
+        super().__setstate__(state)
+
+    def _blocks(self) -> iter:
+        """
+        Iterate over the blocks of the linked list, in order.
+
+        Returns:
+            An iterator over the blocks (i.e., DoubleLinkNode objects) of the linked list.
+        """
+        block: Union[None, DoubleLinkNode] = self._head
+        while block is not None:
+            yield block
+            block = block.next
+
+    def _locate(self, index: int) -> Tuple[DoubleLinkNode, int]:
+        """
+        Get the block holding the element at the given position, and the element's offset within
+        that block. The walk starts from whichever end of the linked list is closer.
+
+        Args:
+            index: The position of the element, which must be in bounds.
+
+        Returns:
+            The block holding the element, and the offset of the element within the block.
+        """
+        if index < self._size // 2:
+            block: DoubleLinkNode = self._head
+            while index >= len(block.data):
+                index -= len(block.data)
+                block = block.next
+            return block, index
+
+        index = self._size - index  # the position counted backwards from the end
+        block = self._last_block
+        while index > len(block.data):
+            index -= len(block.data)
+            block = block.prev
+        return block, len(block.data) - index
+
+    def _link_after(
+        self, block: Union[None, DoubleLinkNode], items: List[object]
+    ) -> DoubleLinkNode:
+        """
+        Create a new block holding the given items, and link it after the given block (or at the
+        head of the linked list, if the given block is None).
+
+        Args:
+            block: The block to link the new block after, or None.
+            items: The items to store in the new block.
+
+        Returns:
+            The new block.
+        """
+        new_block = DoubleLinkNode(items)
+        new_block.prev = block
+        new_block.next = self._head if block is None else block.next
+        if new_block.next is not None:
+            new_block.next.prev = new_block
+        else:
+            self._last_block = new_block
+        if block is None:
+            self._head = new_block
+        else:
+            block.next = new_block
+        return new_block
+
+    def _unlink(self, block: DoubleLinkNode) -> None:
+        """
+        Unlink the given block from the linked list.
+
+        Args:
+            block: The block to unlink.
+
+        Returns:
+            None
+        """
+        if block.prev is not None:
+            block.prev.next = block.next
+        else:
+            self._head = block.next
+        if block.next is not None:
+            block.next.prev = block.prev
+        else:
+            self._last_block = block.prev
+
+    def _rebalance(self, block: DoubleLinkNode) -> None:
+        """
+        Restore the invariants of the given block after an element was removed from it: an empty
+        block is unlinked, and a block that is less than half full absorbs its successor if the
+        two fit in a single block.
+
+        Args:
+            block: The block an element was removed from.
+
+        Returns:
+            None
+        """
+        if not block.data:
+            self._unlink(block)
+            return
+
+        successor: Union[None, DoubleLinkNode] = block.next
+        if (
+            successor is not None
+            and len(block.data) < self.capacity // 2
+            and len(block.data) + len(successor.data) <= self.capacity
+        ):
+            block.data.extend(successor.data)
+            self._unlink(successor)
+
+    @property
+    def head(self) -> Union[None, UnrolledLinkNode]:
+        """
+        Get a handle to the head of the linked list.
+
+        Returns:
+            A handle to the first element in the linked list, or None if the linked list is empty.
+        """
+        if self._head is None:
+            return None
+        return UnrolledLinkNode(self._head, 0)
+
+    @head.setter
+    def head(self, node: Union[None, Node]) -> None:
+        """
+        Replace the contents of the linked list with the data of the chain of nodes starting at
+        the given node. Since the data are copied into blocks, later changes to the given nodes are
+        not reflected in the linked list.
+
+        Args:
+            node: The first node of the chain to copy, or None to empty the linked list.
+
+        Returns:
+            None
+        """
+        data: list = []
+        while node is not None:
+            data.append(node.data)
+            node = node.next
+        self._head, self._last_block = None, None
+        self._adjust_size(-self._size)
+        self.extend(data)
+
+    @property
+    def tail(self) -> Union[None, UnrolledLinkNode]:
+        """
+        Get a handle to the tail of the linked list.
+
+        Returns:
+            A handle to the last element in the linked list, or None if the linked list is empty.
+        """
+        if self._last_block is None:
+            return None
+        return UnrolledLinkNode(self._last_block, len(self._last_block.data) - 1)
+
+    def __iter__(self) -> iter:
+        for block in self._blocks():
+            for offset in range(len(block.data)):
+                yield UnrolledLinkNode(block, offset)
+
+    def values(self) -> iter:
+        """
+        Iterate over the elements of the linked list, in order, without creating node handles.
+
+        Returns:
+            An iterator over the elements stored in the linked list.
+        """
+        for block in self._blocks():
+            yield from block.data
+
+    def _node_at(self, index: int) -> Union[None, UnrolledLinkNode]:
+        """
+        Get a handle to the element at the given non-negative index in the linked list. Only the
+        blocks (not the elements) before the index are visited.
+
+        Args:
+            index: The index of the element to get.
+
+        Returns:
+            A handle to the element at the given index, or None if the index is out of bounds.
+        """
+        if index >= self._size:
+            return None
+        return UnrolledLinkNode(*self._locate(index))
+
+    def insert_at_head(self, data: object) -> None:
+        """
+        Insert a new element with the given data at the head of the linked list.
+
+        Args:
+            data: Any data to store in the new element to insert.
+
+        Returns:
+            None
+        """
+        if isinstance(data, Node):
+            raise ValueError(
+                "Cannot insert a Node object. "
+                "Insert the data instead if this was intended behavior."
+            )
+
+        self.insert_at_index(data, 0)
+
+    def remove_at_head(self) -> None:
+        """
+        Remove the element at the head of the linked list, if it exists.
+
+        Returns:
+            None
+        """
+        if self._head is not None:
+            del self._head.data[0]
+            self._adjust_size(-1)
+            self._rebalance(self._head)
+
+    def insert_at_tail(self, data: object) -> None:
+        """
+        Insert a new element with the given data at the tail of the linked list.
+
+        Args:
+            data: Any data to store in the new element to insert.
+
+        Returns:
+            None
+        """
+        if self._last_block is None or len(self._last_block.data) >= self.capacity:
+            self._link_after(self._last_block, [data])
+        else:
+            self._last_block.data.append(data)
+        self._adjust_size(1)
+
+    def extend(self, iterable: Iterable[object]) -> None:
+        """
+        Insert a new element at the tail of the linked list for each item in the given iterable,
+        preserving their order. The last block is filled up, and then new full blocks are linked
+        after it.
+
+        Args:
+            iterable: The data to store in the new elements to insert.
+
+        Returns:
+            None
+        """
+        items: list = list(iterable)
+        start: int = 0
+        if self._last_block is not None:
+            start = self.capacity - len(self._last_block.data)
+            self._last_block.data.extend(items[:start])
+        for offset in range(start, len(items), self.capacity):
+            self._link_after(self._last_block, items[offset : offset + self.capacity])
+        self._adjust_size(len(items))
+
+    def remove_at_tail(self) -> None:
+        if self._last_block is not None:
+            self._last_block.data.pop()
+            self._adjust_size(-1)
+            if not self._last_block.data:
+                self._unlink(self._last_block)
+
+    def insert_at_index(self, data: object, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index > self._size:
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        if index == self._size:
+            self.insert_at_tail(data)
+            return
+
+        block, offset = self._locate(index)
+        block.data.insert(offset, data)
+        self._adjust_size(1)
+        if len(block.data) > self.capacity:  # split the overfull block in half
+            half: int = len(block.data) // 2
+            self._link_after(block, block.data[half:])
+            del block.data[half:]
+
+    def remove_at_index(self, index: int) -> None:
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+
+        if index >= self._size:
+            if index == 0:  # removing from an empty list is a no-op
+                return
+            # the index is out of bounds (i.e., greater than the list's size)
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size {self.size}."
+            )
+
+        block, offset = self._locate(index)
+        del block.data[offset]
+        self._adjust_size(-1)
+        self._rebalance(block)
@@ -7,7 +7,7 @@ from typing import Union
 # these are the custom classes that we will use in the linked list
 from node.abstract import Node
 from node.impl import DoubleLinkNode
-from linked_list.impl.single import SingleLinkedList
+from linked_list.soln.single import SingleLinkedList
 
 
 class DoubleLinkedList(SingleLinkedList):
@@ -47,12 +47,13 @@ class DoubleLinkedList(SingleLinkedList):
             )
 
         new_node = DoubleLinkNode(data)
-        new_node.next = self.head
-        if self.head is not None:
-            self.head.prev = new_node
+        new_node.next = self._head
+        if self._head is not None:
+            self._head.prev = new_node
         else:
             self.tail = new_node  # if the list was empty, the tail is also the head
-        self.head = new_node
+        self._head = new_node
+        self._adjust_size(1)
 
     def remove_at_head(self) -> None:
         """
@@ -61,10 +62,13 @@ class DoubleLinkedList(SingleLinkedList):
         Returns:
             None
         """
-        if self.head is not None:
-            self.head = self.head.next
-            if self.head is not None:
-                self.head.prev = None
+        if self._head is not None:
+            self._head = self._head.next
+            if self._head is not None:
+                self._head.prev = None
+            else:
+                self.tail = None  # the only node was removed, so the list is empty
+            self._adjust_size(-1)
 
     def insert_at_tail(self, data: object) -> None:
         """
@@ -77,8 +81,9 @@ class DoubleLinkedList(SingleLinkedList):
             None
         """
         new_node: DoubleLinkNode = DoubleLinkNode(data)
+        self._adjust_size(1)
         if self.is_empty:
-            self.head, self.tail = new_node, new_node
+            self._head, self.tail = new_node, new_node
             return
 
         self.tail.next = new_node
@@ -87,15 +92,16 @@ class DoubleLinkedList(SingleLinkedList):
 
     def remove_at_tail(self) -> None:
         # base case of empty list
-        if self.head is None:
+        if self._head is None:
             return
 
+        self._adjust_size(-1)
         self.tail = self.tail.prev
         if self.tail is not None:
             self.tail.next = None
         else:
             # if the tail is None, the list is empty
-            self.head = None
+            self._head = None
 
     def insert_at_index(self, data: object, index: int) -> None:
         if index < 0:
@@ -112,7 +118,10 @@ class DoubleLinkedList(SingleLinkedList):
                 new_node.prev = node
                 if node.next is not None:
                     node.next.prev = new_node
+                else:
+                    self.tail = new_node  # inserted after the last node
                 node.next = new_node
+                self._adjust_size(1)
                 return
 
         # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
@@ -134,6 +143,9 @@ class DoubleLinkedList(SingleLinkedList):
                     node.next = node.next.next
                     if node.next is not None:
                         node.next.prev = node
+                    else:
+                        self.tail = node  # removed the last node
+                    self._adjust_size(-1)
                     return
 
         # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
@@ -34,7 +34,7 @@ class SingleLinkedList(LinkedList):
             empty, both values are None. If the list has only one node, the second value is None.
             If the list has two or more nodes, both values are not None.
         """
-        curr: Union[None, SingleLinkNode] = self.head
+        curr: Union[None, SingleLinkNode] = self._head
         predecessor: Union[None, SingleLinkNode] = None
 
         if curr is None:
@@ -62,8 +62,9 @@ class SingleLinkedList(LinkedList):
             )
 
         new_node = SingleLinkNode(data)
-        new_node.next = self.head
-        self.head = new_node
+        new_node.next = self._head
+        self._head = new_node
+        self._adjust_size(1)
 
     def remove_at_head(self) -> None:  # problem-solving
         """
@@ -72,8 +73,9 @@ class SingleLinkedList(LinkedList):
         Returns:
             None
         """
-        if self.head is not None:
-            self.head = self.head.next
+        if self._head is not None:
+            self._head = self._head.next
+            self._adjust_size(-1)
 
     def insert_at_tail(self, data: object) -> None:  # collaboration
         """
@@ -86,8 +88,9 @@ class SingleLinkedList(LinkedList):
             None
         """
         new_node: SingleLinkNode = SingleLinkNode(data)
-        if self.head is None:
-            self.head = new_node
+        self._adjust_size(1)
+        if self._head is None:
+            self._head = new_node
             return
 
         last_node, _ = self.__last_nodes()
@@ -95,12 +98,14 @@ class SingleLinkedList(LinkedList):
 
     def remove_at_tail(self) -> None:  # collaboration
         # base case of empty list
-        if self.head is None:
+        if self._head is None:
             return
 
+        self._adjust_size(-1)
+
         # base case of single node list
-        if self.head.next is None:
-            self.head = None
+        if self._head.next is None:
+            self._head = None
             return
 
         # general case
@@ -120,6 +125,7 @@ class SingleLinkedList(LinkedList):
                 new_node = SingleLinkNode(data)
                 new_node.next = node.next
                 node.next = new_node
+                self._adjust_size(1)
                 return
 
         # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
@@ -139,6 +145,7 @@ class SingleLinkedList(LinkedList):
             if idx == index - 1:
                 if node.next is not None:
                     node.next = node.next.next
+                    self._adjust_size(-1)
                     return
 
         # if we reach this point, the index is out of bounds (i.e., greater than the list's size)
@@ -0,0 +1,187 @@
+"""
+This module contains lazy views over slices of linked lists. A view remembers which positions of
+a linked list it selects (as a range), but not the nodes themselves, so creating a view is O(1)
+and streaming through it does not materialize a list of nodes the way slicing does.
+
+A view is invalidated when its linked list is structurally modified (e.g., a node is inserted or
+removed), as its positions would no longer select the same nodes. Using an invalidated view
+raises a RuntimeError, in the same way as modifying a dict while iterating over it. Changing the
+data of the selected nodes (through the view or the linked list) does not invalidate it.
+"""
+
+from typing import Iterator, Union
+
+# these are the custom classes that we will use in the views
+from node.abstract import Node
+
+
+class LinkedListView:
+    """
+    A lazy, writable view over the positions of a linked list selected by a slice. The view
+    supports len, iteration (over the selected nodes, like the linked list itself), indexing, and
+    slicing (which returns a nested view, without copying). Assigning to an index or a slice of
+    the view assigns to the corresponding positions of the linked list.
+
+    Attributes:
+        linked_list: The linked list the view is over.
+        indices: The positions of the linked list selected by the view, in order.
+    """
+
+    def __init__(self, linked_list, indices: range) -> None:
+        # pylint: disable=protected-access
+        self.linked_list = linked_list
+        self.indices: range = indices
+        self._version: int = linked_list._version
+
+    def _check_valid(self) -> None:
+        """
+        Make sure the linked list was not structurally modified since the view was created.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        if self._version != self.linked_list._version:
+            raise RuntimeError("Linked list was modified since the view was created.")
+
+    @staticmethod
+    def _slice_of_linked_list(indices: range) -> slice:
+        """
+        Get the slice of the linked list that selects the given positions, in the same order.
+
+        Args:
+            indices: The positions to select.
+
+        Returns:
+            The slice selecting the positions.
+        """
+        stop: Union[None, int] = indices.stop
+        if stop < 0:  # a descending range that ends at the first position
+            stop = None
+        return slice(indices.start, stop, indices.step)
+
+    def __len__(self) -> int:
+        """
+        Get the number of positions selected by the view.
+
+        Returns:
+            The number of positions selected by the view.
+        """
+        self._check_valid()
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[Node]:
+        """
+        Iterate over the selected nodes, in order, following the links of the linked list from
+        the first selected node. A descending view follows the prev links if the nodes have them;
+        otherwise, the selected nodes are collected in one forward pass and then reversed.
+
+        Returns:
+            An iterator over the selected nodes.
+        """
+        self._check_valid()
+        indices: range = self.indices
+        if not indices:
+            return
+
+        # pylint: disable=protected-access
+        node = self.linked_list._node_at(indices.start)
+        if indices.step < 0 and not hasattr(node, "prev"):
+            ascending: slice = self._slice_of_linked_list(indices[::-1])
+            yield from reversed(self.linked_list._slice_nodes(ascending))
+            return
+
+        for count in range(len(indices)):
+            if count:
+                for _ in range(abs(indices.step)):
+                    node = node.next if indices.step > 0 else node.prev
+            yield node
+            self._check_valid()
+
+    def values(self) -> Iterator[object]:
+        """
+        Iterate over the data of the selected nodes, in order.
+
+        Returns:
+            An iterator over the data of the selected nodes.
+        """
+        return (node.data for node in self)
+
+    def __getitem__(self, key) -> Union[Node, "LinkedListView"]:
+        """
+        Get the selected node at the given index of the view, or a nested view over the given
+        slice of the view.
+
+        Args:
+            key: The index of the node to get, or the slice to view.
+
+        Returns:
+            The node at the given index of the view, or a view over the given slice.
+        """
+        self._check_valid()
+        if isinstance(key, slice):
+            return LinkedListView(self.linked_list, self.indices[key])
+        return self.linked_list[self._position(key)]
+
+    def __setitem__(self, key, value) -> None:
+        """
+        Set the data of the selected node at the given index of the view (or the nodes in the
+        given slice of the view), through the linked list's own item assignment.
+
+        Args:
+            key: The index (or slice) of the node(s) to set.
+            value: The data to set the node(s) to.
+
+        Returns:
+            None
+        """
+        self._check_valid()
+        if isinstance(key, slice):
+            indices: range = self.indices[key]
+            if len(value) != len(indices):
+                raise ValueError(
+                    f"Cannot assign {len(value)} values to a slice of {len(indices)} nodes."
+                )
+            if indices:
+                self.linked_list[self._slice_of_linked_list(indices)] = value
+            return
+        self.linked_list[self._position(key)] = value
+
+    def _position(self, index: int) -> int:
+        """
+        Get the position in the linked list of the given index of the view.
+
+        Args:
+            index: The index of the view.
+
+        Returns:
+            The corresponding position in the linked list.
+        """
+        if index < 0:
+            raise IndexError("Index must be non-negative.")
+        if index >= len(self.indices):
+            raise IndexError(
+                f"Index {index} does not exist for {type(self).__name__} of size "
+                f"{len(self.indices)}."
+            )
+        return self.indices[index]
+
+    def __str__(self) -> str:
+        """
+        The string representation of the view is the string representation of the data in each
+        selected node separated by commas and enclosed in square brackets.
+
+        Returns:
+            The string representation of the view.
+        """
+        return str(list(self.values()))
+
+    def __repr__(self) -> str:
+        """
+        The string representation of the view is the string representation of the data in each
+        selected node separated by commas and enclosed in square brackets.
+
+        Returns:
+            The string representation of the view.
+        """
+        return str(self)
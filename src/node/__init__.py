@@ -8,9 +8,10 @@ Classes:
     Node: A node in a linked list.
     SingleLinkNode: A node in a single linked list.
     DoubleLinkNode: A node in a doubly linked list.
+    SkipLinkNode: A node in a skip list, with links that skip over other nodes.
 """
 
 from .abstract import Node
-from .impl import SingleLinkNode, DoubleLinkNode
+from .impl import SingleLinkNode, DoubleLinkNode, SkipLinkNode
 
-__all__ = ["Node", "SingleLinkNode", "DoubleLinkNode"]
+__all__ = ["Node", "SingleLinkNode", "DoubleLinkNode", "SkipLinkNode"]
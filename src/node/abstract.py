@@ -14,10 +14,17 @@ class Node:
     before the current node. For all types of linked lists, the next attribute is used to reference
     the node after the current node.
 
+    Nodes declare __slots__ rather than carrying a per-instance __dict__, since a linked list may
+    hold millions of them. Subclasses should declare __slots__ for any attributes they add. On
+    64-bit CPython 3.11, a Node occupies about 40 bytes (versus about 80 bytes with a __dict__),
+    not counting the data it references.
+
     Attributes:
         data: The data stored in the node.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, data: object) -> None:
         self.data: object = data  # can store any data
 
@@ -0,0 +1,128 @@
+"""
+A module to test the behavior that is specific to the ArrayLinkedList class.
+"""
+
+import unittest
+from typing import Iterable, List
+
+from node import Node, SingleLinkNode
+from linked_list import ArrayLinkedList
+
+
+class CountingBuffer(list):
+    """
+    A buffer of links that records every link read from it.
+    """
+
+    def __init__(self, links: Iterable[int], reads: List[int]) -> None:
+        super().__init__(links)
+        self.reads: List[int] = reads
+
+    def __getitem__(self, index):
+        self.reads.append(index)
+        return super().__getitem__(index)
+
+
+class TestArrayLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure the buffers of the ArrayLinkedList class are managed correctly.
+    """
+
+    def test_free_slots_are_reused(self) -> None:
+        """
+        Test that the slots of removed elements are reused by later insertions, rather than
+        growing the buffers.
+
+        Returns:
+            None
+        """
+        linked_list = ArrayLinkedList(5, 6, 7, 8)
+        linked_list.remove_at_index(1)
+        linked_list.remove_at_index(1)
+        linked_list.insert_at_head(4)
+        linked_list.insert_at_index(6, 2)
+        linked_list.extend([9])
+        self.assertEqual("[4, 5, 6, 8, 9]", str(linked_list))
+        self.assertEqual(len(linked_list._data), 5)  # pylint: disable=protected-access
+
+    def test_buffers_released_when_empty(self) -> None:
+        """
+        Test that the buffers are released once the last element is removed.
+
+        Returns:
+            None
+        """
+        linked_list = ArrayLinkedList(5, 6, 7)
+        linked_list.remove_at_tail()
+        linked_list.remove_at_head()
+        linked_list.remove_at_index(0)
+        self.assertTrue(linked_list.is_empty)
+        self.assertEqual(len(linked_list._data), 0)  # pylint: disable=protected-access
+        linked_list.extend([5, 6])
+        self.assertEqual("[5, 6]", str(linked_list))
+        self.assertEqual(linked_list.tail.prev, 5)
+
+    def test_node_handles(self) -> None:
+        """
+        Test that the node handles yielded by the linked list read and write through to the
+        buffers and behave like nodes.
+
+        Returns:
+            None
+        """
+        linked_list = ArrayLinkedList(5, 6, 7)
+        node = linked_list[1]
+        self.assertIsInstance(node, Node)
+        self.assertEqual(node.prev, 5)
+        self.assertEqual(node.next, 7)
+        self.assertIsNone(linked_list.head.prev)
+        node.data = 8
+        self.assertEqual("[5, 8, 7]", str(linked_list))
+        self.assertEqual(hash((Node(5), Node(8), Node(7))), hash(linked_list))
+
+    def test_head_assignment_copies_chain(self) -> None:
+        """
+        Test that assigning the head copies the data of the given chain of nodes.
+
+        Returns:
+            None
+        """
+        linked_list = ArrayLinkedList(1, 2, 3)
+        head = SingleLinkNode(5)
+        head.next = SingleLinkNode(6)
+        linked_list.head = head
+        self.assertEqual("[5, 6]", str(linked_list))
+        self.assertEqual(len(linked_list), 2)
+        linked_list.head = None
+        self.assertTrue(linked_list.is_empty)
+
+    def test_sequential_access_reuses_position(self) -> None:
+        """
+        Test that looking up consecutive indices (forward from the head, or backward from the
+        tail) walks from the last located slot rather than from an end of the linked list, and
+        that inserting and removing by index locate their slots the same way.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        size = 1000
+        for indices in (list(range(size)), list(reversed(range(size)))):
+            linked_list = ArrayLinkedList(*range(size))
+            reads: List[int] = []
+            linked_list._next = CountingBuffer(linked_list._next, reads)
+            linked_list._prev = CountingBuffer(linked_list._prev, reads)
+            self.assertEqual(indices, [linked_list[i].data for i in indices])
+            self.assertLess(len(reads), 2 * size)  # rather than about size * size / 4
+
+        linked_list = ArrayLinkedList(*range(10))
+        self.assertEqual(linked_list[7], 7)
+        linked_list.insert_at_index("x", 8)
+        linked_list.remove_at_index(2)
+        self.assertEqual([0, 1, 3, 4, 5, 6, 7, "x", 8, 9], list(linked_list.values()))
+        self.assertEqual(linked_list[8], 8)
+        self.assertEqual(linked_list[6], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
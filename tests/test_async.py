@@ -0,0 +1,220 @@
+"""
+A module to test the asyncio support: async iteration over linked lists, and the AsyncLinkedQueue
+and AsyncLinkedDeque classes.
+"""
+
+import asyncio
+import unittest
+from typing import List
+
+from linked_list import (
+    SingleLinkedList,
+    DoubleLinkedList,
+    ArrayLinkedList,
+    UnrolledLinkedList,
+    SkipLinkedList,
+    IndexedLinkedList,
+    SortedLinkedList,
+    ConcurrentLinkedList,
+    AsyncLinkedQueue,
+    AsyncLinkedDeque,
+)
+
+
+class TestAsyncIteration(unittest.IsolatedAsyncioTestCase):
+    """
+    A TestCase class to help ensure async iteration visits the same nodes as iteration, without
+    blocking the event loop.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lst_types = (
+            SingleLinkedList,
+            DoubleLinkedList,
+            ArrayLinkedList,
+            UnrolledLinkedList,
+            SkipLinkedList,
+            IndexedLinkedList,
+            SortedLinkedList,
+            ConcurrentLinkedList,
+        )
+
+    async def test_async_for(self) -> None:
+        """
+        Test that async iteration yields the nodes in order, for every type of linked list.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(*range(3000))
+            self.assertEqual(
+                [node async for node in linked_list], list(linked_list), lst_type
+            )
+            self.assertEqual(
+                [node.data async for node in linked_list.aiter_nodes(7)],
+                list(range(3000)),
+            )
+            self.assertEqual([node async for node in lst_type()], [])
+        with self.assertRaises(ValueError):
+            async for _ in DoubleLinkedList(1).aiter_nodes(0):
+                pass
+
+    async def test_yields_to_event_loop(self) -> None:
+        """
+        Test that other tasks run during a long async iteration, and that a structural
+        modification made meanwhile is detected.
+
+        Returns:
+            None
+        """
+        linked_list = DoubleLinkedList(*range(100))
+        ticks: List[int] = []
+
+        async def tick() -> None:
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        async for _ in linked_list.aiter_nodes(10):
+            pass
+        ticker.cancel()
+        self.assertGreaterEqual(len(ticks), 10)
+
+        async def modify() -> None:
+            linked_list.remove_at_head()
+
+        with self.assertRaises(RuntimeError):
+            async for node in linked_list.aiter_nodes(10):
+                if node.data == 50:
+                    asyncio.ensure_future(modify())
+
+        # a modification made while the body awaits is detected before the next node
+        linked_list = DoubleLinkedList(*range(10))
+        seen = []
+
+        async def remove(node) -> None:
+            linked_list.remove_node(node)
+
+        with self.assertRaises(RuntimeError):
+            async for node in linked_list.aiter_nodes():
+                seen.append(node.data)
+                if node.data == 3:
+                    await asyncio.ensure_future(remove(node))
+        self.assertEqual(seen, [0, 1, 2, 3])
+
+        # a concurrent linked list tolerates the modification
+        concurrent = ConcurrentLinkedList(*range(100))
+        seen = []
+        async for node in concurrent.aiter_nodes(10):
+            seen.append(node.data)
+            if node.data == 50:
+                concurrent.remove_at_head()
+        self.assertEqual(seen, list(range(100)))
+
+
+class TestAsyncLinkedQueue(unittest.IsolatedAsyncioTestCase):
+    """
+    A TestCase class to help ensure the AsyncLinkedQueue and AsyncLinkedDeque classes keep their
+    order, respect their maximum size, and wake up the tasks waiting on them.
+    """
+
+    async def test_order_and_nowait(self) -> None:
+        """
+        Test the order of the items at both ends, and the nowait variants on an empty or a full
+        queue.
+
+        Returns:
+            None
+        """
+        linked_deque = AsyncLinkedDeque(maxsize=3)
+        await linked_deque.put(2)
+        linked_deque.put_nowait(3)
+        await linked_deque.put_left(1)
+        self.assertTrue(linked_deque.full())
+        with self.assertRaises(asyncio.QueueFull):
+            linked_deque.put_nowait(4)
+        with self.assertRaises(asyncio.QueueFull):
+            linked_deque.put_left_nowait(0)
+        self.assertEqual(await linked_deque.get_right(), 3)
+        self.assertEqual(await linked_deque.get(), 1)
+        self.assertEqual(linked_deque.get_right_nowait(), 2)
+        self.assertTrue(linked_deque.empty())
+        with self.assertRaises(asyncio.QueueEmpty):
+            linked_deque.get_nowait()
+        with self.assertRaises(asyncio.QueueEmpty):
+            linked_deque.get_right_nowait()
+
+    async def test_waiting(self) -> None:
+        """
+        Test that tasks waiting to get (or put) are woken up in order, and that a cancelled task
+        leaves the line without taking an item.
+
+        Returns:
+            None
+        """
+        linked_queue = AsyncLinkedQueue(maxsize=1)
+        getters = [asyncio.ensure_future(linked_queue.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        getters[1].cancel()
+        await linked_queue.put("a")
+        await linked_queue.put("b")
+        self.assertEqual(await getters[0], "a")
+        self.assertEqual(await getters[2], "b")
+        self.assertTrue(getters[1].cancelled())
+
+        await linked_queue.put("c")
+        putter = asyncio.ensure_future(linked_queue.put("d"))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(await asyncio.wait_for(linked_queue.get(), 1), "c")
+        await asyncio.wait_for(putter, 1)
+        self.assertEqual(linked_queue.get_nowait(), "d")
+
+        # a task cancelled while waiting, and skipped by a put before it resumes
+        getters = [asyncio.ensure_future(linked_queue.get()) for _ in range(2)]
+        await asyncio.sleep(0)
+        getters[0].cancel()
+        linked_queue.put_nowait("e")
+        results = await asyncio.gather(*getters, return_exceptions=True)
+        self.assertIsInstance(results[0], asyncio.CancelledError)
+        self.assertEqual(results[1], "e")
+        self.assertTrue(linked_queue.empty())
+
+    async def test_producers_and_consumers(self) -> None:
+        """
+        Test that several producers and consumers exchange every item exactly once through a small
+        queue, and that join returns once every item is marked done.
+
+        Returns:
+            None
+        """
+        linked_queue = AsyncLinkedQueue(maxsize=4)
+        received: List[int] = []
+
+        async def produce(start: int) -> None:
+            for value in range(start, start + 200):
+                await linked_queue.put(value)
+
+        async def consume() -> None:
+            while True:
+                received.append(await linked_queue.get())
+                linked_queue.task_done()
+
+        consumers = [asyncio.ensure_future(consume()) for _ in range(3)]
+        await asyncio.wait_for(
+            asyncio.gather(*(produce(start) for start in range(0, 600, 200))), 10
+        )
+        await asyncio.wait_for(linked_queue.join(), 10)
+        for consumer in consumers:
+            consumer.cancel()
+        self.assertEqual(sorted(received), list(range(600)))
+        with self.assertRaises(ValueError):
+            linked_queue.task_done()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+A module to test the LinkedQueue and LinkedDeque classes.
+"""
+
+import queue
+import threading
+import time
+import unittest
+from typing import List
+
+from linked_list import LinkedDeque, LinkedQueue
+
+
+class TestLinkedQueue(unittest.TestCase):
+    """
+    A TestCase class to help ensure the LinkedQueue and LinkedDeque classes keep their order,
+    respect their maximum size, and wake up the threads waiting on them.
+    """
+
+    def test_fifo_order(self) -> None:
+        """
+        Test that items (put one by one or in batches) are taken in the order they were put.
+
+        Returns:
+            None
+        """
+        linked_queue = LinkedQueue()
+        linked_queue.put(1)
+        linked_queue.put_many([2, 3, 4])
+        linked_queue.put_nowait(5)
+        self.assertEqual(linked_queue.qsize(), 5)
+        self.assertEqual(linked_queue.get(), 1)
+        self.assertEqual(linked_queue.get_many(3), [2, 3, 4])
+        self.assertEqual(linked_queue.get_many(10), [5])
+        self.assertTrue(linked_queue.empty())
+        with self.assertRaises(queue.Empty):
+            linked_queue.get_nowait()
+        with self.assertRaises(queue.Empty):
+            linked_queue.get_many(2, timeout=0.01)
+        with self.assertRaises(ValueError):
+            linked_queue.get_many(0)
+
+    def test_maxsize(self) -> None:
+        """
+        Test that a full queue refuses new items, and that batches are put entirely or not at all.
+
+        Returns:
+            None
+        """
+        linked_queue = LinkedQueue(maxsize=3)
+        linked_queue.put_many([1, 2])
+        self.assertFalse(linked_queue.full())
+        with self.assertRaises(queue.Full):
+            linked_queue.put_many([3, 4], block=False)
+        with self.assertRaises(queue.Full):
+            linked_queue.put_many([3, 4], timeout=0.01)
+        self.assertEqual(linked_queue.qsize(), 2)
+        linked_queue.put(3)
+        self.assertTrue(linked_queue.full())
+        with self.assertRaises(queue.Full):
+            linked_queue.put_nowait(4)
+        with self.assertRaises(queue.Full):
+            linked_queue.put(4, timeout=0.01)
+        with self.assertRaises(ValueError):  # could never fit
+            LinkedQueue(maxsize=3).put_many([1, 2, 3, 4])
+        self.assertEqual(linked_queue.get_many(3), [1, 2, 3])
+
+    def test_deque(self) -> None:
+        """
+        Test that a LinkedDeque can be used at both ends.
+
+        Returns:
+            None
+        """
+        linked_deque = LinkedDeque()
+        linked_deque.put_many([3, 4, 5])
+        linked_deque.put_left(2)
+        linked_deque.put_many_left([0, 1])
+        self.assertEqual(linked_deque.get_right(), 5)
+        self.assertEqual(linked_deque.get_many_right(2), [4, 3])
+        self.assertEqual(linked_deque.get(), 0)
+        self.assertEqual(linked_deque.get_many(5), [1, 2])
+        with self.assertRaises(queue.Empty):
+            linked_deque.get_right(block=False)
+
+    def test_blocking_get_and_put(self) -> None:
+        """
+        Test that a blocked consumer is woken up by a producer, and a blocked producer by a
+        consumer.
+
+        Returns:
+            None
+        """
+        linked_queue = LinkedQueue(maxsize=1)
+        received: List[object] = []
+        consumer = threading.Thread(target=lambda: received.append(linked_queue.get()))
+        consumer.start()
+        linked_queue.put("item")
+        consumer.join(timeout=5)
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(received, ["item"])
+
+        linked_queue.put(1)
+        producer = threading.Thread(target=lambda: linked_queue.put(2))
+        producer.start()
+        self.assertEqual(linked_queue.get(timeout=5), 1)
+        producer.join(timeout=5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(linked_queue.get_nowait(), 2)
+
+    def test_batch_and_single_waiters(self) -> None:
+        """
+        Test that a thread waiting to put (or get) a single item is woken up even when a thread
+        waiting to put (or get) a batch went to sleep before it.
+
+        Returns:
+            None
+        """
+        linked_queue = LinkedQueue(maxsize=2)
+        linked_queue.put_many(["x", "y"])
+        batch_putter = threading.Thread(
+            target=linked_queue.put_many, args=(["a1", "a2"],), daemon=True
+        )
+        batch_putter.start()
+        time.sleep(0.05)  # let the batch putter wait first
+        putter = threading.Thread(target=linked_queue.put, args=("b",), daemon=True)
+        putter.start()
+        time.sleep(0.05)
+        self.assertEqual(linked_queue.get(timeout=5), "x")
+        putter.join(timeout=5)
+        self.assertFalse(putter.is_alive(), "the single-item putter missed its wakeup")
+        self.assertEqual(linked_queue.get_many(2, timeout=5), ["y", "b"])
+        batch_putter.join(timeout=5)
+        self.assertFalse(batch_putter.is_alive())
+        self.assertEqual(linked_queue.get_many(2, timeout=5), ["a1", "a2"])
+
+        received: List[object] = []
+        batch_getter = threading.Thread(
+            target=lambda: received.extend(linked_queue.get_many(2)), daemon=True
+        )
+        batch_getter.start()
+        time.sleep(0.05)  # let the batch getter wait first
+        getter = threading.Thread(
+            target=lambda: received.append(linked_queue.get()), daemon=True
+        )
+        getter.start()
+        time.sleep(0.05)
+        linked_queue.put("c")
+        linked_queue.put("d")
+        batch_getter.join(timeout=5)
+        self.assertFalse(batch_getter.is_alive(), "the batch getter missed its wakeup")
+        linked_queue.put("e")  # in case the batch getter took both items
+        getter.join(timeout=5)
+        self.assertFalse(getter.is_alive(), "the single-item getter missed its wakeup")
+        received.extend(linked_queue.get_many(3) if not linked_queue.empty() else [])
+        self.assertEqual(sorted(received), ["c", "d", "e"])
+
+    def test_producers_and_consumers(self) -> None:
+        """
+        Test that several producers and consumers exchange every item exactly once through a small
+        queue, and that join returns once every item is marked done.
+
+        Returns:
+            None
+        """
+        linked_queue = LinkedQueue(maxsize=8)
+        count, received = 1000, []
+        lock = threading.Lock()
+
+        def produce(start: int) -> None:
+            for value in range(start, start + count, 4):
+                linked_queue.put_many(range(value, value + 4))
+
+        def consume() -> None:
+            while True:
+                items = linked_queue.get_many(5)
+                with lock:
+                    received.extend(items)
+                for _ in items:
+                    linked_queue.task_done()
+
+        producers = [
+            threading.Thread(target=produce, args=(i * count,)) for i in range(3)
+        ]
+        for thread in producers:
+            thread.start()
+        for _ in range(2):
+            threading.Thread(target=consume, daemon=True).start()
+        for thread in producers:
+            thread.join(timeout=30)
+            self.assertFalse(thread.is_alive(), "a producer is deadlocked")
+        linked_queue.join()
+        self.assertEqual(sorted(received), list(range(3 * count)))
+        with self.assertRaises(ValueError):
+            linked_queue.task_done()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+A module to test the LinkedCache class.
+"""
+
+import unittest
+
+from linked_list import LinkedCache
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """
+    A clock that only moves when told to, so that expiry can be tested deterministically.
+    """
+
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLinkedCache(unittest.TestCase):
+    """
+    A TestCase class to help ensure the LinkedCache class evicts and expires the right entries.
+    """
+
+    def test_lru_eviction(self) -> None:
+        """
+        Test that the least recently used entry is evicted, and that hits, misses and evictions are
+        counted and reported to the eviction callback.
+
+        Returns:
+            None
+        """
+        evicted = []
+        cache = LinkedCache(2, on_evict=lambda key, value: evicted.append((key, value)))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now the least recently used
+        cache.put("c", 3)
+        self.assertEqual(evicted, [("b", 2)])
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        cache.put("a", 10)  # replacing a value counts as a use
+        cache.put("d", 4)
+        self.assertEqual(evicted, [("b", 2), ("c", 3)])
+        self.assertEqual(cache.get("a"), 10)
+        self.assertEqual(cache.get("d"), 4)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (3, 1, 2))
+
+    def test_lfu_eviction(self) -> None:
+        """
+        Test that the least frequently used entry is evicted, breaking ties by recency.
+
+        Returns:
+            None
+        """
+        cache = LinkedCache(3, policy="lfu")
+        for key in "abc":
+            cache.put(key, key.upper())
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.put("d", "D")  # "c" is the only entry used once
+        self.assertEqual(["a", "b", "d"], sorted(key for key in "abcd" if key in cache))
+        cache.get("d")  # "b" and "d" are both used twice; "b" less recently
+        cache.put("e", "E")
+        self.assertNotIn("b", cache)
+        cache.put("f", "F")  # "e" is the only entry used once
+        self.assertEqual(
+            ["a", "d", "f"], sorted(key for key in "abcdef" if key in cache)
+        )
+        self.assertEqual(cache.evictions, 3)
+
+    def test_ttl_expiry(self) -> None:
+        """
+        Test that entries expire after their time to live, both lazily and through expire().
+
+        Returns:
+            None
+        """
+        for policy in ("lru", "lfu"):
+            clock, evicted = FakeClock(), []
+            cache = LinkedCache(
+                3,
+                policy=policy,
+                ttl=10,
+                on_evict=lambda key, _: evicted.append(key),
+                clock=clock,
+            )
+            cache.put("a", 1)
+            clock.now = 5
+            cache.put("b", 2)
+            cache.put("c", 3)
+            clock.now = 12
+            self.assertNotIn("a", cache)
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("b"), 2)
+            cache.put("c", 30)  # refreshes the time to live
+            clock.now = 20
+            self.assertEqual(cache.expire(), 1)
+            self.assertEqual(cache.get("c"), 30)
+            self.assertEqual(evicted, ["a", "b"])
+            self.assertEqual((cache.expirations, cache.evictions), (2, 0))
+            for key in "def":
+                cache.put(key, key)
+            self.assertEqual(cache.evictions, 1)
+            self.assertEqual(len(cache), 3)
+
+    def test_invalid_arguments(self) -> None:
+        """
+        Test that the cache must have room for an entry and a known policy.
+
+        Returns:
+            None
+        """
+        with self.assertRaises(ValueError):
+            LinkedCache(0)
+        with self.assertRaises(ValueError):
+            LinkedCache(1, policy="fifo")
+
+
+if __name__ == "__main__":
+    unittest.main()
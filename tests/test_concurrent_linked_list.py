@@ -0,0 +1,161 @@
+"""
+A module to test the behavior that is specific to the ConcurrentLinkedList class.
+"""
+
+import random
+import threading
+import unittest
+from typing import Callable, List
+
+from linked_list import ConcurrentLinkedList
+
+
+class TestConcurrentLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure the ConcurrentLinkedList class stays consistent when it is
+    modified by several threads at once.
+    """
+
+    def run_threads(self, targets: List[Callable[[], None]]) -> None:
+        """
+        Run each of the given functions in its own thread, and wait for all of them to finish.
+
+        Args:
+            targets: The functions to run.
+
+        Returns:
+            None
+        """
+        threads = [threading.Thread(target=target) for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+            self.assertFalse(thread.is_alive(), "a thread is deadlocked")
+
+    def check_links(self, linked_list: ConcurrentLinkedList) -> list:
+        """
+        Check that the next and prev links of the linked list agree, and that the size is exact.
+
+        Args:
+            linked_list: The linked list to check.
+
+        Returns:
+            The data stored in the linked list, in order.
+        """
+        forwards = list(linked_list.values())
+        node, backwards = linked_list.tail, []
+        while node is not None:
+            backwards.append(node.data)
+            node = node.prev
+        self.assertEqual(forwards[::-1], backwards)
+        self.assertEqual(len(forwards), linked_list.size)
+        if forwards:
+            self.assertIsNone(linked_list.head.prev)
+            self.assertIsNone(linked_list.tail.next)
+        return forwards
+
+    def test_concurrent_inserts(self) -> None:
+        """
+        Test that inserting from several threads at once, at the head, at the tail, at random
+        indices and in batches, loses no data.
+
+        Returns:
+            None
+        """
+        linked_list = ConcurrentLinkedList()
+        count = 500
+
+        def at_index() -> None:
+            rng = random.Random(19)
+            for value in range(3 * count, 4 * count):
+                linked_list.insert_at_index(
+                    value, rng.randint(0, len(linked_list) // 2)
+                )
+
+        self.run_threads(
+            [
+                lambda: [linked_list.insert_at_head(value) for value in range(count)],
+                lambda: [
+                    linked_list.insert_at_tail(value)
+                    for value in range(count, 2 * count)
+                ],
+                lambda: [
+                    linked_list.extend([value, value + 1])
+                    for value in range(2 * count, 3 * count, 2)
+                ],
+                at_index,
+            ]
+        )
+        data = self.check_links(linked_list)
+        self.assertEqual(list(range(4 * count)), sorted(data))
+
+    def test_concurrent_removals(self) -> None:
+        """
+        Test that removing from both ends, by index and by value from several threads at once
+        removes exactly as many nodes as requested.
+
+        Returns:
+            None
+        """
+        size, count = 4000, 300
+        linked_list = ConcurrentLinkedList(*range(size))
+        removed_by_value: List[int] = []
+
+        def by_value() -> None:
+            for value in range(size // 2 - count, size // 2):
+                try:
+                    linked_list.remove(value)
+                    removed_by_value.append(value)
+                except ValueError:  # already removed from one of the ends
+                    pass
+
+        self.run_threads(
+            [
+                lambda: [linked_list.remove_at_head() for _ in range(count)],
+                lambda: [linked_list.remove_at_tail() for _ in range(count)],
+                lambda: [linked_list.remove_at_index(size // 4) for _ in range(count)],
+                by_value,
+                lambda: [linked_list.insert_at_tail(size) for _ in range(count)],
+            ]
+        )
+        data = self.check_links(linked_list)
+        self.assertEqual(size - 3 * count - len(removed_by_value) + count, len(data))
+        original = [value for value in data if value != size]
+        # the original nodes kept their order, and none of them was removed twice
+        self.assertEqual(sorted(original), original)
+        self.assertEqual(len(set(original)), len(original))
+        for value in removed_by_value:
+            self.assertNotIn(value, data)
+
+    def test_iteration_during_modification(self) -> None:
+        """
+        Test that iterating while other threads modify the linked list neither fails nor yields
+        a node twice.
+
+        Returns:
+            None
+        """
+        linked_list = ConcurrentLinkedList(*range(1000))
+        seen: List[List[int]] = []
+
+        def iterate() -> None:
+            for _ in range(5):
+                seen.append([node.data for node in linked_list])
+
+        self.run_threads(
+            [
+                iterate,
+                lambda: [linked_list.remove_at_head() for _ in range(500)],
+                lambda: [linked_list.insert_at_tail(-1) for _ in range(500)],
+            ]
+        )
+        for data in seen:
+            positive = [value for value in data if value >= 0]
+            self.assertEqual(sorted(positive), positive)
+            self.assertEqual(len(set(positive)), len(positive))
+        self.assertEqual(1000, len(self.check_links(linked_list)))
+
+
+if __name__ == "__main__":
+    unittest.main()
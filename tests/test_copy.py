@@ -0,0 +1,274 @@
+"""
+A module to test copying linked lists, including the copy-on-write copies of the SingleLinkedList
+and DoubleLinkedList classes (and their subclasses).
+"""
+
+import copy
+import gc
+import unittest
+
+from linked_list import (
+    SingleLinkedList,
+    DoubleLinkedList,
+    ArrayLinkedList,
+    UnrolledLinkedList,
+    SkipLinkedList,
+    IndexedLinkedList,
+    SortedLinkedList,
+    ConcurrentLinkedList,
+    PersistentLinkedList,
+    MappedLinkedList,
+    LinkedListView,
+)
+
+
+class TestCopy(unittest.TestCase):
+    """
+    A TestCase class to help ensure a copy of a linked list holds the same data, and that neither
+    the copy nor the original is affected by the modification of the other.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lst_types = (
+            SingleLinkedList,
+            DoubleLinkedList,
+            ArrayLinkedList,
+            UnrolledLinkedList,
+            SkipLinkedList,
+            IndexedLinkedList,
+            ConcurrentLinkedList,
+            PersistentLinkedList,
+            MappedLinkedList,
+        )
+        self.cow_types = (SingleLinkedList, DoubleLinkedList, IndexedLinkedList)
+
+    def test_copies_are_independent(self) -> None:
+        """
+        Test that modifying a copy (or the original) in any way leaves the other unchanged, for
+        every type of linked list.
+
+        Returns:
+            None
+        """
+        modifications = (
+            lambda linked_list: linked_list.insert_at_head(-1),
+            lambda linked_list: linked_list.insert_at_tail(-1),
+            lambda linked_list: linked_list.insert_at_index(-1, 2),
+            lambda linked_list: linked_list.remove_at_head(),
+            lambda linked_list: linked_list.remove_at_tail(),
+            lambda linked_list: linked_list.remove_at_index(2),
+            lambda linked_list: linked_list.extend([-1, -2]),
+            lambda linked_list: linked_list.__setitem__(1, -1),
+            lambda linked_list: linked_list.__setitem__(slice(0, 4, 2), [-1, -2]),
+            lambda linked_list: linked_list.__delitem__(slice(1, 4)),
+            lambda linked_list: linked_list.remove(3),
+        )
+        for lst_type in self.lst_types:
+            for modify in modifications:
+                for modify_copy in (True, False):
+                    original = lst_type(*range(6))
+                    duplicate = copy.copy(original)
+                    self.assertIsInstance(duplicate, lst_type)
+                    self.assertEqual(list(original.values()), list(duplicate.values()))
+                    modify(duplicate if modify_copy else original)
+                    unchanged = original if modify_copy else duplicate
+                    self.assertEqual(list(range(6)), list(unchanged.values()), lst_type)
+                    self.assertEqual(6, len(unchanged))
+                    self.assertEqual(5, unchanged.tail.data)
+                    self.assertIn(3, unchanged)
+
+        sorted_list = SortedLinkedList(3, 1, 2)
+        duplicate = sorted_list.copy()
+        duplicate.add(0)
+        self.assertEqual([1, 2, 3], list(sorted_list.values()))
+        self.assertEqual([0, 1, 2, 3], list(duplicate.values()))
+
+    def test_copies_keep_settings(self) -> None:
+        """
+        Test that a copy keeps the settings of the original that are not data, e.g., the capacity
+        of an UnrolledLinkedList or the record size of a MappedLinkedList.
+
+        Returns:
+            None
+        """
+        unrolled = UnrolledLinkedList(*range(10), capacity=4)
+        mapped = MappedLinkedList(*range(10), record_size=128)
+        for duplicate in (unrolled.copy(), copy.copy(unrolled)):
+            self.assertEqual(4, duplicate.capacity)
+            self.assertEqual(list(range(10)), list(duplicate.values()))
+        for duplicate in (mapped.copy(), copy.copy(mapped)):
+            self.assertEqual(128, duplicate.record_size)
+            self.assertEqual(list(range(10)), list(duplicate.values()))
+            duplicate.insert_at_head(-1)
+            self.assertEqual(list(range(10)), list(mapped.values()))
+
+    def test_copy_on_write(self) -> None:
+        """
+        Test that a copy shares the nodes of the original while only its data are read, and that
+        the original keeps its nodes when it is modified first.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        for lst_type in self.cow_types:
+            for reorder in ("sort", "reverse"):
+                original = lst_type(3, 1, 2)
+                first_node = original.head
+                duplicate = original.copy()
+                second = duplicate.copy()
+                self.assertEqual(original, duplicate)
+                self.assertEqual(hash(original), hash(second))
+                self.assertIn(1, duplicate)
+                self.assertEqual("[3, 1, 2]", str(second))
+                self.assertIs(first_node, duplicate._head)
+                self.assertIs(first_node, second._head)
+
+                getattr(original, reorder)()
+                self.assertIn(first_node, list(original))
+                self.assertEqual([3, 1, 2], list(duplicate.values()))
+                self.assertEqual([3, 1, 2], list(second.values()))
+                self.assertIsNot(first_node, duplicate._head)
+                # both copies were moved to the same new chain
+                self.assertIs(duplicate._head, second._head)
+
+                duplicate.insert_at_tail(4)
+                self.assertEqual([3, 1, 2], list(second.values()))
+                self.assertEqual([3, 1, 2, 4], list(duplicate.values()))
+                self.assertEqual(4, duplicate.tail.data)
+
+    def test_copies_hand_out_their_own_nodes(self) -> None:
+        """
+        Test that writing the data of a node handed out by a copy (or by the original, after it
+        was copied) leaves the other unchanged, however the node was obtained.
+
+        Returns:
+            None
+        """
+        handouts = (
+            lambda linked_list: linked_list[1],
+            lambda linked_list: linked_list[0:2][1],
+            lambda linked_list: linked_list.head,
+            lambda linked_list: linked_list.tail,
+            lambda linked_list: next(iter(linked_list)),
+            lambda linked_list: linked_list.view(1)[0],
+            lambda linked_list: list(linked_list.view())[2],
+        )
+        for lst_type in self.cow_types:
+            for handout in handouts:
+                for from_copy in (True, False):
+                    original = lst_type(1, 2, 3)
+                    duplicate = original.copy()
+                    handout(duplicate if from_copy else original).data = 99
+                    unchanged = original if from_copy else duplicate
+                    self.assertEqual([1, 2, 3], list(unchanged.values()), lst_type)
+                    changed = duplicate if from_copy else original
+                    self.assertIn(99, list(changed.values()))
+
+                original = lst_type(1, 2, 3)
+                duplicate = original.copy()
+                cursor = duplicate.cursor(1)
+                cursor.data = 99
+                self.assertEqual([1, 99, 3], list(duplicate.values()))
+                self.assertEqual([1, 2, 3], list(original.values()))
+
+    def test_replaced_nodes_invalidate(self) -> None:
+        """
+        Test that replacing the nodes a copy shares with the original counts as a structural
+        modification of the copy, so a view still holding the old nodes is invalidated.
+
+        Returns:
+            None
+        """
+        for lst_type in self.cow_types:
+            original = lst_type(1, 2, 3)
+            duplicate = original.copy()
+            view = LinkedListView(duplicate, range(3))  # made without copying the nodes
+            original.insert_at_head(0)  # the copy gets new nodes
+            with self.assertRaises(RuntimeError):
+                list(view)
+            self.assertEqual([1, 2, 3], list(duplicate.view().values()))
+
+    def test_handles_and_cursors(self) -> None:
+        """
+        Test that the node handles and cursors of the original stay valid after it is copied, and
+        that the nodes of the original cannot be used as handles of a copy sharing them.
+
+        Returns:
+            None
+        """
+        original = DoubleLinkedList(1, 2)
+        handle = original.insert_at_tail(3)
+        cursor = original.cursor(1)
+        duplicate = original.copy()
+        cursor.insert(10)
+        cursor.data = 20
+        original.move_to_front(handle)
+        self.assertEqual([3, 1, 10, 20], list(original.values()))
+        self.assertEqual([1, 2, 3], list(duplicate.values()))
+        self.assertEqual([3, 2, 1], [node.data for node in reversed(duplicate)])
+
+        # the original was modified, so the copy has its own nodes
+        duplicate.remove_node(duplicate.head)
+        self.assertEqual([2, 3], list(duplicate.values()))
+
+        handle = original.head
+        second = original.copy()
+        with self.assertRaises(ValueError):
+            second.remove_node(handle)
+        second.remove_at_head()
+        second.move_to_back(second.head)
+        self.assertEqual([10, 20, 1], list(second.values()))
+        self.assertEqual([3, 1, 10, 20], list(original.values()))
+
+    def test_discarded_sharers(self) -> None:
+        """
+        Test that nothing is copied when the linked lists a chain was shared with are gone.
+
+        Returns:
+            None
+        """
+        for lst_type in self.cow_types:
+            original = lst_type(1, 2, 3)
+            first_node = original.head
+            original.copy()  # discarded at once
+            gc.collect()
+            original.insert_at_tail(4)
+            self.assertIs(first_node, original.head)
+
+            duplicate = original.copy()
+            view = duplicate.view(1)  # the copy gets its own nodes
+            original.insert_at_head(0)
+            self.assertEqual([2, 3, 4], list(view.values()))
+
+            first_node = duplicate.head
+            second = duplicate.copy()
+            del duplicate, view
+            gc.collect()
+            second.remove_at_tail()  # the copy takes over the nodes of the original
+            self.assertIs(first_node, second.head)
+            self.assertEqual([1, 2, 3], list(second.values()))
+
+    def test_indexed_copy(self) -> None:
+        """
+        Test that the index of an IndexedLinkedList copy describes its own nodes.
+
+        Returns:
+            None
+        """
+        original = IndexedLinkedList("a", "b", "c")
+        duplicate = original.copy()
+        self.assertIn("b", duplicate)
+        original.remove("b")
+        original[0] = "z"
+        self.assertEqual(1, duplicate.count("b"))
+        self.assertEqual(0, duplicate.index("a"))
+        duplicate.remove("c")
+        self.assertEqual(["a", "b"], list(duplicate.values()))
+        self.assertEqual(["z", "c"], list(original.values()))
+        self.assertNotIn("c", duplicate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+A module to test the cursors over the SingleLinkedList and DoubleLinkedList classes.
+"""
+
+import unittest
+from typing import Tuple
+
+from linked_list import SingleLinkedList, DoubleLinkedList, LinkedList
+
+
+class TestCursor(unittest.TestCase):
+    """
+    A TestCase class to help ensure the cursors are functional and detect invalidation.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lst_types: Tuple[LinkedList] = (SingleLinkedList, DoubleLinkedList)
+
+    def check_links(self, linked_list: SingleLinkedList, expected: list) -> None:
+        """
+        Check that the linked list holds the expected data, and that its size, tail and (for
+        doubly linked lists) prev links agree.
+
+        Args:
+            linked_list: The linked list to check.
+            expected: The data the linked list should hold, in order.
+
+        Returns:
+            None
+        """
+        self.assertEqual(str(expected), str(linked_list))
+        self.assertEqual(len(expected), len(linked_list))
+        if expected:
+            self.assertEqual(expected[-1], linked_list.tail)
+        else:
+            self.assertIsNone(linked_list.tail)
+        if isinstance(linked_list, DoubleLinkedList):
+            node, backwards = linked_list.tail, []
+            while node is not None:
+                backwards.append(node.data)
+                node = node.prev
+            self.assertEqual(expected[::-1], backwards)
+
+    def test_traverse_and_update(self) -> None:
+        """
+        Test moving a cursor forward through a linked list while reading and updating the data.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(5, 6, 7)
+            cursor = linked_list.cursor()
+            while not cursor.at_end:
+                cursor.data = cursor.data * 10
+                cursor.move_next()
+            self.assertEqual(cursor.index, 3)
+            with self.assertRaises(IndexError):
+                cursor.move_next()
+            with self.assertRaises(IndexError):
+                cursor.data
+            self.check_links(linked_list, [50, 60, 70])
+            self.assertEqual(linked_list.cursor(1).node, 60)
+            with self.assertRaises(IndexError):
+                linked_list.cursor(4)
+
+    def test_insert_and_remove(self) -> None:
+        """
+        Test inserting and removing nodes at the head, middle and tail through a cursor.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(5, 6, 7)
+            cursor = linked_list.cursor()
+            cursor.insert(4)  # insert before the head
+            self.assertEqual((cursor.index, cursor.data), (1, 5))
+            cursor.move_next()
+            self.assertEqual(cursor.remove(), 6)  # remove from the middle
+            self.assertEqual((cursor.index, cursor.data), (2, 7))
+            self.assertEqual(cursor.remove(), 7)  # remove the tail
+            self.assertTrue(cursor.at_end)
+            self.check_links(linked_list, [4, 5])
+            cursor.insert(8)  # insert at the end
+            cursor.insert(9)
+            self.check_links(linked_list, [4, 5, 8, 9])
+
+            cursor = linked_list.cursor()
+            for _ in range(4):
+                cursor.remove()
+            self.check_links(linked_list, [])
+            cursor.insert(1)
+            self.check_links(linked_list, [1])
+
+    def test_move_prev(self) -> None:
+        """
+        Test moving a cursor backward through a doubly linked list.
+
+        Returns:
+            None
+        """
+        linked_list = DoubleLinkedList(5, 6, 7)
+        cursor = linked_list.cursor(3)
+        values = []
+        while cursor.index > 0:
+            cursor.move_prev()
+            values.append(cursor.data)
+        self.assertEqual([7, 6, 5], values)
+        with self.assertRaises(IndexError):
+            cursor.move_prev()
+        cursor.move_next()
+        cursor.insert(10)
+        cursor.move_prev()
+        self.assertEqual(cursor.remove(), 10)
+        self.check_links(linked_list, [5, 6, 7])
+
+    def test_invalidation(self) -> None:
+        """
+        Test that a cursor detects structural modifications made other than through itself, but
+        not modifications of the data alone.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(5, 6, 7)
+            cursor, other = linked_list.cursor(1), linked_list.cursor(2)
+            linked_list[0] = 4  # not a structural modification
+            cursor.remove()
+            self.assertEqual(cursor.data, 7)
+            with self.assertRaises(RuntimeError):
+                other.move_next()
+            linked_list.insert_at_tail(8)
+            with self.assertRaises(RuntimeError):
+                cursor.data
+            with self.assertRaises(RuntimeError):
+                cursor.insert(9)
+            self.check_links(linked_list, [4, 7, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+A module to test the behavior that is specific to the IndexedLinkedList class.
+"""
+
+import unittest
+
+from node import DoubleLinkNode
+from linked_list import IndexedLinkedList
+
+
+class TestIndexedLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure the value index of the IndexedLinkedList class stays
+    consistent with its nodes.
+    """
+
+    def check_index(self, linked_list: IndexedLinkedList, expected: list) -> None:
+        """
+        Check that the linked list holds the expected data, and that the index maps each value to
+        exactly the nodes storing it.
+
+        Args:
+            linked_list: The linked list to check.
+            expected: The data the linked list should hold, in order.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        self.assertEqual(expected, list(linked_list.values()))
+        for value in set(expected):
+            self.assertEqual(linked_list.count(value), expected.count(value))
+            self.assertEqual(linked_list.index(value), expected.index(value))
+        nodes = {id(node) for node in linked_list}
+        indexed = {
+            node_id
+            for by_id in linked_list._nodes_by_value.values()
+            for node_id in by_id
+        }
+        self.assertEqual(nodes, indexed)
+
+    def test_mutations_keep_the_index_consistent(self) -> None:
+        """
+        Test that every mutator of the linked list updates the index.
+
+        Returns:
+            None
+        """
+        linked_list, expected = IndexedLinkedList(1, 2, 3), [1, 2, 3]
+        linked_list.insert_at_head(2)
+        linked_list.insert_at_index(4, 2)
+        linked_list.extend([3, 5])
+        expected = [2, 1, 4, 2, 3, 3, 5]
+        self.check_index(linked_list, expected)
+        linked_list[0] = 6
+        linked_list[1:3] = [7, 7]
+        expected[0], expected[1:3] = 6, [7, 7]
+        self.check_index(linked_list, expected)
+        linked_list.remove_at_head()
+        linked_list.remove_at_tail()
+        linked_list.remove_at_index(2)
+        del linked_list[::2]
+        self.check_index(linked_list, [7, 3])
+        linked_list.remove(3)
+        self.check_index(linked_list, [7])
+
+    def test_node_handles(self) -> None:
+        """
+        Test that the node handles returned by insertions can be removed and moved.
+
+        Returns:
+            None
+        """
+        linked_list = IndexedLinkedList()
+        node_5 = linked_list.insert_at_tail(5)
+        node_6 = linked_list.insert_at_index(6, 1)
+        self.assertIsInstance(node_6, DoubleLinkNode)
+        linked_list.move_to_front(node_6)
+        self.check_index(linked_list, [6, 5])
+        linked_list.remove_node(node_5)
+        self.check_index(linked_list, [6])
+
+    def test_index_is_rebuilt_after_untracked_changes(self) -> None:
+        """
+        Test that the index is rebuilt after the linked list is modified in a way the index cannot
+        follow (through a cursor, or by assigning the head).
+
+        Returns:
+            None
+        """
+        linked_list = IndexedLinkedList(1, 2, 3)
+        cursor = linked_list.cursor(1)
+        cursor.insert(4)
+        cursor.remove()
+        self.check_index(linked_list, [1, 4, 3])
+        linked_list.remove(4)
+        self.check_index(linked_list, [1, 3])
+
+        chain = DoubleLinkNode(8)
+        chain.next = DoubleLinkNode(9)
+        chain.next.prev = chain
+        linked_list.head = chain
+        self.assertNotIn(1, linked_list)
+        self.check_index(linked_list, [8, 9])
+
+    def test_cursor_writes_update_the_index(self) -> None:
+        """
+        Test that the data written through a cursor is indexed.
+
+        Returns:
+            None
+        """
+        linked_list = IndexedLinkedList(1, 2, 3)
+        cursor = linked_list.cursor(1)
+        cursor.data = 9
+        self.assertIn(9, linked_list)
+        self.assertNotIn(2, linked_list)
+        self.check_index(linked_list, [1, 9, 3])
+        linked_list.remove(9)
+        self.check_index(linked_list, [1, 3])
+        with self.assertRaises(ValueError):
+            linked_list.remove(2)
+        self.check_index(linked_list, [1, 3])
+
+    def test_stale_index_is_rebuilt(self) -> None:
+        """
+        Test that a node found indexed under other data than it stores (its data was assigned
+        directly) does not break a modification, and that the index is rebuilt afterwards.
+
+        Returns:
+            None
+        """
+        linked_list = IndexedLinkedList(1, 2, 3, 4)
+        linked_list[1].data = 9  # not tracked by the index
+        linked_list.remove_at_index(1)
+        self.check_index(linked_list, [1, 3, 4])
+
+        linked_list[0].data = 8
+        del linked_list[0:2]
+        self.check_index(linked_list, [4])
+
+        linked_list.insert_at_head(5)
+        linked_list.head.data = 6
+        linked_list[0] = 7
+        self.check_index(linked_list, [7, 4])
+        self.assertNotIn(5, linked_list)
+        self.assertNotIn(6, linked_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
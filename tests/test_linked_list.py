@@ -6,7 +6,18 @@ import unittest
 from typing import Tuple
 
 from node import Node, SingleLinkNode, DoubleLinkNode
-from linked_list import SingleLinkedList, DoubleLinkedList, LinkedList
+from linked_list import (
+    SingleLinkedList,
+    DoubleLinkedList,
+    ArrayLinkedList,
+    UnrolledLinkedList,
+    SkipLinkedList,
+    IndexedLinkedList,
+    ConcurrentLinkedList,
+    PersistentLinkedList,
+    MappedLinkedList,
+    LinkedList,
+)
 
 
 class TestLinkedList(unittest.TestCase):
@@ -17,7 +28,17 @@ class TestLinkedList(unittest.TestCase):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.node_types: Tuple[Node] = (SingleLinkNode, DoubleLinkNode)
-        self.lst_types: Tuple[LinkedList] = (SingleLinkedList, DoubleLinkedList)
+        self.lst_types: Tuple[LinkedList] = (
+            SingleLinkedList,
+            DoubleLinkedList,
+            ArrayLinkedList,
+            UnrolledLinkedList,
+            SkipLinkedList,
+            IndexedLinkedList,
+            ConcurrentLinkedList,
+            PersistentLinkedList,
+            MappedLinkedList,
+        )
 
     def test_empty_linked_list(self) -> None:
         """
@@ -228,6 +249,261 @@ class TestLinkedList(unittest.TestCase):
             linked_list.remove_at_index(0)
             self.check_assertions_on_empty_linked_list(linked_list)
 
+    def test_size_is_tracked(self) -> None:
+        """
+        Test that the size of the linked list is kept up to date by every insertion and removal,
+        and that len() agrees with the size property.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(5, 6, 7)
+            self.assertEqual(linked_list._size, 3)  # pylint: disable=protected-access
+            linked_list.insert_at_head(4)
+            linked_list.insert_at_tail(8)
+            linked_list.insert_at_index(9, 2)
+            self.assertEqual(len(linked_list), 6)
+            linked_list.remove_at_index(2)
+            linked_list.remove_at_head()
+            linked_list.remove_at_tail()
+            self.assertEqual(len(linked_list), 3)
+            self.assertEqual("[5, 6, 7]", str(linked_list))
+            with self.assertRaises(IndexError):
+                linked_list.remove_at_index(3)
+            self.assertEqual(
+                len(linked_list), 3
+            )  # a failed removal does not change the size
+            linked_list.remove_at_tail()
+            linked_list.remove_at_tail()
+            linked_list.remove_at_tail()
+            linked_list.remove_at_tail()  # removing from an empty list is a no-op
+            self.assertEqual(len(linked_list), 0)
+            self.check_assertions_on_empty_linked_list(linked_list)
+
+    def test_size_after_head_assignment(self) -> None:
+        """
+        Test that assigning the head directly discards the stored size, and that it is recounted
+        from the chain of nodes the next time it is requested.
+
+        Returns:
+            None
+        """
+        for node_type, lst_type in zip(self.node_types, self.lst_types):  # type: ignore
+            linked_list = lst_type(1, 2, 3, 4)
+            linked_list.head = node_type(5)
+            linked_list.head.next = node_type(6)
+            self.assertEqual(len(linked_list), 2)
+            linked_list.insert_at_head(4)
+            self.assertEqual(len(linked_list), 3)
+
+    def test_tail_is_tracked(self) -> None:
+        """
+        Test that the tail of the linked list is kept up to date by every insertion and removal.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type()
+            self.assertIsNone(linked_list.tail)
+            linked_list.insert_at_head(6)
+            self.assertEqual(linked_list.tail, 6)
+            linked_list.insert_at_tail(7)
+            self.assertEqual(linked_list.tail, 7)
+            linked_list.insert_at_index(8, 2)
+            self.assertEqual(linked_list.tail, 8)
+            self.assertIsNone(linked_list.tail.next)
+            linked_list.remove_at_index(2)
+            self.assertEqual(linked_list.tail, 7)
+            linked_list.remove_at_tail()
+            self.assertEqual(linked_list.tail, 6)
+            linked_list.remove_at_head()
+            self.assertIsNone(linked_list.tail)
+            linked_list.insert_at_tail(5)
+            self.assertEqual(linked_list.head, linked_list.tail)
+            self.assertIsNone(linked_list.head.next)
+
+    def test_extend(self) -> None:
+        """
+        Test the extend method and the from_iterable class method. The data should be appended at
+        the tail of the linked list in order.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type.from_iterable(range(5, 8))
+            self.assertIsInstance(linked_list, lst_type)
+            self.assertEqual("[5, 6, 7]", str(linked_list))
+            linked_list.extend(iter([8, 9]))
+            linked_list.extend([])
+            self.assertEqual("[5, 6, 7, 8, 9]", str(linked_list))
+            self.assertEqual(len(linked_list), 5)
+            self.assertEqual(linked_list.tail, 9)
+            linked_list.insert_at_tail(10)
+            self.assertEqual("[5, 6, 7, 8, 9, 10]", str(linked_list))
+
+            empty_list = lst_type.from_iterable([])
+            self.check_assertions_on_empty_linked_list(empty_list)
+            self.assertIsNone(empty_list.tail)
+
+    def test_index_operations_near_either_end(self) -> None:
+        """
+        Test getting, setting, inserting and removing by index at positions in both the front and
+        back halves of the linked list (doubly linked lists walk from the closer end).
+
+        Returns:
+            None
+        """
+        items = list(range(10))
+        for lst_type in self.lst_types:
+            linked_list = lst_type(*items)
+            for idx in range(len(items)):
+                self.assertEqual(linked_list[idx], items[idx])
+            linked_list[8] = 80
+            linked_list.insert_at_index(70, 7)
+            linked_list.insert_at_index(10, 11)
+            linked_list.insert_at_index(20, 2)
+            linked_list.remove_at_index(10)
+            linked_list.remove_at_index(11)
+            linked_list.remove_at_index(1)
+            expected = [0, 20, 2, 3, 4, 5, 6, 70, 7, 9]
+            self.assertEqual(str(expected), str(linked_list))
+            self.assertEqual(linked_list.tail, 9)
+            with self.assertRaises(IndexError):
+                linked_list.insert_at_index(11, 11)
+            with self.assertRaises(IndexError):
+                linked_list.remove_at_index(10)
+            if isinstance(linked_list, DoubleLinkedList):  # the prev links must agree
+                node, backwards = linked_list.tail, []
+                while node is not None:
+                    backwards.append(node.data)
+                    node = node.prev
+                self.assertEqual(expected[::-1], backwards)
+
+    def test_positional_access_after_mutation(self) -> None:
+        """
+        Test that indexing stays correct when accesses are interleaved with structural
+        modifications (the last accessed position must not be reused once it is stale).
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list, expected = lst_type(*range(10)), list(range(10))
+            for idx in range(10):  # sequential access, forwards and backwards
+                self.assertEqual(linked_list[idx], expected[idx])
+                self.assertEqual(linked_list[9 - idx], expected[9 - idx])
+            self.assertEqual(linked_list[6], 6)
+            linked_list.insert_at_head(-1)
+            expected.insert(0, -1)
+            self.assertEqual(linked_list[6], expected[6])
+            self.assertEqual(linked_list[7], expected[7])
+            linked_list.remove_at_index(5)
+            del expected[5]
+            self.assertEqual(linked_list[7], expected[7])
+            self.assertEqual(linked_list[6], expected[6])
+            linked_list.remove_at_tail()
+            expected.pop()
+            with self.assertRaises(IndexError):
+                linked_list[9]
+            self.assertEqual(str(expected), str(linked_list[:]))
+
+    def test_double_linked_list_node_handles(self) -> None:
+        """
+        Test removing and moving the nodes returned by the insert_at_head and insert_at_tail
+        methods of the DoubleLinkedList class.
+
+        Returns:
+            None
+        """
+        linked_list = DoubleLinkedList()
+        node_6 = linked_list.insert_at_tail(6)
+        node_5 = linked_list.insert_at_head(5)
+        node_7 = linked_list.insert_at_tail(7)
+        self.assertIsInstance(node_6, DoubleLinkNode)
+        linked_list.move_to_front(node_7)
+        self.assertEqual("[7, 5, 6]", str(linked_list))
+        linked_list.move_to_back(node_5)
+        self.assertEqual("[7, 6, 5]", str(linked_list))
+        linked_list.move_to_back(node_5)  # already at the back
+        linked_list.move_to_front(node_5)
+        self.assertEqual("[5, 7, 6]", str(linked_list))
+        self.assertEqual((linked_list.head, linked_list.tail), (5, 6))
+        self.assertIsNone(linked_list.head.prev)
+        linked_list.remove_node(node_7)
+        self.assertEqual("[5, 6]", str(linked_list))
+        with self.assertRaises(ValueError):
+            linked_list.remove_node(node_7)  # no longer in the linked list
+        linked_list.remove_node(node_6)
+        self.assertEqual(linked_list.tail, 5)
+        self.assertIsNone(linked_list.tail.next)
+        linked_list.remove_node(node_5)
+        self.check_assertions_on_empty_linked_list(linked_list)
+        self.assertIsNone(linked_list.tail)
+
+    def test_removed_node_handles(self) -> None:
+        """
+        Test that a node removed by any means (by index, at either end, by slice, or through a
+        cursor) is rejected by remove_node, move_to_front and move_to_back, and that the linked
+        list is left unchanged.
+
+        Returns:
+            None
+        """
+        removals = (
+            lambda linked_list: linked_list.remove_at_head(),
+            lambda linked_list: linked_list.remove_at_tail(),
+            lambda linked_list: linked_list.remove_at_index(2),
+            lambda linked_list: linked_list.__delitem__(slice(1, 4)),
+            lambda linked_list: linked_list.__delitem__(slice(0, 5, 2)),
+            lambda linked_list: linked_list.cursor(2).remove(),
+        )
+        for lst_type in (DoubleLinkedList, IndexedLinkedList):
+            for remove in removals:
+                linked_list = lst_type(*range(5))
+                nodes = list(linked_list)
+                remove(linked_list)
+                linked_list.insert_at_tail(
+                    9
+                )  # relink the nodes around the removed ones
+                linked_list.insert_at_head(-1)
+                expected = list(linked_list.values())
+                for node in nodes:
+                    if any(node is kept for kept in linked_list):  # not removed
+                        continue
+                    for method in ("remove_node", "move_to_front", "move_to_back"):
+                        with self.assertRaises(ValueError):
+                            getattr(linked_list, method)(node)
+                    self.assertEqual(expected, list(linked_list.values()))
+                    self.assertEqual(len(expected), len(linked_list))
+                    self.assertEqual(expected[-1], linked_list.tail.data)
+
+    def test_search_by_value(self) -> None:
+        """
+        Test the __contains__, index, count and remove methods of the linked list classes.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(5, 6, 7, 6)
+            self.assertIn(6, linked_list)
+            self.assertNotIn(8, linked_list)
+            self.assertEqual((linked_list.index(6), linked_list.count(6)), (1, 2))
+            self.assertEqual(linked_list.count(8), 0)
+            with self.assertRaises(ValueError):
+                linked_list.index(8)
+            linked_list.remove(6)
+            self.assertEqual("[5, 7, 6]", str(linked_list))
+            self.assertEqual(linked_list.index(6), 2)
+            linked_list.remove(6)
+            self.assertNotIn(6, linked_list)
+            with self.assertRaises(ValueError):
+                linked_list.remove(6)
+            self.assertEqual("[5, 7]", str(linked_list))
+
     def test_iter(self) -> None:
         """
         Test the __iter__ method of the SingleLinkedList class.
@@ -2,11 +2,20 @@
 A module to test the SingleLinkedList class.
 """
 
+import random
 import unittest
 from typing import Tuple
 
 from node import Node, SingleLinkNode, DoubleLinkNode
-from linked_list import SingleLinkedList, DoubleLinkedList, LinkedList
+from linked_list import (
+    SingleLinkedList,
+    DoubleLinkedList,
+    ArrayLinkedList,
+    UnrolledLinkedList,
+    SkipLinkedList,
+    IndexedLinkedList,
+    LinkedList,
+)
 
 
 class TestLinkedListOptional(unittest.TestCase):
@@ -17,7 +26,13 @@ class TestLinkedListOptional(unittest.TestCase):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.node_types: Tuple[Node] = (SingleLinkNode, DoubleLinkNode)
-        self.lst_types: Tuple[LinkedList] = (SingleLinkedList, DoubleLinkedList)
+        self.lst_types: Tuple[LinkedList] = (
+            SingleLinkedList,
+            DoubleLinkedList,
+            ArrayLinkedList,
+            UnrolledLinkedList,
+            SkipLinkedList,
+        )
 
     def test_linked_list_equality(self) -> None:
         """
@@ -146,6 +161,190 @@ class TestLinkedListOptional(unittest.TestCase):
             linked_list[1:3] = [6, 7]
             self.assertEqual("[5, 6, 7, 8, 9]", str(linked_list))
 
+    def test_index_slicing_with_steps(self) -> None:
+        """
+        Test getting and setting items with slices that have a step, including negative steps.
+        The result should match slicing a Python list with the same data.
+
+        Returns:
+            None
+        """
+        items = [5, 6, 7, 8, 9, 10, 11]
+        slices = [
+            slice(None, None, 2),
+            slice(1, None, 3),
+            slice(None, None, -1),
+            slice(5, 1, -2),
+            slice(-2, None, -3),
+            slice(-3, -1),
+            slice(2, 2, -1),
+        ]
+        for lst_type in self.lst_types:
+            for key in slices:
+                linked_list = lst_type(*items)
+                self.assertEqual(items[key], linked_list[key])
+                expected = list(items)
+                expected[key] = [-value for value in items[key]]
+                linked_list[key] = [-value for value in items[key]]
+                self.assertEqual(str(expected), str(linked_list))
+
+    def test_del_items_index_slicing(self) -> None:
+        """
+        Test deleting items with slices, including slices with steps and negative steps. The
+        result should match deleting the same slice from a Python list, and the size and tail of
+        the linked list should be updated.
+
+        Returns:
+            None
+        """
+        items = [5, 6, 7, 8, 9, 10, 11]
+        slices = [
+            slice(None),
+            slice(0, 2),
+            slice(3, None),
+            slice(2, 5),
+            slice(None, None, 2),
+            slice(1, None, 2),
+            slice(None, None, -3),
+            slice(6, 0, -2),
+            slice(4, 4),
+        ]
+        for lst_type in self.lst_types:
+            for key in slices:
+                linked_list = lst_type(*items)
+                expected = list(items)
+                del expected[key]
+                del linked_list[key]
+                self.assertEqual(str(expected), str(linked_list))
+                self.assertEqual(len(expected), len(linked_list))
+                if expected:
+                    self.assertEqual(expected[-1], linked_list.tail)
+                else:
+                    self.assertTrue(linked_list.is_empty)
+                linked_list.insert_at_tail(12)
+                self.assertEqual(str(expected + [12]), str(linked_list))
+
+    def test_sort(self) -> None:
+        """
+        Test the sort method of the SingleLinkedList and DoubleLinkedList classes, including
+        stability and the tail and prev links afterwards.
+
+        Returns:
+            None
+        """
+        random.seed(14)
+        for lst_type in (SingleLinkedList, DoubleLinkedList, IndexedLinkedList):
+            for size in (0, 1, 2, 3, 7, 64, 100):
+                items = [(random.randrange(10), idx) for idx in range(size)]
+                for key, reverse in (
+                    (None, False),
+                    (None, True),
+                    (lambda x: x[0], False),
+                    (lambda x: x[0], True),
+                ):
+                    linked_list = lst_type(*items)
+                    head_before = linked_list.head
+                    linked_list.sort(key=key, reverse=reverse)
+                    expected = sorted(items, key=key, reverse=reverse)
+                    self.assertEqual(expected, list(linked_list.values()))
+                    self.assertEqual(size, linked_list.size)
+                    if size:  # the nodes were relinked, not copied
+                        self.assertIn(
+                            id(head_before), {id(node) for node in linked_list}
+                        )
+                        self.assertEqual(expected[-1], linked_list.tail.data)
+                        self.assertIsNone(linked_list.tail.next)
+                    if isinstance(linked_list, DoubleLinkedList):
+                        node, backwards = linked_list.tail, []
+                        while node is not None:
+                            backwards.append(node.data)
+                            node = node.prev
+                        self.assertEqual(expected[::-1], backwards)
+                    linked_list.insert_at_tail((10, size))  # the tail is still usable
+                    self.assertEqual((10, size), linked_list[size])
+
+    def test_splice_concat_and_split_at(self) -> None:
+        """
+        Test moving node chains between DoubleLinkedList objects with splice, concat, += and
+        split_at, including the size, tail and prev links afterwards.
+
+        Returns:
+            None
+        """
+
+        def check(linked_list: DoubleLinkedList, expected: list) -> None:
+            self.assertEqual(expected, list(linked_list.values()))
+            self.assertEqual(len(expected), linked_list.size)
+            node, backwards = linked_list.tail, []
+            while node is not None:
+                backwards.append(node.data)
+                node = node.prev
+            self.assertEqual(expected[::-1], backwards)
+
+        for lst_type in (DoubleLinkedList, IndexedLinkedList):
+            linked_list, other = lst_type(1, 2, 3), lst_type(7, 8)
+            moved = other.head
+            linked_list.splice(other, at=1)
+            check(linked_list, [1, 7, 8, 2, 3])
+            check(other, [])
+            self.assertIs(moved, linked_list[1])  # the nodes were moved, not copied
+            linked_list.splice(lst_type(0), at=0)
+            linked_list.concat(lst_type(4, 5))
+            linked_list += lst_type(6)
+            linked_list += [9]
+            check(linked_list, [0, 1, 7, 8, 2, 3, 4, 5, 6, 9])
+            linked_list.splice(lst_type())
+
+            rest = linked_list.split_at(4)
+            self.assertIsInstance(rest, lst_type)
+            check(linked_list, [0, 1, 7, 8])
+            check(rest, [2, 3, 4, 5, 6, 9])
+            check(rest.split_at(6), [])
+            check(rest.split_at(0), [2, 3, 4, 5, 6, 9])
+            check(rest, [])
+            self.assertIn(8, linked_list)
+            self.assertNotIn(2, linked_list)
+
+            with self.assertRaises(ValueError):
+                linked_list.splice(linked_list)
+            with self.assertRaises(IndexError):
+                linked_list.splice(lst_type(1), at=5)
+            with self.assertRaises(IndexError):
+                linked_list.split_at(5)
+
+    def test_reverse(self) -> None:
+        """
+        Test reversing SingleLinkedList and DoubleLinkedList objects in place, and iterating over
+        a DoubleLinkedList in reverse.
+
+        Returns:
+            None
+        """
+        for lst_type in (SingleLinkedList, DoubleLinkedList, IndexedLinkedList):
+            for size in (0, 1, 2, 5):
+                linked_list = lst_type(*range(size))
+                nodes = list(linked_list)
+                linked_list.reverse()
+                self.assertEqual(list(range(size))[::-1], list(linked_list.values()))
+                self.assertEqual(nodes[::-1], list(linked_list))
+                if size:  # the nodes were relinked, not copied
+                    self.assertIs(nodes[0], linked_list.tail)
+                    self.assertIs(nodes[-1], linked_list.head)
+                linked_list.insert_at_tail(size)
+                self.assertEqual(size + 1, linked_list.size)
+                self.assertEqual(size, linked_list[size])
+                if isinstance(linked_list, DoubleLinkedList):
+                    expected = list(range(size))[::-1] + [size]
+                    self.assertEqual(
+                        expected[::-1], [node.data for node in reversed(linked_list)]
+                    )
+                    self.assertIsNone(linked_list.head.prev)
+
+        linked_list = DoubleLinkedList()
+        linked_list.head = DoubleLinkNode(1)  # the tail must be found before relinking
+        linked_list.reverse()
+        self.assertEqual([1], [node.data for node in reversed(linked_list)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,147 @@
+"""
+A module to test the behavior that is specific to the MappedLinkedList class.
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from linked_list import MappedLinkedList
+
+
+class TestMappedLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure the records of the MappedLinkedList class are managed
+    correctly, and that its file can be reopened.
+    """
+
+    def setUp(self) -> None:
+        # pylint: disable-next=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "linked_list.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_reopen(self) -> None:
+        """
+        Test that a linked list written to a file can be reopened with the same data, and that
+        the arguments given when reopening are inserted after it.
+
+        Returns:
+            None
+        """
+        with MappedLinkedList(*range(1000), path=self.path) as linked_list:
+            linked_list.remove_at_index(10)
+            linked_list[0] = "first"
+            linked_list.flush()
+        data = ["first"] + list(range(1, 10)) + list(range(11, 1000)) + ["last"]
+
+        with MappedLinkedList("last", path=self.path) as linked_list:
+            self.assertEqual(data, list(linked_list.values()))
+            self.assertEqual(len(data), len(linked_list))
+            self.assertEqual("last", linked_list.tail.data)
+            self.assertEqual(999, linked_list.tail.prev.data)
+            linked_list.clear()
+
+        with MappedLinkedList(path=self.path) as linked_list:
+            self.assertTrue(linked_list.is_empty)
+            linked_list.insert_at_head(1)
+            self.assertEqual("[1]", str(linked_list))
+
+    def test_free_records_are_reused(self) -> None:
+        """
+        Test that the records of removed elements (and their overflow records) are reused by later
+        insertions, rather than growing the file, and that the file shrinks once it is empty.
+
+        Returns:
+            None
+        """
+        with MappedLinkedList(*range(200), path=self.path) as linked_list:
+            linked_list.insert_at_index("x" * 1000, 100)
+            length = os.path.getsize(self.path)
+            for _ in range(50):
+                linked_list.remove_at_index(100)
+                linked_list.insert_at_index("y" * 1000, 100)
+            self.assertEqual(length, os.path.getsize(self.path))
+            self.assertEqual(201, len(linked_list))
+
+            linked_list.head = None
+            self.assertLess(os.path.getsize(self.path), length)
+
+    def test_payloads(self) -> None:
+        """
+        Test that payloads of any size and picklable type round-trip, including when they are
+        replaced by payloads of another size.
+
+        Returns:
+            None
+        """
+        payloads = [
+            None,
+            1,
+            "a",
+            b"\x00" * 5000,
+            {"key": [1, 2]},
+            ("t", 1.5),
+            "z" * 200,
+        ]
+        with MappedLinkedList(*payloads, record_size=40) as linked_list:
+            self.assertEqual(payloads, list(linked_list.values()))
+            linked_list[3] = "small"
+            linked_list[1] = list(range(1000))
+            data = list(linked_list.values())
+            self.assertEqual(list(range(1000)), data[1])
+            self.assertEqual("small", data[3])
+            self.assertEqual(payloads[-1], linked_list.tail.data)
+            with self.assertRaises(ValueError):
+                linked_list[0] = linked_list.head
+
+    def test_unpicklable_data(self) -> None:
+        """
+        Test that data that cannot be pickled is rejected without taking a record, so that the
+        file is left unchanged.
+
+        Returns:
+            None
+        """
+        with MappedLinkedList(1, 2, path=self.path) as linked_list:
+            linked_list.remove_at_head()  # leave a record on the free list
+            for _ in range(100):
+                with self.assertRaises((pickle.PicklingError, AttributeError)):
+                    linked_list.insert_at_tail(lambda: None)
+                with self.assertRaises((pickle.PicklingError, AttributeError)):
+                    linked_list[0] = lambda: None
+            self.assertEqual([2], list(linked_list.values()))
+            header = bytes(linked_list._map[:64])  # pylint: disable=protected-access
+            linked_list.insert_at_head(1)
+            linked_list.remove_at_head()
+            # the free record was reused, and nothing else was taken
+            self.assertEqual(
+                header, bytes(linked_list._map[:64])  # pylint: disable=protected-access
+            )
+
+    def test_invalid_files(self) -> None:
+        """
+        Test that a file that does not hold a linked list, or holds one with records of another
+        size, is rejected.
+
+        Returns:
+            None
+        """
+        with open(self.path, "wb") as file:
+            file.write(b"not a linked list" * 10)
+        with self.assertRaises(ValueError):
+            MappedLinkedList(path=self.path)
+
+        os.remove(self.path)
+        MappedLinkedList(1, path=self.path, record_size=48).close()
+        with self.assertRaises(ValueError):
+            MappedLinkedList(path=self.path, record_size=64)
+        with self.assertRaises(ValueError):
+            MappedLinkedList(record_size=16)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ A script to test the functionality of the Node class.
 
 import unittest
 
-from node import DoubleLinkNode
+from node import Node, SingleLinkNode, DoubleLinkNode
 
 
 class TestNode(unittest.TestCase):
@@ -43,6 +43,20 @@ class TestNode(unittest.TestCase):
         )  # not equal to another node with different data
         self.assertNotEqual(node1, None)  # not equal to None
 
+    def test_node_slots(self) -> None:
+        """
+        Test that nodes are compact, i.e., they do not carry a per-instance __dict__ and so
+        arbitrary attributes cannot be assigned to them.
+
+        Returns:
+            None
+        """
+        for node_type in (Node, SingleLinkNode, DoubleLinkNode):
+            node = node_type(5)
+            self.assertFalse(hasattr(node, "__dict__"))
+            with self.assertRaises(AttributeError):
+                node.extra = 6  # pylint: disable=assigning-non-slot
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+"""
+A module to test the behavior that is specific to the PersistentLinkedList class.
+"""
+
+import copy
+import unittest
+
+from linked_list import PersistentLinkedList
+
+
+class TestPersistentLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure that the versions of a PersistentLinkedList share their
+    unchanged nodes, and are never affected by the modification of one another.
+    """
+
+    def test_prepend_and_rest(self) -> None:
+        """
+        Test that prepend and rest create new versions sharing every node of the original.
+
+        Returns:
+            None
+        """
+        original = PersistentLinkedList(1, 2, 3)
+        longer = original.prepend(0)
+        shorter = original.rest()
+        self.assertEqual([0, 1, 2, 3], list(longer.values()))
+        self.assertEqual([2, 3], list(shorter.values()))
+        self.assertEqual([1, 2, 3], list(original.values()))
+        self.assertIs(longer.head.next, original.head)
+        self.assertIs(shorter.head, original.head.next)
+        self.assertIs(longer.tail, original.tail)
+        self.assertEqual((4, 2), (len(longer), len(shorter)))
+        self.assertIsNone(PersistentLinkedList(1).rest().tail)
+        self.assertEqual(PersistentLinkedList().prepend(5).tail, 5)
+        with self.assertRaises(IndexError):
+            PersistentLinkedList().rest()
+
+    def test_snapshots_are_unaffected(self) -> None:
+        """
+        Test that a snapshot keeps its data while the linked list it was taken from is modified
+        in every way, and that the unchanged nodes are shared rather than copied.
+
+        Returns:
+            None
+        """
+        linked_list = PersistentLinkedList(*range(10))
+        snapshot = linked_list.snapshot()
+        self.assertIs(snapshot.head, linked_list.head)
+        self.assertIsNot(copy.copy(linked_list), linked_list)
+
+        linked_list.insert_at_index("x", 3)
+        # the nodes after the insertion are shared, and the nodes before it are copies
+        self.assertIs(linked_list[4], snapshot[3])
+        self.assertIsNot(linked_list[2], snapshot[2])
+        linked_list.remove_at_index(6)
+        linked_list[0] = "first"
+        linked_list[8:10] = ["y", "z"]
+        del linked_list[1:5:2]
+        linked_list.insert_at_head("head")
+        linked_list.insert_at_tail("tail")
+        linked_list.remove_at_head()
+        linked_list.remove_at_tail()
+        linked_list.extend(["a", "b"])
+        self.assertEqual(
+            ["first", 2, 3, 4, 6, 7, "y", "z", "a", "b"], list(linked_list.values())
+        )
+        self.assertEqual(linked_list.tail, "b")
+        self.assertEqual(len(linked_list), 10)
+        self.assertEqual(list(range(10)), list(snapshot.values()))
+        self.assertEqual(snapshot.tail, 9)
+        self.assertEqual(len(snapshot), 10)
+
+    def test_modifications_keep_tail(self) -> None:
+        """
+        Test that the tail is kept up to date when the last node is copied, replaced or removed.
+
+        Returns:
+            None
+        """
+        linked_list = PersistentLinkedList(1, 2, 3)
+        linked_list[2] = 30
+        self.assertEqual(linked_list.tail, 30)
+        linked_list.insert_at_index(40, 3)
+        self.assertEqual(linked_list.tail, 40)
+        del linked_list[2:]
+        self.assertEqual(linked_list.tail, 2)
+        linked_list.remove_at_index(1)
+        linked_list.remove_at_tail()
+        self.assertIsNone(linked_list.tail)
+        self.assertTrue(linked_list.is_empty)
+        with self.assertRaises(IndexError):
+            linked_list.remove_at_index(0)
+        with self.assertRaises(ValueError):
+            linked_list[0:0] = [1]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+A module to test pickling linked lists, which must not recurse through their chains of nodes.
+"""
+
+import copy
+import pickle
+import unittest
+
+from linked_list import (
+    SingleLinkedList,
+    DoubleLinkedList,
+    ArrayLinkedList,
+    UnrolledLinkedList,
+    SkipLinkedList,
+    IndexedLinkedList,
+    SortedLinkedList,
+    ConcurrentLinkedList,
+    PersistentLinkedList,
+    MappedLinkedList,
+)
+
+
+class TestPickle(unittest.TestCase):
+    """
+    A TestCase class to help ensure an unpickled linked list holds the same data as the original,
+    however long it is, and that the pickled form is about as compact as a list of the data.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lst_types = (
+            SingleLinkedList,
+            DoubleLinkedList,
+            ArrayLinkedList,
+            UnrolledLinkedList,
+            SkipLinkedList,
+            IndexedLinkedList,
+            SortedLinkedList,
+            ConcurrentLinkedList,
+            PersistentLinkedList,
+            MappedLinkedList,
+        )
+
+    def test_round_trip(self) -> None:
+        """
+        Test that a long linked list of every type survives pickling (with every protocol) and
+        deep copying, and that the result is a working linked list of the same type.
+
+        Returns:
+            None
+        """
+        data = list(range(20000))  # far beyond the recursion limit
+        for lst_type in self.lst_types:
+            linked_list = lst_type(*data)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                restored = pickle.loads(pickle.dumps(linked_list, protocol))
+                self.assertIsInstance(restored, lst_type)
+                self.assertEqual(data, list(restored.values()), lst_type)
+                self.assertEqual(len(data), len(restored))
+            self.assertEqual(restored.tail.data, data[-1])
+            restored.remove_at_head()
+            self.assertEqual(data[1], restored.head.data)
+            self.assertEqual(len(data), len(linked_list))
+
+            duplicate = copy.deepcopy(linked_list)
+            self.assertEqual(data, list(duplicate.values()))
+            self.assertIsNot(duplicate.head, linked_list.head)
+            self.assertEqual([], list(pickle.loads(pickle.dumps(lst_type())).values()))
+
+    def test_state(self) -> None:
+        """
+        Test that the pickled form holds the data as one flat sequence, that the capacity of an
+        UnrolledLinkedList is kept, and that the data itself is deep copied.
+
+        Returns:
+            None
+        """
+        data = [str(value) for value in range(5000)]
+        flat = len(pickle.dumps(data))
+        for lst_type in (SingleLinkedList, DoubleLinkedList, UnrolledLinkedList):
+            self.assertLess(len(pickle.dumps(lst_type(*data))), flat + 200, lst_type)
+
+        restored = pickle.loads(pickle.dumps(UnrolledLinkedList(*data, capacity=8)))
+        self.assertEqual(8, restored.capacity)
+        restored.insert_at_index("x", 100)
+        self.assertEqual("x", restored[100].data)
+
+        nested = DoubleLinkedList([1], [2])
+        duplicate = copy.deepcopy(nested)
+        duplicate.head.data.append(3)
+        self.assertEqual([1], nested.head.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
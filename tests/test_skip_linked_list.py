@@ -0,0 +1,99 @@
+"""
+A module to test the behavior that is specific to the SkipLinkedList class.
+"""
+
+import random
+import unittest
+
+from node import SkipLinkNode
+from linked_list import SkipLinkedList
+
+
+class TestSkipLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure the index layer of the SkipLinkedList class stays consistent.
+    """
+
+    def check_index(self, linked_list: SkipLinkedList, expected: list) -> None:
+        """
+        Check that the linked list holds the expected data, and that at every level, each link
+        points to the node the given number of positions ahead.
+
+        Args:
+            linked_list: The linked list to check.
+            expected: The data the linked list should hold, in order.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        self.assertEqual(expected, list(linked_list.values()))
+        self.assertEqual(len(expected), len(linked_list))
+        nodes = [linked_list._header] + list(linked_list)
+        positions = {id(node): position - 1 for position, node in enumerate(nodes)}
+        for position, node in enumerate(nodes, start=-1):
+            for level in range(min(len(node.links), linked_list._height)):
+                target = node.links[level]
+                target_position = (
+                    len(expected) if target is None else positions[id(target)]
+                )
+                self.assertEqual(target_position - position, node.widths[level])
+        if expected:
+            self.assertIs(nodes[-1], linked_list.tail)
+        else:
+            self.assertIsNone(linked_list.tail)
+
+    def test_index_stays_consistent(self) -> None:
+        """
+        Test that a random sequence of insertions and removals gives the same result as the same
+        sequence on a Python list, and keeps every link width correct.
+
+        Returns:
+            None
+        """
+        random.seed(0)
+        linked_list, expected = SkipLinkedList.from_iterable(range(50)), list(range(50))
+        self.check_index(linked_list, expected)
+        for step in range(400):
+            operation = random.random()
+            if operation < 0.45 or not expected:
+                index = random.randint(0, len(expected))
+                linked_list.insert_at_index(step, index)
+                expected.insert(index, step)
+            elif operation < 0.8:
+                index = random.randrange(len(expected))
+                del linked_list[index]
+                del expected[index]
+            elif operation < 0.9:
+                linked_list.remove_at_tail()
+                expected.pop()
+            else:
+                linked_list.extend([step, -step])
+                expected.extend([step, -step])
+            self.check_index(linked_list, expected)
+
+        for index, value in enumerate(expected):
+            self.assertEqual(linked_list[index], value)
+            self.assertIsInstance(linked_list[index], SkipLinkNode)
+            linked_list[index] = -value
+        self.check_index(linked_list, [-value for value in expected])
+
+    def test_head_assignment_rebuilds_index(self) -> None:
+        """
+        Test that assigning the head copies the data of the given chain of nodes and rebuilds the
+        index layer over it.
+
+        Returns:
+            None
+        """
+        linked_list = SkipLinkedList(1, 2, 3)
+        head = SkipLinkNode(5)
+        head.next = SkipLinkNode(6)
+        linked_list.head = head
+        self.check_index(linked_list, [5, 6])
+        linked_list.head = None
+        self.check_index(linked_list, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
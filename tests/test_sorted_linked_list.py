@@ -0,0 +1,139 @@
+"""
+A module to test the behavior that is specific to the SortedLinkedList class.
+"""
+
+import bisect
+import random
+import unittest
+
+from node import SingleLinkNode
+from linked_list import SortedLinkedList
+
+
+class TestSortedLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure the SortedLinkedList class keeps its elements in order.
+    """
+
+    def test_add_matches_sorted_list(self) -> None:
+        """
+        Test that adding and removing random values gives the same result as the same sequence on
+        a sorted Python list, including the bisect, count and index results.
+
+        Returns:
+            None
+        """
+        random.seed(15)
+        linked_list, expected = SortedLinkedList(5, 3, 9, 3), [3, 3, 5, 9]
+        for step in range(300):
+            value = random.randrange(40)
+            if random.random() < 0.7 or not expected:
+                linked_list.add(value)
+                bisect.insort_right(expected, value)
+            elif value in expected:
+                linked_list.remove(value)
+                expected.remove(value)
+            else:
+                self.assertNotIn(value, linked_list)
+                with self.assertRaises(ValueError):
+                    linked_list.remove(value)
+            if step % 25 == 0:
+                linked_list.extend(random.sample(range(40), 5))
+                expected = sorted(list(linked_list.values()))
+            self.assertEqual(expected, list(linked_list.values()))
+
+        self.assertEqual(len(expected), len(linked_list))
+        for value in range(-1, 41):
+            self.assertEqual(
+                linked_list.bisect_left(value), bisect.bisect_left(expected, value)
+            )
+            self.assertEqual(
+                linked_list.bisect_right(value), bisect.bisect_right(expected, value)
+            )
+            self.assertEqual(linked_list.count(value), expected.count(value))
+            self.assertEqual(value in linked_list, value in expected)
+            if value in expected:
+                self.assertEqual(linked_list.index(value), expected.index(value))
+
+    def test_equal_elements_keep_their_order(self) -> None:
+        """
+        Test that equal elements stay in the order they were added in.
+
+        Returns:
+            None
+        """
+        first, second, third = 1.0, 1, True  # equal, but distinguishable by type
+        linked_list = SortedLinkedList(0)
+        for value in (first, second, third):
+            linked_list.add(value)
+        self.assertEqual(
+            [int, float, int, bool], [type(data) for data in linked_list.values()]
+        )
+
+    def test_irange(self) -> None:
+        """
+        Test iterating over the elements between two bounds.
+
+        Returns:
+            None
+        """
+        linked_list = SortedLinkedList(*range(0, 20, 2))
+        self.assertEqual([4, 6, 8], list(linked_list.irange(4, 8)))
+        self.assertEqual([4, 6, 8], list(linked_list.irange(3, 9)))
+        self.assertEqual([6], list(linked_list.irange(4, 8, inclusive=(False, False))))
+        self.assertEqual([0, 2], list(linked_list.irange(hi=3)))
+        self.assertEqual([16, 18], list(linked_list.irange(lo=15)))
+        self.assertEqual([], list(linked_list.irange(30)))
+        self.assertEqual(list(range(0, 20, 2)), list(linked_list.irange()))
+
+    def test_pop_min_and_max(self) -> None:
+        """
+        Test removing the smallest and largest elements.
+
+        Returns:
+            None
+        """
+        linked_list = SortedLinkedList(4, 1, 3, 2)
+        self.assertEqual((1, 4), (linked_list.pop_min(), linked_list.pop_max()))
+        self.assertEqual((2, 3), (linked_list.pop_min(), linked_list.pop_max()))
+        self.assertTrue(linked_list.is_empty)
+        with self.assertRaises(IndexError):
+            linked_list.pop_min()
+        with self.assertRaises(IndexError):
+            linked_list.pop_max()
+
+    def test_positional_changes_must_keep_order(self) -> None:
+        """
+        Test that the positional insertion methods and item assignment are only allowed where
+        they keep the linked list sorted.
+
+        Returns:
+            None
+        """
+        linked_list = SortedLinkedList(2, 4, 6)
+        linked_list.insert_at_head(1)
+        linked_list.insert_at_tail(7)
+        linked_list.insert_at_index(5, 3)
+        linked_list[0] = 0
+        linked_list[1:3] = [3, 4]
+        self.assertEqual([0, 3, 4, 5, 6, 7], list(linked_list.values()))
+        with self.assertRaises(ValueError):
+            linked_list.insert_at_head(8)
+        with self.assertRaises(ValueError):
+            linked_list.insert_at_tail(-1)
+        with self.assertRaises(ValueError):
+            linked_list.insert_at_index(9, 2)
+        with self.assertRaises(ValueError):
+            linked_list[0] = 4
+        with self.assertRaises(ValueError):
+            linked_list[1:3] = [4, 3]
+        self.assertEqual([0, 3, 4, 5, 6, 7], list(linked_list.values()))
+
+        head = SingleLinkNode(9)
+        head.next = SingleLinkNode(8)
+        linked_list.head = head  # the data of the chain is added in order
+        self.assertEqual([8, 9], list(linked_list.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+A module to test the behavior that is specific to the UnrolledLinkedList class.
+"""
+
+import random
+import unittest
+
+from linked_list import UnrolledLinkedList
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    """
+    A TestCase class to help ensure the blocks of the UnrolledLinkedList class are split and merged
+    correctly.
+    """
+
+    def check_blocks(self, linked_list: UnrolledLinkedList, expected: list) -> None:
+        """
+        Check that the linked list holds the expected data, and that its blocks are well-formed.
+
+        Args:
+            linked_list: The linked list to check.
+            expected: The data the linked list should hold, in order.
+
+        Returns:
+            None
+        """
+        # pylint: disable=protected-access
+        self.assertEqual(expected, list(linked_list.values()))
+        self.assertEqual(len(expected), len(linked_list))
+        blocks = list(linked_list._blocks())
+        for block in blocks:
+            self.assertTrue(0 < len(block.data) <= linked_list.capacity)
+        if blocks:
+            self.assertIs(blocks[-1], linked_list._last_block)
+            self.assertIsNone(blocks[0].prev)
+
+    def test_blocks_split_and_merge(self) -> None:
+        """
+        Test that a random sequence of insertions and removals on a linked list with small blocks
+        gives the same result as the same sequence on a Python list.
+
+        Returns:
+            None
+        """
+        rng = random.Random(0)
+        linked_list, expected = UnrolledLinkedList(capacity=4), []
+        for step in range(500):
+            operation = rng.random()
+            if operation < 0.5 or not expected:
+                index = rng.randint(0, len(expected))
+                linked_list.insert_at_index(step, index)
+                expected.insert(index, step)
+            elif operation < 0.8:
+                index = rng.randrange(len(expected))
+                linked_list.remove_at_index(index)
+                del expected[index]
+            elif operation < 0.9:
+                linked_list.remove_at_tail()
+                expected.pop()
+            else:
+                linked_list.remove_at_head()
+                expected.pop(0)
+            self.check_blocks(linked_list, expected)
+
+        for index, value in enumerate(expected):
+            self.assertEqual(linked_list[index], value)
+            linked_list[index] = -value
+        self.check_blocks(linked_list, [-value for value in expected])
+
+    def test_extend_fills_blocks(self) -> None:
+        """
+        Test that extend fills the last block before linking new, full blocks.
+
+        Returns:
+            None
+        """
+        linked_list = UnrolledLinkedList(1, 2, capacity=3)
+        linked_list.extend(range(3, 10))
+        self.check_blocks(linked_list, list(range(1, 10)))
+        # pylint: disable=protected-access
+        self.assertEqual(3, len(list(linked_list._blocks())))
+        self.assertEqual(linked_list.tail.prev, 8)
+        self.assertEqual(linked_list[3].prev, 3)
+        self.assertEqual(linked_list[2].next, 4)
+
+    def test_invalid_capacity(self) -> None:
+        """
+        Test that a block must be able to hold at least two elements.
+
+        Returns:
+            None
+        """
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(capacity=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
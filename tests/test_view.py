@@ -0,0 +1,124 @@
+"""
+A module to test the LinkedListView class.
+"""
+
+import unittest
+
+from linked_list import (
+    SingleLinkedList,
+    DoubleLinkedList,
+    ArrayLinkedList,
+    UnrolledLinkedList,
+    SkipLinkedList,
+    IndexedLinkedList,
+    ConcurrentLinkedList,
+    PersistentLinkedList,
+    MappedLinkedList,
+    LinkedListView,
+)
+
+
+class TestLinkedListView(unittest.TestCase):
+    """
+    A TestCase class to help ensure views over slices of linked lists behave like the slices.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lst_types = (
+            SingleLinkedList,
+            DoubleLinkedList,
+            ArrayLinkedList,
+            UnrolledLinkedList,
+            SkipLinkedList,
+            IndexedLinkedList,
+            ConcurrentLinkedList,
+            PersistentLinkedList,
+            MappedLinkedList,
+        )
+
+    def test_view_matches_slicing(self) -> None:
+        """
+        Test that a view (and a view of a view) selects the same nodes as the equivalent slices.
+
+        Returns:
+            None
+        """
+        items = list(range(12))
+        slices = [
+            (None, None, None),
+            (2, 9, None),
+            (1, None, 3),
+            (None, None, -1),
+            (10, 2, -3),
+            (5, 5, None),
+            (-4, None, None),
+        ]
+        for lst_type in self.lst_types:
+            linked_list = lst_type(*items)
+            for start, stop, step in slices:
+                view = linked_list.view(start, stop, step)
+                self.assertIsInstance(view, LinkedListView)
+                expected = items[start:stop:step]
+                self.assertEqual(len(expected), len(view))
+                self.assertEqual(expected, list(view.values()))
+                self.assertEqual(str(expected), str(view))
+                self.assertEqual(
+                    [node.data for node in linked_list[start:stop:step]],
+                    [node.data for node in view],
+                )
+                for nested in (
+                    slice(None, None, 2),
+                    slice(1, -1),
+                    slice(None, None, -1),
+                ):
+                    self.assertEqual(expected[nested], list(view[nested].values()))
+                if expected:
+                    self.assertEqual(expected[-1], view[len(expected) - 1])
+                with self.assertRaises(IndexError):
+                    view[len(expected)]
+
+    def test_view_writes_through(self) -> None:
+        """
+        Test that assigning to a view assigns to the linked list.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(*range(8))
+            view = linked_list.view(1, None, 2)  # 1, 3, 5, 7
+            view[0] = 10
+            view[1:3] = [30, 50]
+            view[::-1][0] = 70
+            self.assertEqual([0, 10, 2, 30, 4, 50, 6, 70], list(linked_list.values()))
+            with self.assertRaises(ValueError):
+                view[:2] = [1]
+            self.assertEqual(linked_list.count(30), 1)
+
+    def test_view_fails_fast_after_modification(self) -> None:
+        """
+        Test that a view raises a RuntimeError once its linked list is structurally modified,
+        including while it is being iterated over.
+
+        Returns:
+            None
+        """
+        for lst_type in self.lst_types:
+            linked_list = lst_type(*range(5))
+            view = linked_list.view(1, 4)
+            linked_list[2] = 20  # changing data does not invalidate the view
+            self.assertEqual([1, 20, 3], list(view.values()))
+            iterator = iter(view)
+            next(iterator)
+            linked_list.insert_at_tail(5)
+            with self.assertRaises(RuntimeError):
+                next(iterator)
+            with self.assertRaises(RuntimeError):
+                len(view)
+            with self.assertRaises(RuntimeError):
+                view[0] = 1
+
+
+if __name__ == "__main__":
+    unittest.main()